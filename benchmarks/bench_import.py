@@ -0,0 +1,85 @@
+"""
+Benchmark bulk import of historical sessions.
+
+Writes a synthetic CSV of back-to-back sessions across several projects,
+imports it into a scratch database with ImportService and reports the
+time per phase and the overall rows per second.
+
+Run from the repository root:
+    python -m benchmarks.bench_import [--rows N] [--existing N]
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.database.db_manager import db_manager
+from src.services.import_service import import_service
+
+START = 1_500_000_000
+
+
+def write_csv(path: Path, rows: int, offset: int, iso: bool) -> None:
+    """Write `rows` non-overlapping sessions starting `offset` sessions in."""
+    with path.open('w', newline='') as target:
+        writer = csv.writer(target)
+        writer.writerow(['project', 'start', 'stop'])
+        for i in range(offset, offset + rows):
+            start = START + i * 3600
+            stop = start + 1800 + (i % 7) * 240
+            if iso:
+                writer.writerow([
+                    f"Project {i % 25}",
+                    datetime.fromtimestamp(start).isoformat(),
+                    datetime.fromtimestamp(stop).isoformat()
+                ])
+            else:
+                writer.writerow([f"Project {i % 25}", start, stop])
+
+
+def main() -> int:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--existing", type=int, default=0,
+                        help="Sessions already in the database before the import")
+    parser.add_argument("--iso", action="store_true", help="Use ISO 8601 times instead of Unix")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager.initialize(Path(tmp) / "import.db")
+        if args.existing:
+            existing = Path(tmp) / "existing.csv"
+            write_csv(existing, args.existing, 0, args.iso)
+            import_service.import_file(existing)
+
+        source = Path(tmp) / "sessions.csv"
+        write_csv(source, args.rows, args.existing, args.iso)
+
+        phases = {}
+        last = [time.perf_counter(), "Reading"]
+
+        def progress(done: int, total: int, phase: str) -> None:
+            now = time.perf_counter()
+            phases[last[1]] = phases.get(last[1], 0.0) + now - last[0]
+            last[:] = [now, phase]
+
+        start = time.perf_counter()
+        result = import_service.import_file(source, progress=progress)
+        elapsed = time.perf_counter() - start
+        phases[last[1]] = phases.get(last[1], 0.0) + time.perf_counter() - last[0]
+        db_manager.close()
+
+    print(f"imported {result.imported:,} sessions in {elapsed:.2f} s "
+          f"({result.imported / elapsed:,.0f} rows/s, {len(result.errors)} rejected)")
+    for phase, seconds in phases.items():
+        print(f"  {phase:<20} {seconds:6.2f} s")
+    return 0 if not result.errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark model construction and memory per 100k timeTracking rows.
+
+Compares the original approach (plain @dataclass with a per-instance
+__dict__, built from sqlite3.Row by column name) with the slotted models
+built positionally through TrackingEntry.from_row.
+
+Run from the repository root:
+    python -m benchmarks.bench_models [--rows N]
+"""
+
+import argparse
+import gc
+import sqlite3
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from src.models.tracking_entry import TrackingEntry
+
+QUERY = """
+    SELECT entryId, projectName, startTime, stopTime, timeElapsed
+    FROM timeTracking
+    ORDER BY startTime DESC
+"""
+
+
+@dataclass
+class LegacyTrackingEntry:
+    """The pre-slots TrackingEntry layout, kept here for comparison."""
+
+    entry_id: Optional[int]
+    project_name: str
+    start_time: int
+    stop_time: Optional[int]
+    time_elapsed: Optional[int]
+
+
+def build_database(rows: int) -> sqlite3.Connection:
+    """Create an in-memory timeTracking table with synthetic sessions."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        """
+        CREATE TABLE timeTracking (
+            entryId INTEGER PRIMARY KEY AUTOINCREMENT,
+            projectName TEXT NOT NULL,
+            startTime INTEGER NOT NULL,
+            stopTime INTEGER,
+            timeElapsed INTEGER
+        )
+        """
+    )
+    base = 1_700_000_000
+    conn.executemany(
+        "INSERT INTO timeTracking (projectName, startTime, stopTime, timeElapsed) "
+        "VALUES (?, ?, ?, ?)",
+        (
+            (f"Project {i % 25}", base + i * 3600, base + i * 3600 + 1800, 1800)
+            for i in range(rows)
+        )
+    )
+    conn.commit()
+    return conn
+
+
+def load_legacy(conn: sqlite3.Connection) -> List[LegacyTrackingEntry]:
+    """Load rows the way the repositories originally did."""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute(QUERY)
+    return [
+        LegacyTrackingEntry(
+            entry_id=row['entryId'],
+            project_name=row['projectName'],
+            start_time=row['startTime'],
+            stop_time=row['stopTime'],
+            time_elapsed=row['timeElapsed']
+        )
+        for row in cursor.fetchall()
+    ]
+
+
+def load_slotted(conn: sqlite3.Connection) -> List[TrackingEntry]:
+    """Load rows with the positional row factory and slotted model."""
+    cursor = conn.cursor()
+    cursor.row_factory = TrackingEntry.from_row
+    cursor.execute(QUERY)
+    return cursor.fetchall()
+
+
+def measure(loader: Callable, conn: sqlite3.Connection, repeat: int) -> Tuple[float, int]:
+    """
+    Time a loader and measure the memory its result holds.
+
+    Returns:
+        Tuple of (best seconds over repeat runs, retained bytes)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = loader(conn)
+        best = min(best, time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = loader(conn)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, retained
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    conn = build_database(args.rows)
+    scale = 100_000 / args.rows
+
+    print(f"{'model':<10} {'ms/100k rows':>14} {'MiB/100k rows':>15}")
+    for name, loader in (("legacy", load_legacy), ("slotted", load_slotted)):
+        seconds, retained = measure(loader, conn, args.repeat)
+        print(
+            f"{name:<10} {seconds * 1000 * scale:>14.1f} "
+            f"{retained / (1024 * 1024) * scale:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark headless CLI startup: process-to-exit time and import time.
+
+Runs `python -m src.main --db <scratch db> status` several times and
+reports the wall-clock time, then runs it once more under -X importtime
+to show the cumulative import time of the heaviest modules. Appends a JSON record to a history file so the
+figures can be tracked over time. Also fails if Textual gets imported.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [--runs N] [--history PATH]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Tuple
+
+DEFAULT_HISTORY = Path(__file__).parent / "results" / "startup.jsonl"
+TARGET_MS = 50.0
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, str, int]]:
+    """
+    Parse -X importtime output.
+
+    Returns:
+        List of (nesting level, module name, cumulative microseconds)
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative_us, module = line[len("import time:"):].split("|")
+        if cumulative_us.strip().isdigit():
+            name = module.rstrip()
+            level = (len(name) - len(name.lstrip()) - 1) // 2
+            imports.append((level, name.strip(), int(cumulative_us)))
+    return imports
+
+
+def run_cli(db_path: Path, importtime: bool = False) -> Tuple[float, str]:
+    """Run `status` once and return (wall seconds, stderr)."""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-m", "src.main", "--db", str(db_path), "status"]
+
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"CLI failed: {result.stderr[-500:]}")
+    return elapsed, result.stderr
+
+
+def run_interpreter() -> float:
+    """Return the wall time of starting and exiting a bare interpreter."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def git_revision() -> str:
+    """Return the current short git revision, or 'unknown'."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True
+    )
+    return result.stdout.strip() or "unknown"
+
+
+def main() -> int:
+    """Run the benchmark, print a report and append it to the history."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "startup.db"
+        run_cli(db_path)  # Create the database and warm the bytecode cache
+
+        timings = [run_cli(db_path)[0] for _ in range(args.runs)]
+        imports = parse_importtime(run_cli(db_path, importtime=True)[1])
+
+    # Time an empty interpreter too, to separate our cost from Python's own
+    baseline = min(
+        run_interpreter() for _ in range(max(3, args.runs // 2))
+    )
+
+    top_level = [(name, us) for level, name, us in imports if level == 0]
+    median_ms = statistics.median(timings) * 1000
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "median_ms": round(median_ms, 1),
+        "min_ms": round(min(timings) * 1000, 1),
+        "interpreter_ms": round(baseline * 1000, 1),
+        "import_ms": round(sum(us for _, us in top_level) / 1000, 1),
+        "src_import_ms": round(
+            sum(us for name, us in top_level if name.split(".")[0] == "src") / 1000, 1
+        ),
+        "textual_imported": any(
+            name.split(".")[0] == "textual" for _, name, _ in imports
+        ),
+    }
+
+    print(f"status: median {record['median_ms']} ms, min {record['min_ms']} ms "
+          f"(target {TARGET_MS:.0f} ms; bare interpreter {record['interpreter_ms']} ms)")
+    print(f"imports: {record['import_ms']} ms total, {record['src_import_ms']} ms in src")
+    print("heaviest top-level imports (cumulative, under -X importtime):")
+    for name, us in sorted(top_level, key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with args.history.open("a") as history:
+        history.write(json.dumps(record) + "\n")
+    print(f"appended to {args.history}")
+
+    if record["textual_imported"]:
+        print("FAIL: the headless CLI imported Textual")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
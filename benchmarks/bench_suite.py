@@ -0,0 +1,307 @@
+"""
+Benchmark the repository and service layers on synthetic databases.
+
+For each requested size, generates a database of non-overlapping
+sessions spread over a number of projects (deterministic for a given
+seed), then times the main read paths, start/stop toggles and the
+population of the detail screen's table. Results are written as JSON so
+two runs, e.g. before and after a change, can be compared with
+--compare.
+
+Run from the repository root:
+    python -m benchmarks.bench_suite [--sizes N ...] [--projects N]
+                                     [--cache-dir DIR] [--compare OLD.json]
+
+Generating large databases takes a while (roughly 35 s per million
+sessions); pass --cache-dir to keep them between runs. Each run works on
+a copy, since the toggle cases write to the database.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.database.db_manager import db_manager
+from src.database.rollup_repo import rollup_repo
+from src.database.tracking_repo import tracking_repo
+from src.database.transaction_repo import transaction_repo
+from src.services.import_service import import_service
+from src.services.tracking_service import tracking_service
+
+RESULTS_DIR = Path(__file__).parent / "results"
+START = 946_684_800  # 2000-01-01 UTC; fixed so databases are reproducible
+DETAIL_PAGES = 10
+
+Case = Dict[str, Any]
+
+
+def generate_sessions(
+    sessions: int,
+    projects: int,
+    seed: int
+) -> Iterator[Tuple[int, str, int, int]]:
+    """
+    Generate back-to-back sessions as import records.
+
+    Sessions last 1-90 minutes with 0-30 minute gaps; projects are picked
+    with a skewed distribution so a few are much busier than the rest.
+
+    Args:
+        sessions: Number of sessions
+        projects: Number of distinct projects
+        seed: Random seed
+
+    Yields:
+        (line number, project, start, stop) records
+    """
+    rng = random.Random(seed)
+    names = [f"Project {i:03d}" for i in range(projects)]
+    weights = [1 / (i + 1) for i in range(projects)]
+    picks = rng.choices(names, weights, k=min(sessions, 100_000))
+    start = START
+    for i in range(sessions):
+        stop = start + rng.randint(60, 5400)
+        yield i + 1, picks[i % len(picks)], start, stop
+        start = stop + rng.randint(0, 1800)
+
+
+def build_database(path: Path, sessions: int, projects: int, seed: int) -> float:
+    """Create a synthetic database at path and return the seconds taken."""
+    begin = time.perf_counter()
+    db_manager.initialize(path)
+    try:
+        result = import_service.import_records(generate_sessions(sessions, projects, seed))
+    finally:
+        db_manager.close()
+    if result.errors or result.imported != sessions:
+        raise RuntimeError(f"Synthetic import failed: {result.errors[:3]}")
+    return time.perf_counter() - begin
+
+
+def measure(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> Case:
+    """Time func `repeat` times and summarize in milliseconds."""
+    timings = []
+    rows = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        begin = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - begin)
+        if isinstance(result, (list, dict)):
+            rows = len(result)
+        elif isinstance(result, int):
+            rows = result
+    case: Case = {
+        "runs": repeat,
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+    }
+    if rows is not None:
+        case["rows"] = rows
+    return case
+
+
+def toggle() -> None:
+    """Start and stop one session."""
+    tracking_service.start_tracking("Project 000")
+    tracking_service.stop_tracking()
+
+
+async def bench_detail_screen(repeat: int) -> Dict[str, Case]:
+    """Time filling the detail screen's table in a headless app."""
+    # Textual is only needed for this case
+    from textual.app import App
+
+    from src.ui.screens.detail_screen import DetailScreen
+
+    class DetailBenchApp(App):
+        """Minimal app hosting a DetailScreen."""
+
+        projects: List[str] = []
+
+        def on_mount(self) -> None:
+            """Show the detail screen."""
+            self.push_screen(DetailScreen())
+
+        def refresh_projects(self) -> None:
+            """Keep the empty project list."""
+
+    app = DetailBenchApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        screen = app.screen
+
+        def first_page() -> int:
+            screen.load_detail_data()
+            return screen.table.row_count
+
+        def next_pages() -> int:
+            for _ in range(DETAIL_PAGES):
+                screen.load_next_page()
+            return screen.table.row_count
+
+        return {
+            "DetailScreen.load_detail_data": measure(first_page, repeat),
+            f"DetailScreen.load_next_page x{DETAIL_PAGES}": measure(
+                next_pages, repeat, setup=screen.load_detail_data
+            ),
+        }
+
+
+def bench_size(db_path: Path, sessions: int, repeat: int, max_list_rows: int, toggles: int) -> Dict[str, Case]:
+    """Run every case against one database."""
+    db_manager.initialize(db_path)
+    tracking_service.active_cache.invalidate()
+    if tracking_service.store is not None:
+        tracking_service.store.reset()
+
+    try:
+        busiest = max(rollup_repo.get_project_totals().items(), key=lambda item: item[1])[0]
+        cases = {
+            "tracking_repo.get_project_totals": measure(tracking_repo.get_project_totals, repeat),
+            "rollup_repo.get_project_totals": measure(rollup_repo.get_project_totals, repeat),
+            "tracking_repo.get_entries_by_project": measure(
+                lambda: tracking_repo.get_entries_by_project(busiest), repeat
+            ),
+            "transaction_repo.get_recent_transactions": measure(
+                transaction_repo.get_recent_transactions, repeat
+            ),
+            "tracking_service.get_summary_report": measure(
+                tracking_service.get_summary_report, repeat
+            ),
+        }
+        if sessions <= max_list_rows:
+            cases["tracking_repo.get_all_entries"] = measure(tracking_repo.get_all_entries, repeat)
+        else:
+            cases["tracking_repo.get_all_entries"] = {"skipped": f"over --max-list-rows {max_list_rows}"}
+
+        cases.update(asyncio.run(bench_detail_screen(repeat)))
+
+        # Writes last, so they do not change what the reads above see
+        cases["tracking_service.start_stop"] = measure(toggle, toggles)
+        tracking_service.enable_journal(db_path.with_suffix(".journal"))
+        try:
+            cases["tracking_service.start_stop (journal)"] = measure(toggle, toggles)
+        finally:
+            tracking_service.disable_journal()
+    finally:
+        db_manager.close()
+    return cases
+
+
+def git_revision() -> str:
+    """Return the current short git revision, or 'unknown'."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True
+    )
+    return result.stdout.strip() or "unknown"
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> int:
+    """Print median ratios against a baseline and count regressions."""
+    old_sizes = {(size["sessions"], size["projects"]): size for size in baseline["sizes"]}
+    regressions = 0
+    print(f"\ncompared with {baseline['revision']} ({baseline['timestamp']}):")
+    for size in current["sizes"]:
+        old = old_sizes.get((size["sessions"], size["projects"]))
+        if old is None:
+            continue
+        for name, case in size["cases"].items():
+            old_case = old["cases"].get(name, {})
+            if "median_ms" not in case or not old_case.get("median_ms"):
+                continue
+            ratio = case["median_ms"] / old_case["median_ms"]
+            flag = ""
+            if ratio > tolerance:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"  {size['sessions']:>10,}  {name:<45} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    """Run the suite, print a report and write the JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000],
+                        help="Session counts to benchmark (e.g. 10000 1000000 10000000)")
+    parser.add_argument("--projects", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--toggles", type=int, default=50, help="Start/stop pairs to time")
+    parser.add_argument("--max-list-rows", type=int, default=1_000_000,
+                        help="Skip get_all_entries above this many sessions")
+    parser.add_argument("--cache-dir", type=Path, help="Keep generated databases here")
+    parser.add_argument("--output", type=Path, help="Results file (default: results/suite-<revision>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Median slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": revision,
+        "python": sys.version.split()[0],
+        "sqlite": sqlite3.sqlite_version,
+        "seed": args.seed,
+        "sizes": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for sessions in args.sizes:
+            name = f"sessions-{sessions}-projects-{args.projects}-seed-{args.seed}.db"
+            source = (args.cache_dir or Path(tmp)) / name
+            generate_s = None
+            if not source.exists():
+                source.parent.mkdir(parents=True, exist_ok=True)
+                print(f"generating {sessions:,} sessions...", flush=True)
+                generate_s = round(build_database(source, sessions, args.projects, args.seed), 2)
+
+            db_path = Path(tmp) / "bench.db"
+            shutil.copyfile(source, db_path)
+            cases = bench_size(db_path, sessions, args.repeat, args.max_list_rows, args.toggles)
+            db_path.unlink()
+
+            report["sizes"].append({
+                "sessions": sessions,
+                "projects": args.projects,
+                "generate_s": generate_s,
+                "cases": cases,
+            })
+            print(f"\n{sessions:,} sessions, {args.projects} projects:")
+            for case_name, case in cases.items():
+                if "skipped" in case:
+                    print(f"  {case_name:<45} skipped ({case['skipped']})")
+                else:
+                    rows = f"  {case['rows']:>10,} rows" if "rows" in case else ""
+                    print(f"  {case_name:<45} {case['median_ms']:10.3f} ms median{rows}")
+
+    output = args.output or RESULTS_DIR / f"suite-{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nwrote {output}")
+
+    if args.compare is not None:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.tolerance)
+        if regressions:
+            print(f"FAIL: {regressions} case(s) slower than {args.tolerance}x the baseline")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
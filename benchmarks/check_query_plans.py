@@ -0,0 +1,111 @@
+"""
+Check that the date-range and paged report queries use indexes.
+
+Runs the TrackingRepository range queries against a scratch database,
+captures the SQL they execute and runs EXPLAIN QUERY PLAN on it. Fails if
+any filtered query scans timeTracking instead of searching an index, or
+if any query needs a temporary B-tree to sort.
+
+Run from the repository root:
+    python -m benchmarks.check_query_plans
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+from src.database.db_manager import db_manager
+from src.database.project_repo import project_repo
+from src.database.storage_profile import STORAGE_PROFILES
+from src.database.tracking_repo import tracking_repo
+
+SINCE = 1_700_000_000
+UNTIL = 1_700_000_000 + 30 * 86400
+
+
+def capture(action) -> List[str]:
+    """Run an action and return the SELECT statements it executed."""
+    statements: List[str] = []
+    conn = db_manager.get_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        result = action()
+        if hasattr(result, '__next__'):
+            list(result)
+    finally:
+        conn.set_trace_callback(None)
+    return [sql for sql in statements if sql.lstrip().upper().startswith('SELECT')]
+
+
+def scans_time_tracking(line: str) -> bool:
+    """Whether a plan line scans timeTracking (aliased t in the queries)."""
+    return line.split(' ')[:2] in (['SCAN', 'timeTracking'], ['SCAN', 't'])
+
+
+def plan(sql: str) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    conn = db_manager.get_connection()
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+def main() -> int:
+    """Run the checks and report any offending plans."""
+    with tempfile.TemporaryDirectory() as tmp:
+        # Read on the writer connection so the trace sees every statement
+        db_manager.initialize(Path(tmp) / "plans.db", STORAGE_PROFILES['compat'])
+        conn = db_manager.get_connection()
+        project_ids = project_repo.get_or_create_ids(f"Project {i}" for i in range(20))
+        conn.executemany(
+            "INSERT INTO timeTracking (projectId, startTime, stopTime, timeElapsed) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                (project_ids[f"Project {i % 20}"], SINCE + i * 600, SINCE + i * 600 + 300, 300)
+                for i in range(20_000)
+            )
+        )
+        conn.commit()
+        conn.execute("ANALYZE")
+
+        cases: List[Tuple[str, bool, object]] = [
+            ("first page", False, lambda: tracking_repo.get_entries_page()),
+            ("next page", True,
+             lambda: tracking_repo.get_entries_page(after=(UNTIL, 10_000))),
+            ("project page", True,
+             lambda: tracking_repo.get_entries_page("Project 3", after=(UNTIL, 10_000))),
+            ("date-range page", True,
+             lambda: tracking_repo.get_entries_page(since=SINCE, until=UNTIL)),
+            ("project + date-range page", True,
+             lambda: tracking_repo.get_entries_page("Project 3", since=SINCE, until=UNTIL)),
+            ("date-range stream", True,
+             lambda: tracking_repo.iter_entries_in_range(since=SINCE, until=UNTIL)),
+            ("project + date-range stream", True,
+             lambda: tracking_repo.iter_entries_in_range("Project 3", SINCE, UNTIL)),
+            ("export stream", False,
+             lambda: tracking_repo.iter_rows_in_range()),
+            ("project + date-range export", True,
+             lambda: tracking_repo.iter_rows_in_range("Project 3", SINCE, UNTIL, True)),
+        ]
+
+        failures = 0
+        for name, filtered, action in cases:
+            for sql in capture(action):
+                details = plan(sql)
+                problems = [
+                    line for line in details
+                    if 'TEMP B-TREE' in line
+                    or (scans_time_tracking(line) and 'INDEX' not in line)
+                    or (filtered and scans_time_tracking(line))
+                ]
+                status = "FAIL" if problems else "ok"
+                failures += bool(problems)
+                print(f"{status:<5} {name}: {'; '.join(details)}")
+
+        db_manager.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,54 +1,185 @@
 """Main Textual application class."""
 
+import asyncio
+import time
+from typing import Callable, List, Optional
+
 from textual.app import App
 from textual.binding import Binding
+from textual.reactive import reactive
 
 from .database.db_manager import db_manager
+from .models.tracking_entry import TrackingEntry
+from .services.event_bus import (
+    ActiveEntryReloaded,
+    JournalFlushed,
+    TrackingEvent,
+    TrackingStarted,
+    TrackingStopped,
+    event_bus,
+)
 from .services.project_service import project_service
 from .services.tracking_service import tracking_service
 from .ui.screens.main_screen import MainScreen
 from .ui.screens.summary_screen import SummaryScreen
 from .ui.screens.detail_screen import DetailScreen
-from .utils.constants import DB_PATH
+from .utils.constants import DB_PATH, JOURNAL_ENABLED, JOURNAL_PATH, UPDATE_INTERVAL
 
 
 class TimeTrackerApp(App):
-    """Time tracking TUI application."""
+    """
+    Time tracking TUI application.
+
+    The app owns the only clock. While a session is active a single timer
+    advances elapsed_seconds from a time.monotonic() anchor; while idle
+    the timer is paused, so nothing wakes up. Screens watch active_entry
+    and elapsed_seconds instead of running timers of their own.
+
+    Screens are installed by name and created once; navigation with
+    show_screen() reuses them and keeps at most one report screen above
+    the main screen, so the stack and memory stay flat.
+
+    Starts and stops go through the tracking service's journal, so a
+    keypress waits for a local fsync rather than a database commit.
+    """
 
     CSS_PATH = "styles.css"
 
+    SCREENS = {
+        "main": MainScreen,
+        "summary": SummaryScreen,
+        "detail": DetailScreen,
+    }
+
     BINDINGS = [
         Binding("q", "quit", "Quit", priority=True),
     ]
 
+    # Active session, or None; set from tracking events
+    active_entry: reactive[Optional[TrackingEntry]] = reactive(None)
+    # Seconds elapsed in the active session, 0 while idle
+    elapsed_seconds = reactive(0)
+
     def __init__(self, **kwargs):
         """Initialize the application."""
         super().__init__(**kwargs)
         self.projects = []
-        self.active_entry = None
+        # (elapsed seconds, time.monotonic()) when the active session was seen
+        self._clock_anchor = (0, 0.0)
+        self._clock = None
+        self._unsubscribe: List[Callable[[], None]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def on_mount(self) -> None:
         """Handle application mount."""
-        # Initialize database
+        # Initialize database, replaying any toggles journaled but not
+        # yet written by an earlier run
         db_manager.initialize(DB_PATH)
+        if JOURNAL_ENABLED:
+            tracking_service.enable_journal(JOURNAL_PATH)
 
         # Load projects
-        self.projects = project_service.load_projects()
+        self.projects = project_service.sync_projects()
+
+        # Follow starts and stops made from any screen, the database's view
+        # of them once the journal is flushed, and other processes' toggles
+        self._loop = asyncio.get_running_loop()
+        self._unsubscribe = [
+            event_bus.subscribe(TrackingStarted, self._on_tracking_started),
+            event_bus.subscribe(TrackingStopped, self._on_tracking_stopped),
+            event_bus.subscribe(JournalFlushed, self._on_flusher_event),
+            event_bus.subscribe(ActiveEntryReloaded, self._on_flusher_event),
+        ]
 
         # Check for active tracking
-        self.active_entry = tracking_service.get_current_status()
+        self._clock = self.set_interval(UPDATE_INTERVAL, self._tick, pause=True)
+        self.set_active_entry(tracking_service.get_current_status())
 
         # Show main screen
-        self.push_screen(MainScreen())
+        self.push_screen("main")
+
+    def on_unmount(self) -> None:
+        """Handle application unmount."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+        tracking_service.disable_journal()
+
+    def refresh_projects(self) -> None:
+        """Pick up edits to projects.txt; costs one stat() when unchanged."""
+        self.projects = project_service.sync_projects()
+
+    def set_active_entry(self, entry: Optional[TrackingEntry]) -> None:
+        """
+        Set the active session and start or pause the clock to match.
+
+        Args:
+            entry: Active session, or None when idle
+        """
+        self.active_entry = entry
+        if entry is None:
+            self._clock.pause()
+            self.elapsed_seconds = 0
+        else:
+            self._clock_anchor = (entry.calculate_current_elapsed(), time.monotonic())
+            self._tick()
+            self._clock.resume()
+
+    def _tick(self) -> None:
+        """Advance elapsed_seconds from the monotonic anchor."""
+        elapsed, anchor = self._clock_anchor
+        self.elapsed_seconds = elapsed + int(time.monotonic() - anchor)
+
+    def _on_tracking_started(self, event: TrackingStarted) -> None:
+        """Start the clock for a new session."""
+        self.set_active_entry(event.entry)
+
+    def _on_tracking_stopped(self, event: TrackingStopped) -> None:
+        """Stop the clock when the session ends."""
+        self.set_active_entry(None)
+
+    def _on_flusher_event(self, event: TrackingEvent) -> None:
+        """Pick up the flusher's view of the active session; runs on its thread."""
+        self._loop.call_soon_threadsafe(self._sync_active_entry)
+
+    def _sync_active_entry(self) -> None:
+        """Show the active session as the tracking service now sees it."""
+        entry = tracking_service.get_current_status()
+        shown = self.active_entry
+        if (entry and (entry.project_name, entry.start_time)) != \
+                (shown and (shown.project_name, shown.start_time)):
+            self.set_active_entry(entry)
+
+    def show_screen(self, name: str) -> None:
+        """
+        Show an installed screen without growing the screen stack.
+
+        The main screen is reached by popping back to it; a report screen
+        is pushed over the main screen, or replaces the report screen
+        currently shown.
+
+        Args:
+            name: Name of the screen in SCREENS
+        """
+        screen = self.get_screen(name)
+        if screen is self.screen:
+            return
+        if screen in self.screen_stack:
+            while self.screen is not screen:
+                self.pop_screen()
+        elif self.screen is self.get_screen("main"):
+            self.push_screen(name)
+        else:
+            self.switch_screen(name)
 
     def action_show_main(self) -> None:
         """Show the main tracking screen."""
-        self.push_screen(MainScreen())
+        self.show_screen("main")
 
     def action_show_summary(self) -> None:
         """Show the summary report screen."""
-        self.push_screen(SummaryScreen())
+        self.show_screen("summary")
 
     def action_show_detail(self) -> None:
         """Show the detail report screen."""
-        self.push_screen(DetailScreen())
+        self.show_screen("detail")
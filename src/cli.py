@@ -0,0 +1,453 @@
+"""
+Headless command-line interface.
+
+Used for shell prompts and hotkeys, so it must start fast: it never imports
+Textual, and service modules are imported only once a command has been
+parsed (so --help and argument errors do not touch the database layer).
+When a daemon is listening (see src/daemon.py), tracking commands are sent
+to it over its socket and the database is not opened at all.
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .utils.constants import SOCKET_PATH
+
+
+class _MigrationReporter:
+    """Print each schema migration to stderr as it starts."""
+
+    def __init__(self):
+        self.description: Optional[str] = None
+
+    def __call__(self, step: int, total: int, description: str) -> None:
+        if description != self.description:
+            self.description = description
+            print(f"Upgrading database [{step + 1}/{total}]: {description}", file=sys.stderr)
+
+
+@contextmanager
+def _open_database(args: argparse.Namespace) -> Iterator[None]:
+    """Open the database named by --db (or the default) for one command."""
+    from .database.db_manager import db_manager
+    from .utils.constants import DB_PATH
+
+    db_path = args.db or DB_PATH
+    # Creating a new database is not worth reporting; upgrading one is
+    progress = _MigrationReporter() if db_path.exists() else None
+    db_manager.initialize(db_path, progress=progress)
+    try:
+        yield
+    finally:
+        db_manager.close()
+
+
+def _run_command(args: argparse.Namespace, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a tracking command on the daemon if one is listening, else locally.
+
+    The daemon serves its own database, so --db and --no-daemon both force
+    the local path. A daemon that accepts the request but does not reply
+    may still have carried it out, so that is reported as a failure rather
+    than retried locally.
+
+    Args:
+        args: Parsed command-line arguments
+        request: Request dictionary for CommandService
+
+    Returns:
+        Reply dictionary
+    """
+    if args.db is None and not args.no_daemon:
+        from . import daemon_client
+
+        try:
+            reply = daemon_client.request(request, args.socket)
+        except OSError as exc:
+            return {
+                'ok': False,
+                'error': 'daemon_unavailable',
+                'message': f"The daemon did not reply ({exc or type(exc).__name__}); "
+                           "try again, or use --no-daemon."
+            }
+        if reply is not None:
+            return reply
+
+    from .services.command_service import command_service
+
+    with _open_database(args):
+        return command_service.handle(request)
+
+
+def _fail(reply: Dict[str, Any]) -> int:
+    """Print a failed reply's message and return the matching exit code."""
+    print(reply['message'], file=sys.stderr)
+    return 2 if reply.get('error') in ('unknown_project', 'bad_request') else 1
+
+
+def cmd_start(args: argparse.Namespace) -> int:
+    """Start tracking a project."""
+    reply = _run_command(args, {'command': 'start', 'project': args.project})
+    if not reply['ok']:
+        return _fail(reply)
+    print(reply['message'])
+    return 0
+
+
+def cmd_stop(args: argparse.Namespace) -> int:
+    """Stop the active tracking session."""
+    from .utils.time_utils import format_elapsed_time
+
+    reply = _run_command(args, {'command': 'stop'})
+    if not reply['ok']:
+        return _fail(reply)
+    print(f"{reply['message']} ({format_elapsed_time(reply['entry']['time_elapsed'])})")
+    return 0
+
+
+def cmd_status(args: argparse.Namespace) -> int:
+    """Print the current tracking status."""
+    from .utils.time_utils import format_elapsed_time
+
+    reply = _run_command(args, {'command': 'status'})
+    if not reply['ok']:
+        return _fail(reply)
+
+    entry = reply['entry']
+    if entry is None:
+        print("Idle")
+        return 1 if args.exit_code else 0
+
+    elapsed = format_elapsed_time(int(time.time()) - entry['start_time'])
+    print(f"Tracking '{entry['project_name']}' {elapsed}")
+    return 0
+
+
+def cmd_summary(args: argparse.Namespace) -> int:
+    """Print total time per project, optionally bucketed by period."""
+    from .utils.time_utils import format_elapsed_time
+
+    since = args.since
+    if since is None and args.weeks is not None:
+        since = date.today() - timedelta(weeks=args.weeks)
+    reply = _run_command(args, {
+        'command': 'summary',
+        'by': args.by,
+        'since': since.isoformat() if since is not None else None,
+        'until': args.until.isoformat() if args.until is not None else None,
+    })
+    if not reply['ok']:
+        return _fail(reply)
+
+    if args.by is None:
+        totals = reply['totals']
+        for project_name, seconds in sorted(totals.items(), key=lambda x: x[1], reverse=True):
+            print(f"{format_elapsed_time(seconds):>10}  {project_name}")
+        if totals:
+            print(f"{format_elapsed_time(sum(totals.values())):>10}  TOTAL")
+        return 0
+
+    for key, project_name, seconds in reply['rows']:
+        print(f"{key:<10}  {format_elapsed_time(seconds):>10}  {project_name}")
+    return 0
+
+
+def cmd_rename(args: argparse.Namespace) -> int:
+    """Rename a project, keeping its history."""
+    reply = _run_command(args, {'command': 'rename', 'old': args.old, 'new': args.new})
+    if not reply['ok']:
+        return _fail(reply)
+    print(reply['message'])
+    return 0
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    """Run the background daemon, or stop a running one."""
+    from . import daemon_client
+
+    if args.stop:
+        try:
+            reply = daemon_client.request({'command': 'shutdown'}, args.socket)
+        except OSError as exc:
+            print(f"The daemon did not reply ({exc or type(exc).__name__}).", file=sys.stderr)
+            return 1
+        if reply is None:
+            print("No daemon is running.", file=sys.stderr)
+            return 1
+        print(reply['message'])
+        return 0
+
+    from .daemon import run
+    from .utils.constants import DB_PATH
+
+    try:
+        return run(args.db or DB_PATH, args.socket)
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+
+def cmd_rebuild_totals(args: argparse.Namespace) -> int:
+    """Rebuild the per-project totals rollup."""
+    from .services.tracking_service import tracking_service
+
+    with _open_database(args):
+        count = tracking_service.rebuild_totals()
+    print(f"Rebuilt totals for {count} project(s).")
+    return 0
+
+
+def cmd_verify_totals(args: argparse.Namespace) -> int:
+    """Verify the per-project totals rollup against session history."""
+    from .services.tracking_service import tracking_service
+    from .utils.time_utils import format_elapsed_time
+
+    with _open_database(args):
+        mismatches = tracking_service.verify_totals()
+    if not mismatches:
+        print("Project totals are consistent.")
+        return 0
+
+    for project_name, rollup_seconds, actual_seconds in mismatches:
+        print(
+            f"{project_name}: rollup {format_elapsed_time(rollup_seconds)}, "
+            f"actual {format_elapsed_time(actual_seconds)}"
+        )
+    print("Run 'rebuild-totals' to repair the rollup.")
+    return 1
+
+
+def cmd_rebuild_daily(args: argparse.Namespace) -> int:
+    """Rebuild the daily rollup used by day/week/month reports."""
+    from .services.tracking_service import tracking_service
+
+    with _open_database(args):
+        count = tracking_service.rebuild_daily_rollup()
+    print(f"Rebuilt daily rollup with {count} day/project row(s).")
+    return 0
+
+
+class _ImportReporter:
+    """Print bulk import progress to stderr, one line per phase update."""
+
+    def __call__(self, done: int, total: int, phase: str) -> None:
+        if total:
+            print(f"{phase}: {done:,}/{total:,}", file=sys.stderr)
+        else:
+            print(f"{phase}: {done:,} rows", file=sys.stderr)
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    """Import completed sessions from a CSV, JSON Lines or JSON file."""
+    from .services.import_service import import_service
+
+    with _open_database(args):
+        try:
+            result = import_service.import_file(
+                args.file,
+                args.format,
+                args.skip_invalid,
+                None if args.quiet else _ImportReporter()
+            )
+        except (OSError, ValueError) as error:
+            print(error, file=sys.stderr)
+            return 2
+
+    for message in result.errors[:args.max_errors]:
+        print(message, file=sys.stderr)
+    if len(result.errors) > args.max_errors:
+        print(f"... and {len(result.errors) - args.max_errors} more", file=sys.stderr)
+
+    if result.errors and not args.skip_invalid:
+        print(
+            f"Nothing imported: {len(result.errors)} invalid row(s). "
+            "Fix them or pass --skip-invalid.",
+            file=sys.stderr
+        )
+        return 1
+    print(f"Imported {result.imported} session(s), skipped {len(result.errors)}.")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    """Export sessions to CSV, JSON Lines, columnar or Parquet files."""
+    from .services.export_service import export_service
+
+    with _open_database(args):
+        try:
+            count = export_service.export(
+                args.file,
+                args.format,
+                args.project,
+                args.since,
+                args.until,
+                args.completed_only
+            )
+        except (OSError, RuntimeError, ValueError) as error:
+            print(error, file=sys.stderr)
+            return 2
+
+    print(f"Exported {count} session(s).", file=sys.stderr)
+    return 0
+
+
+def _iso_date(text: str) -> date:
+    """Parse a YYYY-MM-DD command-line argument."""
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{text}', expected YYYY-MM-DD")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command-line interface."""
+    parser = argparse.ArgumentParser(prog="timetracker")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        help="Path to the SQLite database (defaults to data/timetracker.db)"
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=SOCKET_PATH,
+        help="Path to the daemon's socket (defaults to data/timetracker.sock)"
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Open the database directly even if a daemon is running"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    start = subparsers.add_parser("start", help="Start tracking a project")
+    start.add_argument("project", help="Project name from projects.txt")
+    start.set_defaults(func=cmd_start)
+
+    stop = subparsers.add_parser("stop", help="Stop the active session")
+    stop.set_defaults(func=cmd_stop)
+
+    status = subparsers.add_parser("status", help="Show the active session")
+    status.add_argument(
+        "--exit-code",
+        action="store_true",
+        help="Exit with status 1 when idle (for shell prompts)"
+    )
+    status.set_defaults(func=cmd_status)
+
+    summary = subparsers.add_parser("summary", help="Show total time per project")
+    summary.add_argument(
+        "--by",
+        choices=("day", "week", "month"),
+        help="Break totals down by local day, week or month"
+    )
+    summary.add_argument("--since", type=_iso_date, help="First date to include")
+    summary.add_argument("--until", type=_iso_date, help="Date to stop before")
+    summary.add_argument("--weeks", type=int, help="Shortcut for --since N weeks ago")
+    summary.set_defaults(func=cmd_summary)
+
+    rename = subparsers.add_parser(
+        "rename-project",
+        help="Rename a project in the database and projects.txt"
+    )
+    rename.add_argument("old", help="Current project name")
+    rename.add_argument("new", help="New project name")
+    rename.set_defaults(func=cmd_rename)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-totals",
+        help="Recompute per-project totals from session history"
+    )
+    rebuild.set_defaults(func=cmd_rebuild_totals)
+
+    verify = subparsers.add_parser(
+        "verify-totals",
+        help="Check per-project totals against session history"
+    )
+    verify.set_defaults(func=cmd_verify_totals)
+
+    rebuild_daily = subparsers.add_parser(
+        "rebuild-daily",
+        help="Recompute the daily rollup from session history"
+    )
+    rebuild_daily.set_defaults(func=cmd_rebuild_daily)
+
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Import completed sessions from CSV, JSON Lines or JSON"
+    )
+    import_parser.add_argument(
+        "file",
+        type=Path,
+        help="File with project, start and stop columns (Unix or ISO 8601 times)"
+    )
+    import_parser.add_argument(
+        "--format",
+        choices=("csv", "jsonl", "json"),
+        help="Input format (defaults to the file suffix)"
+    )
+    import_parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Import the valid rows even if some rows are invalid or overlap"
+    )
+    import_parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=20,
+        help="Number of rejected rows to list (default 20)"
+    )
+    import_parser.add_argument("--quiet", action="store_true", help="Do not report progress")
+    import_parser.set_defaults(func=cmd_import)
+
+    export = subparsers.add_parser(
+        "export",
+        help="Export sessions to CSV, JSON Lines, columnar or Parquet"
+    )
+    export.add_argument("file", type=Path, help="Output file, or - for standard output")
+    export.add_argument(
+        "--format",
+        choices=("csv", "jsonl", "columnar", "parquet"),
+        help="Output format (defaults to the file suffix: .csv, .jsonl, .ttc, .parquet)"
+    )
+    export.add_argument("--project", help="Only export this project")
+    export.add_argument("--since", type=_iso_date, help="First start date to include")
+    export.add_argument("--until", type=_iso_date, help="Start date to stop before")
+    export.add_argument(
+        "--completed-only",
+        action="store_true",
+        help="Leave out the active session"
+    )
+    export.set_defaults(func=cmd_export)
+
+    daemon = subparsers.add_parser(
+        "daemon",
+        help="Serve start/stop/status/summary from memory over a Unix socket"
+    )
+    daemon.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    daemon.set_defaults(func=cmd_daemon)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run a command-line command.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Optional background daemon serving tracking commands over a Unix socket.
+
+The daemon opens the database once and keeps the active entry, the
+project list and the columnar session store in memory, so status queries
+from shell prompts and editor plugins skip interpreter startup, schema
+setup and projects.txt parsing. Run it with `python -m src.main daemon`.
+
+Protocol: newline-delimited JSON over the socket. Each request line is a
+dictionary with a 'command' key ('start', 'stop', 'status', 'summary',
+'rename', 'ping' or 'shutdown'); each reply line is a dictionary with an
+'ok' key.
+See CommandService for the arguments and replies of each command.
+"""
+
+import asyncio
+import json
+import os
+import signal
+from pathlib import Path
+from typing import Any, Dict
+
+from . import daemon_client
+from .database.db_manager import db_manager
+from .services.command_service import CommandService
+from .services.session_store import session_store
+from .services.tracking_service import TrackingService
+from .utils.constants import SOCKET_PATH
+
+
+class TrackingDaemon:
+    """Serve CommandService requests on a Unix domain socket."""
+
+    def __init__(self, socket_path: Path = SOCKET_PATH):
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+        """
+        self.socket_path = socket_path
+        # A long-running process amortizes loading the columnar store, so
+        # reports are always served from it here
+        self.commands = CommandService(TrackingService(session_store))
+        self._stopping: asyncio.Event
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one request, including the daemon-only commands.
+
+        Requests run one at a time on the event loop thread, so commands
+        never interleave on the shared connection.
+
+        Args:
+            request: Request dictionary
+
+        Returns:
+            Reply dictionary
+        """
+        command = request.get('command') if isinstance(request, dict) else None
+        if command == 'ping':
+            return {'ok': True, 'pid': os.getpid()}
+        if command == 'shutdown':
+            self._stopping.set()
+            return {'ok': True, 'message': 'Daemon stopping'}
+        return self.commands.handle(request)
+
+    async def _serve_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests from one connection until it closes."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the stream limit; the rest of the line
+                    # cannot be told apart from a next request, so hang up
+                    reply = {'ok': False, 'error': 'bad_request', 'message': 'Request too long'}
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    reply = self.handle(json.loads(line))
+                except ValueError:
+                    reply = {'ok': False, 'error': 'bad_request', 'message': 'Invalid JSON'}
+                except Exception as error:
+                    reply = {'ok': False, 'error': 'internal', 'message': str(error)}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass  # The daemon is shutting down with this connection still open
+        finally:
+            writer.close()
+
+    def _claim_socket(self) -> None:
+        """
+        Remove a stale socket file, refusing to replace a live daemon.
+
+        Raises:
+            RuntimeError: If another daemon answers on the socket
+        """
+        if not self.socket_path.exists():
+            return
+        try:
+            reply = daemon_client.request({'command': 'ping'}, self.socket_path)
+        except OSError:
+            reply = None
+        if reply is not None:
+            raise RuntimeError(
+                f"A daemon (pid {reply.get('pid')}) is already listening on {self.socket_path}"
+            )
+        self.socket_path.unlink()
+
+    async def serve(self) -> None:
+        """Listen on the socket until a shutdown request or SIGINT/SIGTERM."""
+        self._stopping = asyncio.Event()
+        self._claim_socket()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Warm the caches before accepting connections
+        self.commands.get_projects()
+        self.commands.tracking.get_current_status()
+        self.commands.tracking.get_summary_report()
+
+        server = await asyncio.start_unix_server(self._serve_client, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._stopping.set)
+
+        try:
+            async with server:
+                await self._stopping.wait()
+        finally:
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+
+def run(db_path: Path, socket_path: Path = SOCKET_PATH) -> int:
+    """
+    Run the daemon in the foreground until it is told to stop.
+
+    Args:
+        db_path: Path to the SQLite database
+        socket_path: Path of the Unix socket to listen on
+
+    Returns:
+        Process exit code
+    """
+    db_manager.initialize(db_path)
+    try:
+        asyncio.run(TrackingDaemon(socket_path).serve())
+    finally:
+        db_manager.close()
+    return 0
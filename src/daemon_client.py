@@ -0,0 +1,50 @@
+"""
+Client for the tracking daemon's Unix socket.
+
+Kept separate from src/daemon.py so the CLI can reach a running daemon
+without importing asyncio, SQLite or any service module.
+"""
+
+import json
+import socket
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .utils.constants import DAEMON_TIMEOUT, SOCKET_PATH
+
+
+def request(
+    payload: Dict[str, Any],
+    socket_path: Path = SOCKET_PATH,
+    timeout: float = DAEMON_TIMEOUT
+) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to the daemon and wait for its reply.
+
+    Args:
+        payload: Request dictionary, e.g. {'command': 'status'}
+        socket_path: Path of the daemon's socket
+        timeout: Seconds to wait for the connection and the reply
+
+    Returns:
+        Reply dictionary, or None if no daemon is listening
+
+    Raises:
+        OSError: If the daemon accepted the request but did not reply in time
+    """
+    if not hasattr(socket, 'AF_UNIX') or not socket_path.exists():
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None  # Stale socket file left by a daemon that died
+
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile('rb') as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("Daemon closed the connection without replying")
+    return json.loads(line)
@@ -1,15 +1,25 @@
 """Database connection and initialization manager."""
 
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
 
-from .schema import get_schema_statements
+from ..utils.constants import READER_WAIT_TIMEOUT, STORAGE_PROFILE, STREAM_BATCH_SIZE
+from .migrations import ProgressCallback, migrate
+from .storage_profile import STORAGE_PROFILES, StorageProfile
 
 
 class DatabaseManager:
-    """Singleton database manager for SQLite connection."""
+    """
+    Singleton database manager for SQLite connections.
+
+    Writes are serialized on a single writer connection. In WAL mode reads
+    are served from a small pool of reader connections so reports and
+    exports do not block a start/stop write (and vice versa).
+    """
 
     _instance: Optional['DatabaseManager'] = None
     _connection: Optional[sqlite3.Connection] = None
@@ -24,41 +34,60 @@ class DatabaseManager:
         if not hasattr(self, '_initialized'):
             self._initialized = True
             self.db_path: Optional[Path] = None
+            self.profile: StorageProfile = STORAGE_PROFILES[STORAGE_PROFILE]
+            self.journal_mode: Optional[str] = None
+            self._write_lock = threading.RLock()
+            self._transaction_depth = 0
+            self._transaction_owner: Optional[int] = None
+            self._readers: 'queue.Queue[sqlite3.Connection]' = queue.Queue()
+            self._all_readers: List[sqlite3.Connection] = []
+            self._readers_lock = threading.Lock()
 
-    def initialize(self, db_path: Path) -> None:
+    def initialize(
+        self,
+        db_path: Path,
+        profile: Optional[StorageProfile] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> None:
         """
-        Initialize the database connection and create tables.
+        Initialize the database connection and migrate the schema.
 
         Args:
             db_path: Path to the SQLite database file
+            profile: Storage profile to apply (defaults to the configured one)
+            progress: Optional callback reporting migration progress as
+                (step, total_steps, description)
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if profile is not None:
+            self.profile = profile
+
+        # Create writer connection
+        self._connection = self._connect()
+        row = self._connection.execute(
+            f"PRAGMA journal_mode = {self.profile.journal_mode.upper()}"
+        ).fetchone()
+        self.journal_mode = str(row[0]).lower()
 
-        # Create connection
-        self._connection = sqlite3.connect(
+        # Create or upgrade tables and indexes; a no-op when up to date
+        migrate(self._connection, progress)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with the profile's pragmas."""
+        conn = sqlite3.connect(
             str(self.db_path),
             check_same_thread=False,
-            timeout=5.0
+            timeout=self.profile.busy_timeout
         )
-        self._connection.row_factory = sqlite3.Row
-
-        # Create tables and indexes
-        self._create_schema()
-
-    def _create_schema(self) -> None:
-        """Create database tables and indexes."""
-        if self._connection is None:
-            raise RuntimeError("Database not initialized")
-
-        cursor = self._connection.cursor()
-        for statement in get_schema_statements():
-            cursor.executescript(statement)
-        self._connection.commit()
+        conn.row_factory = sqlite3.Row
+        for pragma in self.profile.connection_pragmas():
+            conn.execute(pragma)
+        return conn
 
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get the database connection.
+        Get the writer database connection.
 
         Returns:
             Active SQLite connection
@@ -70,23 +99,190 @@ class DatabaseManager:
             raise RuntimeError("Database not initialized. Call initialize() first.")
         return self._connection
 
+    def get_data_version(self) -> int:
+        """
+        Get SQLite's data_version for the writer connection.
+
+        The value changes whenever another connection (including another
+        process) commits to the database, but not for this connection's own
+        commits, making it a cheap way to detect outside changes.
+
+        Returns:
+            Current data_version value
+        """
+        return self.get_connection().execute("PRAGMA data_version").fetchone()[0]
+
+    @property
+    def _uses_reader_pool(self) -> bool:
+        """Whether reads can run on separate connections."""
+        return self.journal_mode == 'wal' and self.profile.reader_count > 0
+
     @contextmanager
-    def transaction(self):
+    def read_connection(self):
+        """
+        Context manager that lends a connection for read-only queries.
+
+        Uses a pooled reader connection in WAL mode. Falls back to the
+        writer connection when pooling is unavailable, or when the calling
+        thread is inside a transaction so it sees its own uncommitted writes.
+        When every pooled reader stays busy for READER_WAIT_TIMEOUT (for
+        example held by streams that are not being consumed), a temporary
+        connection is opened and closed afterwards, so reads never wait
+        indefinitely.
+        """
+        writer = self.get_connection()
+        if (not self._uses_reader_pool
+                or self._transaction_owner == threading.get_ident()):
+            yield writer
+            return
+
+        conn, pooled = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if pooled:
+                self._readers.put(conn)
+            else:
+                conn.close()
+
+    def _acquire_reader(self) -> Tuple[sqlite3.Connection, bool]:
+        """
+        Take an idle reader, opening one if the pool is not yet full.
+
+        Returns:
+            (connection, whether it belongs to the pool)
+        """
+        try:
+            return self._readers.get_nowait(), True
+        except queue.Empty:
+            pass
+
+        with self._readers_lock:
+            if len(self._all_readers) < self.profile.reader_count:
+                conn = self._connect()
+                self._all_readers.append(conn)
+                return conn, True
+
+        try:
+            return self._readers.get(timeout=READER_WAIT_TIMEOUT), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def stream_query(
+        self,
+        query: str,
+        params: Sequence[Any] = (),
+        batch_size: int = STREAM_BATCH_SIZE,
+        row_factory: Optional[Callable[[sqlite3.Cursor, tuple], Any]] = sqlite3.Row
+    ) -> Iterator[Any]:
+        """
+        Run a read-only query and yield its rows in fetchmany batches.
+
+        The read connection is held until the generator is exhausted or
+        closed, so consume it fully or close it when stopping early. While
+        the pool's readers are all held this way, other reads fall back to
+        temporary connections, which is slower but never blocks.
+
+        Args:
+            query: SQL SELECT statement
+            params: Query parameters
+            batch_size: Number of rows fetched per round trip
+            row_factory: Cursor row_factory, e.g. a model's from_row;
+                None yields plain tuples
+
+        Yields:
+            Result rows
+        """
+        with self.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = row_factory
+            cursor.execute(query, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def transaction(self, immediate: bool = False):
         """
         Context manager for database transactions.
 
         Automatically commits on success, rolls back on exception.
+        Nested uses join the outermost transaction, so several repository
+        writes can be grouped into a single commit. Transactions from
+        different threads are serialized on the writer connection.
+
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE) so
+                reads made inside the transaction cannot go stale before
+                the writes land. Ignored when joining an outer transaction.
         """
         conn = self.get_connection()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+        with self._write_lock:
+            if self._transaction_depth > 0:
+                self._transaction_depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._transaction_depth -= 1
+                return
+
+            self._transaction_depth = 1
+            self._transaction_owner = threading.get_ident()
+            try:
+                if immediate:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._transaction_depth = 0
+                self._transaction_owner = None
+
+    @contextmanager
+    def deferred_indexes(self, *tables: str) -> Iterator[None]:
+        """
+        Drop the indexes on some tables and rebuild them on exit.
+
+        Building each index once after a bulk insert is much cheaper than
+        updating every index row by row. Use inside transaction(): if the
+        block raises, the indexes are not rebuilt here but restored by the
+        rollback.
+
+        Args:
+            tables: Names of the tables whose indexes to defer
+        """
+        conn = self.get_connection()
+        placeholders = ", ".join("?" * len(tables))
+        indexes = conn.execute(
+            f"""
+            SELECT name, sql
+            FROM sqlite_master
+            WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})
+            """,
+            tables
+        ).fetchall()
+
+        for name, _ in indexes:
+            conn.execute(f'DROP INDEX "{name}"')
+        yield
+        for _, sql in indexes:
+            conn.execute(sql)
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the writer and all pooled reader connections."""
+        with self._readers_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers = []
+            self._readers = queue.Queue()
+
         if self._connection:
             self._connection.close()
             self._connection = None
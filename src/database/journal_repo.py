@@ -0,0 +1,47 @@
+"""Repository for the journal_meta table."""
+
+from .db_manager import db_manager
+
+
+class JournalRepository:
+    """Handle database operations for the journal_meta table."""
+
+    def get_applied_seq(self, journal_id: str) -> int:
+        """
+        Get the highest record of a journal already applied.
+
+        Args:
+            journal_id: ID from the journal file's header
+
+        Returns:
+            Sequence number, or 0 if nothing was applied yet
+        """
+        with db_manager.read_connection() as conn:
+            row = conn.execute(
+                "SELECT appliedSeq FROM journal_meta WHERE journalId = ?",
+                (journal_id,)
+            ).fetchone()
+        return row[0] if row is not None else 0
+
+    def set_applied_seq(self, journal_id: str, seq: int) -> None:
+        """
+        Record the highest record of a journal applied.
+
+        Call in the transaction that applies the records.
+
+        Args:
+            journal_id: ID from the journal file's header
+            seq: Sequence number of the last record applied
+        """
+        with db_manager.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO journal_meta (journalId, appliedSeq) VALUES (?, ?)
+                ON CONFLICT(journalId) DO UPDATE SET appliedSeq = excluded.appliedSeq
+                """,
+                (journal_id, seq)
+            )
+
+
+# Global repository instance
+journal_repo = JournalRepository()
@@ -0,0 +1,135 @@
+"""
+Versioned schema migrations tracked with PRAGMA user_version.
+
+Each migration runs in its own BEGIN IMMEDIATE transaction and bumps
+user_version in the same commit, so an interrupted upgrade resumes from
+the last completed migration and concurrent processes never apply one
+twice. A database that is already current costs a single pragma read.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from . import schema
+
+# Called before each statement with (step, total_steps, description)
+ProgressCallback = Callable[[int, int, str], None]
+
+
+def split_statements(script: str) -> Tuple[str, ...]:
+    """
+    Split an SQL script into single statements.
+
+    Statements are executed one at a time (rather than with executescript,
+    which commits first) so a migration stays inside its transaction.
+
+    Args:
+        script: One or more semicolon-terminated SQL statements
+
+    Returns:
+        Tuple of statements, with any leading comments attached
+    """
+    statements: List[str] = []
+    current = ''
+    for line in script.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ''
+    return tuple(statements)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema change, applied when user_version is below its version."""
+
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+
+
+MIGRATIONS = [
+    Migration(1, "Create the transactions and timeTracking tables", split_statements(
+        schema.CREATE_TRANSACTIONS_TABLE
+        + schema.CREATE_TRANSACTIONS_INDEXES
+        + schema.CREATE_TIMETRACKING_TABLE
+        + schema.CREATE_TIMETRACKING_ACTIVE_INDEX
+    )),
+    Migration(2, "Add covering indexes for paged and date-range reads", split_statements(
+        schema.CREATE_TIMETRACKING_COVERING_INDEXES
+    )),
+    Migration(3, "Add the project_totals rollup", split_statements(
+        schema.CREATE_PROJECT_TOTALS_TABLE
+        + schema.BACKFILL_PROJECT_TOTALS
+    )),
+    Migration(4, "Add the daily_rollup table", split_statements(
+        schema.CREATE_DAILY_ROLLUP_TABLE
+        + schema.BACKFILL_DAILY_ROLLUP
+    )),
+    Migration(5, "Move project names into a projects table with integer IDs", split_statements(
+        schema.CREATE_PROJECTS_TABLE
+        + schema.MIGRATE_TO_PROJECT_IDS
+    )),
+    Migration(6, "Add the journal_meta table", split_statements(
+        schema.CREATE_JOURNAL_META_TABLE
+    )),
+]
+
+# Schema version of a fully migrated database
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the database's PRAGMA user_version."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, progress: Optional[ProgressCallback] = None) -> int:
+    """
+    Apply any pending migrations.
+
+    Args:
+        conn: Writer connection, with no transaction open
+        progress: Optional callback invoked before each statement with
+            (step, total_steps, migration description)
+
+    Returns:
+        Number of migrations applied
+
+    Raises:
+        RuntimeError: If the database was created by a newer version
+    """
+    version = get_schema_version(conn)
+    if version == SCHEMA_VERSION:
+        return 0
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema version {version} is newer than this application "
+            f"supports ({SCHEMA_VERSION}). Upgrade the application."
+        )
+
+    total = sum(len(m.statements) for m in MIGRATIONS if m.version > version)
+    step = 0
+    applied = 0
+    while True:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-read under the write lock: another process may have migrated
+            version = get_schema_version(conn)
+            migration = next((m for m in MIGRATIONS if m.version > version), None)
+            if migration is None:
+                conn.commit()
+                return applied
+
+            for statement in migration.statements:
+                if progress is not None:
+                    progress(step, total, migration.description)
+                conn.execute(statement)
+                step += 1
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied += 1
@@ -0,0 +1,120 @@
+"""Repository for the projects registry."""
+
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from .db_manager import db_manager
+
+
+class ProjectRepository:
+    """
+    Handle database operations for the projects table.
+
+    Sessions, transactions and rollups refer to projects by integer
+    projectId; the name is stored once here, so renaming a project is a
+    single row update.
+    """
+
+    def get_id(self, project_name: str) -> Optional[int]:
+        """
+        Get a project's ID.
+
+        Args:
+            project_name: Name of the project
+
+        Returns:
+            Project ID, or None if the project is not registered
+        """
+        with db_manager.read_connection() as conn:
+            row = conn.execute(
+                "SELECT projectId FROM projects WHERE name = ?",
+                (project_name,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def get_or_create_id(self, project_name: str) -> int:
+        """
+        Get a project's ID, registering the project if it is new.
+
+        Runs inside db_manager.transaction(), so within an outer
+        transaction a new project is committed with the rows using it.
+
+        Args:
+            project_name: Name of the project
+
+        Returns:
+            Project ID
+        """
+        with db_manager.transaction() as conn:
+            conn.execute(
+                "INSERT INTO projects (name) VALUES (?) ON CONFLICT(name) DO NOTHING",
+                (project_name,)
+            )
+            return conn.execute(
+                "SELECT projectId FROM projects WHERE name = ?",
+                (project_name,)
+            ).fetchone()[0]
+
+    def get_or_create_ids(self, project_names: Iterable[str]) -> Dict[str, int]:
+        """
+        Get the IDs of several projects, registering any that are new.
+
+        Args:
+            project_names: Names of the projects
+
+        Returns:
+            Dictionary mapping each given name to its project ID
+        """
+        wanted = set(project_names)
+        with db_manager.transaction() as conn:
+            known = {name for (name,) in conn.execute("SELECT name FROM projects")}
+            missing = sorted(wanted - known)
+            if missing:
+                conn.executemany(
+                    "INSERT INTO projects (name) VALUES (?)",
+                    [(name,) for name in missing]
+                )
+            return {
+                name: project_id
+                for project_id, name in conn.execute("SELECT projectId, name FROM projects")
+                if name in wanted
+            }
+
+    def get_names(self) -> List[str]:
+        """
+        Get the names of all registered projects.
+
+        Returns:
+            Project names in alphabetical order
+        """
+        with db_manager.read_connection() as conn:
+            rows = conn.execute("SELECT name FROM projects ORDER BY name").fetchall()
+        return [row[0] for row in rows]
+
+    def rename(self, old_name: str, new_name: str) -> bool:
+        """
+        Rename a project; its history follows through the project ID.
+
+        Args:
+            old_name: Current name
+            new_name: New name
+
+        Returns:
+            True if renamed, False if no project is called old_name
+
+        Raises:
+            ValueError: If a project called new_name already exists
+        """
+        try:
+            with db_manager.transaction() as conn:
+                cursor = conn.execute(
+                    "UPDATE projects SET name = ? WHERE name = ?",
+                    (new_name, old_name)
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"A project called '{new_name}' already exists")
+        return cursor.rowcount == 1
+
+
+# Global repository instance
+project_repo = ProjectRepository()
@@ -0,0 +1,232 @@
+"""Repository for the incrementally maintained rollup tables."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils.time_utils import split_by_local_day
+from .db_manager import db_manager
+from .project_repo import project_repo
+from .schema import FILL_DAILY_ROLLUP
+from .tracking_repo import tracking_repo
+
+# SQL expressions mapping daily_rollup.day to each report bucket's key
+_BUCKET_EXPRESSIONS = {
+    'day': "day",
+    'week': "date(day, '-' || ((CAST(strftime('%w', day) AS INTEGER) + 6) % 7) || ' days')",
+    'month': "substr(day, 1, 7)",
+}
+
+
+class RollupRepository:
+    """Handle database operations for the project_totals and daily_rollup tables."""
+
+    def add_session(
+        self,
+        project_name: str,
+        start_time: int,
+        stop_time: int,
+        elapsed: int
+    ) -> None:
+        """
+        Add a completed session to the per-project and daily rollups.
+
+        Runs inside db_manager.transaction(), so when called within an
+        outer transaction the rollups are committed together with the
+        timeTracking update.
+
+        Args:
+            project_name: Name of the project
+            start_time: Unix timestamp when the session started
+            stop_time: Unix timestamp when the session stopped
+            elapsed: Session duration in seconds
+        """
+        with db_manager.transaction() as conn:
+            project_id = project_repo.get_or_create_id(project_name)
+            conn.execute(
+                """
+                INSERT INTO project_totals (projectId, totalSeconds, sessionCount)
+                VALUES (?, ?, 1)
+                ON CONFLICT(projectId) DO UPDATE SET
+                    totalSeconds = totalSeconds + excluded.totalSeconds,
+                    sessionCount = sessionCount + 1
+                """,
+                (project_id, elapsed)
+            )
+            conn.executemany(
+                """
+                INSERT INTO daily_rollup (day, projectId, totalSeconds)
+                VALUES (?, ?, ?)
+                ON CONFLICT(day, projectId) DO UPDATE SET
+                    totalSeconds = totalSeconds + excluded.totalSeconds
+                """,
+                [
+                    (day, project_id, seconds)
+                    for day, seconds in split_by_local_day(start_time, stop_time)
+                ]
+            )
+
+    def add_totals(
+        self,
+        project_totals: Iterable[Tuple[int, int, int]],
+        day_totals: Iterable[Tuple[str, int, int]]
+    ) -> None:
+        """
+        Add pre-aggregated session totals to both rollups.
+
+        Used after bulk inserts, where per-session upserts would dominate.
+        Runs inside db_manager.transaction() like add_session().
+
+        Args:
+            project_totals: (project_id, seconds, session_count) tuples
+            day_totals: (ISO date, project_id, seconds) tuples
+        """
+        with db_manager.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO project_totals (projectId, totalSeconds, sessionCount)
+                VALUES (?, ?, ?)
+                ON CONFLICT(projectId) DO UPDATE SET
+                    totalSeconds = totalSeconds + excluded.totalSeconds,
+                    sessionCount = sessionCount + excluded.sessionCount
+                """,
+                project_totals
+            )
+            conn.executemany(
+                """
+                INSERT INTO daily_rollup (day, projectId, totalSeconds)
+                VALUES (?, ?, ?)
+                ON CONFLICT(day, projectId) DO UPDATE SET
+                    totalSeconds = totalSeconds + excluded.totalSeconds
+                """,
+                day_totals
+            )
+
+    def get_project_totals(self) -> Dict[str, int]:
+        """
+        Get total time spent on each project from the rollup.
+
+        Costs O(projects) regardless of how many sessions are stored.
+
+        Returns:
+            Dictionary mapping project name to total seconds
+        """
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                SELECT p.name AS projectName, r.totalSeconds
+                FROM project_totals r
+                JOIN projects p ON p.projectId = r.projectId
+                """
+            )
+
+            rows = cursor.fetchall()
+        return {row['projectName']: row['totalSeconds'] for row in rows}
+
+    def rebuild_project_totals(self) -> int:
+        """
+        Recompute the per-project totals from the timeTracking table.
+
+        Returns:
+            Number of projects in the rebuilt rollup
+        """
+        with db_manager.transaction() as conn:
+            conn.execute("DELETE FROM project_totals")
+            cursor = conn.execute(
+                """
+                INSERT INTO project_totals (projectId, totalSeconds, sessionCount)
+                SELECT projectId, COALESCE(SUM(timeElapsed), 0), COUNT(*)
+                FROM timeTracking
+                WHERE stopTime IS NOT NULL
+                GROUP BY projectId
+                """
+            )
+            return cursor.rowcount
+
+    def rebuild_daily_rollup(self) -> int:
+        """
+        Recompute the daily rollup from the timeTracking table in bulk.
+
+        Returns:
+            Number of (day, project) rows in the rebuilt rollup
+        """
+        with db_manager.transaction() as conn:
+            conn.execute("DELETE FROM daily_rollup")
+            conn.execute(FILL_DAILY_ROLLUP.format(condition=""))
+            return conn.execute("SELECT COUNT(*) FROM daily_rollup").fetchone()[0]
+
+    def get_bucket_totals(
+        self,
+        bucket: str = 'day',
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Get total time per project per day, week or month from the daily rollup.
+
+        A range read on the (day, projectId) primary key; the cost
+        depends on the number of days in range, not on session count.
+
+        Args:
+            bucket: 'day', 'week' (weeks start on Monday) or 'month'
+            since: Optional first ISO date to include
+            until: Optional ISO date to stop before (exclusive)
+
+        Returns:
+            List of (bucket_key, project_name, seconds) tuples sorted by
+            bucket then project
+        """
+        if bucket not in _BUCKET_EXPRESSIONS:
+            raise ValueError(f"Unknown bucket: {bucket}")
+
+        conditions = []
+        params = []
+        if since is not None:
+            conditions.append("day >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("day < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f"""
+                SELECT {_BUCKET_EXPRESSIONS[bucket]} AS bucket, p.name AS projectName,
+                       SUM(r.totalSeconds) AS total
+                FROM daily_rollup r
+                JOIN projects p ON p.projectId = r.projectId
+                {where}
+                GROUP BY bucket, r.projectId
+                ORDER BY bucket, projectName
+                """,
+                params
+            )
+
+            rows = cursor.fetchall()
+        return [(row['bucket'], row['projectName'], row['total']) for row in rows]
+
+    def verify_project_totals(self) -> List[Tuple[str, int, int]]:
+        """
+        Compare the rollup against a full aggregate of timeTracking.
+
+        Returns:
+            List of (project_name, rollup_seconds, actual_seconds) tuples
+            for every project that disagrees; empty when consistent
+        """
+        actual = tracking_repo.get_project_totals()
+        rollup = self.get_project_totals()
+
+        mismatches = []
+        for project_name in sorted(set(actual) | set(rollup)):
+            rollup_seconds = rollup.get(project_name, 0)
+            actual_seconds = actual.get(project_name, 0)
+            if rollup_seconds != actual_seconds:
+                mismatches.append((project_name, rollup_seconds, actual_seconds))
+        return mismatches
+
+
+# Global repository instance
+rollup_repo = RollupRepository()
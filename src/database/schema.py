@@ -1,4 +1,15 @@
-"""Database schema definitions for the time tracking application."""
+"""
+Database schema definitions for the time tracking application.
+
+Statements are applied in order by the migrations in migrations.py. Those
+of versions 1-4 describe the original layout keyed by projectName TEXT and
+are kept as they were, so older databases upgrade step by step; they are
+idempotent (IF NOT EXISTS, guarded backfills) because databases created
+before schema versioning get every migration replayed once. Version 5
+moves project names into the projects registry and rebuilds the tables
+around integer project IDs. Version 6 adds the journal_meta bookkeeping
+table.
+"""
 
 CREATE_TRANSACTIONS_TABLE = """
 CREATE TABLE IF NOT EXISTS transactions (
@@ -28,20 +39,203 @@ CREATE TABLE IF NOT EXISTS timeTracking (
 );
 """
 
-CREATE_TIMETRACKING_INDEXES = """
-CREATE INDEX IF NOT EXISTS idx_timetracking_project
-    ON timeTracking(projectName);
-
+CREATE_TIMETRACKING_ACTIVE_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_timetracking_active
     ON timeTracking(stopTime) WHERE stopTime IS NULL;
 """
 
+CREATE_TIMETRACKING_COVERING_INDEXES = """
+-- Covering indexes for paged and date-range reads. entryId is listed right
+-- after startTime so "ORDER BY startTime DESC, entryId DESC" follows index
+-- order, and both are ascending so they can be walked backwards together.
+CREATE INDEX IF NOT EXISTS idx_timetracking_start_cover
+    ON timeTracking(startTime, entryId, projectName, stopTime, timeElapsed);
+
+CREATE INDEX IF NOT EXISTS idx_timetracking_project_start_cover
+    ON timeTracking(projectName, startTime, entryId, stopTime, timeElapsed);
+
+-- Superseded by the covering indexes above
+DROP INDEX IF EXISTS idx_timetracking_project;
+DROP INDEX IF EXISTS idx_timetracking_start;
+DROP INDEX IF EXISTS idx_timetracking_project_start;
+"""
+
+CREATE_PROJECT_TOTALS_TABLE = """
+CREATE TABLE IF NOT EXISTS project_totals (
+    projectName TEXT PRIMARY KEY,
+    totalSeconds INTEGER NOT NULL DEFAULT 0,
+    sessionCount INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Backfill the rollup for databases created before project_totals existed.
+# The NOT EXISTS guard is constant, so SQLite skips the scan once populated.
+BACKFILL_PROJECT_TOTALS = """
+INSERT INTO project_totals (projectName, totalSeconds, sessionCount)
+SELECT projectName, COALESCE(SUM(timeElapsed), 0), COUNT(*)
+FROM timeTracking
+WHERE stopTime IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM project_totals)
+GROUP BY projectName;
+"""
+
+CREATE_DAILY_ROLLUP_TABLE = """
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    day TEXT NOT NULL,  -- Local date, YYYY-MM-DD
+    projectName TEXT NOT NULL,
+    totalSeconds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, projectName)
+) WITHOUT ROWID;
+"""
+
+# Backfill for databases created before daily_rollup existed (the version 4
+# layout, keyed by projectName). See FILL_DAILY_ROLLUP for the method.
+BACKFILL_DAILY_ROLLUP = """
+WITH RECURSIVE pieces(projectName, pieceStart, pieceEnd, stopTime) AS (
+    SELECT projectName, startTime,
+           MIN(stopTime, CAST(strftime('%s', date(startTime, 'unixepoch', 'localtime', '+1 day'), 'utc') AS INTEGER)),
+           stopTime
+    FROM timeTracking
+    WHERE stopTime > startTime AND NOT EXISTS (SELECT 1 FROM daily_rollup)
+    UNION ALL
+    SELECT projectName, pieceEnd,
+           MIN(stopTime, CAST(strftime('%s', date(pieceEnd, 'unixepoch', 'localtime', '+1 day'), 'utc') AS INTEGER)),
+           stopTime
+    FROM pieces
+    WHERE pieceEnd < stopTime
+)
+INSERT INTO daily_rollup (day, projectName, totalSeconds)
+SELECT date(pieceStart, 'unixepoch', 'localtime'), projectName, SUM(pieceEnd - pieceStart)
+FROM pieces
+GROUP BY 1, 2;
+"""
+
+CREATE_PROJECTS_TABLE = """
+CREATE TABLE IF NOT EXISTS projects (
+    projectId INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+"""
+
+# Version 5: register every project name found in the history, then
+# rebuild each table with an integer projectId in place of projectName.
+# SQLite cannot change a column's type, so every table is copied into a
+# new one that is renamed over the old. The AUTOINCREMENT high-water marks
+# in sqlite_sequence are carried over so deleted IDs are never reused.
+MIGRATE_TO_PROJECT_IDS = """
+INSERT OR IGNORE INTO projects (name)
+SELECT projectName FROM timeTracking
+UNION SELECT projectName FROM transactions
+UNION SELECT projectName FROM project_totals
+UNION SELECT projectName FROM daily_rollup;
+
+CREATE TABLE transactions_v5 (
+    transactionId INTEGER PRIMARY KEY AUTOINCREMENT,
+    action TEXT NOT NULL CHECK(action IN ('Start', 'Stop')),
+    timeStamp INTEGER NOT NULL,
+    projectId INTEGER NOT NULL REFERENCES projects(projectId)
+);
+
+INSERT INTO transactions_v5 (transactionId, action, timeStamp, projectId)
+SELECT t.transactionId, t.action, t.timeStamp, p.projectId
+FROM transactions t JOIN projects p ON p.name = t.projectName;
+
+DELETE FROM sqlite_sequence WHERE name = 'transactions_v5';
+UPDATE sqlite_sequence SET name = 'transactions_v5' WHERE name = 'transactions';
+DROP TABLE transactions;
+ALTER TABLE transactions_v5 RENAME TO transactions;
+
+CREATE INDEX idx_transactions_project
+    ON transactions(projectId, timeStamp);
+
+CREATE INDEX idx_transactions_timestamp
+    ON transactions(timeStamp DESC);
+
+CREATE TABLE timeTracking_v5 (
+    entryId INTEGER PRIMARY KEY AUTOINCREMENT,
+    projectId INTEGER NOT NULL REFERENCES projects(projectId),
+    startTime INTEGER NOT NULL,
+    stopTime INTEGER,
+    timeElapsed INTEGER,
+    CHECK(stopTime IS NULL OR stopTime >= startTime)
+);
+
+INSERT INTO timeTracking_v5 (entryId, projectId, startTime, stopTime, timeElapsed)
+SELECT t.entryId, p.projectId, t.startTime, t.stopTime, t.timeElapsed
+FROM timeTracking t JOIN projects p ON p.name = t.projectName;
+
+DELETE FROM sqlite_sequence WHERE name = 'timeTracking_v5';
+UPDATE sqlite_sequence SET name = 'timeTracking_v5' WHERE name = 'timeTracking';
+DROP TABLE timeTracking;
+ALTER TABLE timeTracking_v5 RENAME TO timeTracking;
+
+CREATE INDEX idx_timetracking_active
+    ON timeTracking(stopTime) WHERE stopTime IS NULL;
+
+-- The covering indexes of version 2, with projectId in place of projectName
+CREATE INDEX idx_timetracking_start_cover
+    ON timeTracking(startTime, entryId, projectId, stopTime, timeElapsed);
+
+CREATE INDEX idx_timetracking_project_start_cover
+    ON timeTracking(projectId, startTime, entryId, stopTime, timeElapsed);
+
+CREATE TABLE project_totals_v5 (
+    projectId INTEGER PRIMARY KEY REFERENCES projects(projectId),
+    totalSeconds INTEGER NOT NULL DEFAULT 0,
+    sessionCount INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT INTO project_totals_v5 (projectId, totalSeconds, sessionCount)
+SELECT p.projectId, r.totalSeconds, r.sessionCount
+FROM project_totals r JOIN projects p ON p.name = r.projectName;
+
+DROP TABLE project_totals;
+ALTER TABLE project_totals_v5 RENAME TO project_totals;
+
+CREATE TABLE daily_rollup_v5 (
+    day TEXT NOT NULL,  -- Local date, YYYY-MM-DD
+    projectId INTEGER NOT NULL REFERENCES projects(projectId),
+    totalSeconds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, projectId)
+) WITHOUT ROWID;
+
+INSERT INTO daily_rollup_v5 (day, projectId, totalSeconds)
+SELECT r.day, p.projectId, r.totalSeconds
+FROM daily_rollup r JOIN projects p ON p.name = r.projectName;
+
+DROP TABLE daily_rollup;
+ALTER TABLE daily_rollup_v5 RENAME TO daily_rollup;
+"""
+
+# Version 6: highest toggle journal record applied, per journal file; set
+# in the same commit as the records so replaying a journal is idempotent
+CREATE_JOURNAL_META_TABLE = """
+CREATE TABLE IF NOT EXISTS journal_meta (
+    journalId TEXT PRIMARY KEY,
+    appliedSeq INTEGER NOT NULL
+);
+"""
 
-def get_schema_statements():
-    """Return all schema creation statements in order."""
-    return [
-        CREATE_TRANSACTIONS_TABLE,
-        CREATE_TRANSACTIONS_INDEXES,
-        CREATE_TIMETRACKING_TABLE,
-        CREATE_TIMETRACKING_INDEXES,
-    ]
+# Split every completed session at local midnights and sum the pieces per
+# (day, project). strftime('%s', <local date>, 'utc') yields the Unix time
+# of that local midnight, so DST days are handled by SQLite's localtime.
+# {condition} restricts the sessions considered.
+FILL_DAILY_ROLLUP = """
+WITH RECURSIVE pieces(projectId, pieceStart, pieceEnd, stopTime) AS (
+    SELECT projectId, startTime,
+           MIN(stopTime, CAST(strftime('%s', date(startTime, 'unixepoch', 'localtime', '+1 day'), 'utc') AS INTEGER)),
+           stopTime
+    FROM timeTracking
+    WHERE stopTime > startTime {condition}
+    UNION ALL
+    SELECT projectId, pieceEnd,
+           MIN(stopTime, CAST(strftime('%s', date(pieceEnd, 'unixepoch', 'localtime', '+1 day'), 'utc') AS INTEGER)),
+           stopTime
+    FROM pieces
+    WHERE pieceEnd < stopTime
+)
+INSERT INTO daily_rollup (day, projectId, totalSeconds)
+SELECT date(pieceStart, 'unixepoch', 'localtime'), projectId, SUM(pieceEnd - pieceStart)
+FROM pieces
+GROUP BY 1, 2;
+"""
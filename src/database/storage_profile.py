@@ -0,0 +1,63 @@
+"""SQLite storage profiles (journal mode, pragmas and connection pool size)."""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+_JOURNAL_MODES = {'WAL', 'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY'}
+_SYNCHRONOUS_MODES = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+_TEMP_STORES = {'DEFAULT', 'FILE', 'MEMORY'}
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """Connection settings applied by DatabaseManager."""
+
+    journal_mode: str = 'WAL'
+    synchronous: str = 'NORMAL'
+    mmap_size: int = 64 * 1024 * 1024  # Bytes, 0 disables memory mapping
+    cache_size: int = -16000  # Negative values are KiB, positive are pages
+    temp_store: str = 'MEMORY'
+    busy_timeout: float = 5.0  # Seconds to wait on a locked database
+    reader_count: int = 2  # Read-only connections; 0 reads on the writer
+
+    def __post_init__(self):
+        """Validate the profile so pragma values are safe to interpolate."""
+        if self.journal_mode.upper() not in _JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal_mode: {self.journal_mode}")
+        if self.synchronous.upper() not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Unsupported synchronous mode: {self.synchronous}")
+        if self.temp_store.upper() not in _TEMP_STORES:
+            raise ValueError(f"Unsupported temp_store: {self.temp_store}")
+        if self.reader_count < 0:
+            raise ValueError("reader_count must not be negative")
+
+    def connection_pragmas(self) -> List[str]:
+        """
+        Return the per-connection PRAGMA statements for this profile.
+
+        journal_mode is persistent in the database file, so it is applied
+        separately on the writer connection only.
+
+        Returns:
+            List of PRAGMA statements
+        """
+        return [
+            "PRAGMA foreign_keys = ON",
+            f"PRAGMA synchronous = {self.synchronous.upper()}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA temp_store = {self.temp_store.upper()}",
+        ]
+
+
+# Named profiles. "wal" suits local disks; "compat" keeps SQLite's default
+# rollback journal for filesystems without shared-memory support (e.g. NFS).
+STORAGE_PROFILES: Dict[str, StorageProfile] = {
+    'wal': StorageProfile(),
+    'compat': StorageProfile(
+        journal_mode='DELETE',
+        synchronous='FULL',
+        mmap_size=0,
+        reader_count=0,
+    ),
+}
@@ -1,9 +1,11 @@
 """Repository for timeTracking table operations."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..models.tracking_entry import TrackingEntry
+from ..utils.constants import STREAM_BATCH_SIZE
 from .db_manager import db_manager
+from .project_repo import project_repo
 
 
 class TrackingRepository:
@@ -13,6 +15,8 @@ class TrackingRepository:
         """
         Insert a new tracking entry (started but not stopped).
 
+        Registers the project first if it is new.
+
         Args:
             project_name: Name of the project
             start_time: Unix timestamp when tracking started
@@ -20,17 +24,14 @@ class TrackingRepository:
         Returns:
             Entry ID of the inserted record
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO timeTracking (projectName, startTime, stopTime, timeElapsed)
-            VALUES (?, ?, NULL, NULL)
-            """,
-            (project_name, start_time)
-        )
-        conn.commit()
+        with db_manager.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO timeTracking (projectId, startTime, stopTime, timeElapsed)
+                VALUES (?, ?, NULL, NULL)
+                """,
+                (project_repo.get_or_create_id(project_name), start_time)
+            )
 
         return cursor.lastrowid
 
@@ -48,18 +49,57 @@ class TrackingRepository:
             stop_time: Unix timestamp when tracking stopped
             elapsed: Total elapsed time in seconds
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
+        with db_manager.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE timeTracking
+                SET stopTime = ?, timeElapsed = ?
+                WHERE entryId = ?
+                """,
+                (stop_time, elapsed, entry_id)
+            )
+
+    def insert_completed_entries(self, sessions: Iterable[Tuple[int, int, int, int]]) -> None:
+        """
+        Insert completed sessions with a single executemany.
+
+        Args:
+            sessions: (project_id, start_time, stop_time, elapsed) tuples;
+                see project_repo.get_or_create_ids()
+        """
+        with db_manager.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO timeTracking (projectId, startTime, stopTime, timeElapsed)
+                VALUES (?, ?, ?, ?)
+                """,
+                sessions
+            )
+
+    def iter_intervals(
+        self,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Tuple[int, Optional[int]]]:
+        """
+        Stream the start and stop time of every session, oldest first.
+
+        Args:
+            batch_size: Number of rows fetched per round trip
 
-        cursor.execute(
+        Yields:
+            (startTime, stopTime) tuples; stopTime is None for the active
+            session
+        """
+        yield from db_manager.stream_query(
             """
-            UPDATE timeTracking
-            SET stopTime = ?, timeElapsed = ?
-            WHERE entryId = ?
+            SELECT startTime, stopTime
+            FROM timeTracking
+            ORDER BY startTime
             """,
-            (stop_time, elapsed, entry_id)
+            (),
+            batch_size,
+            None
         )
-        conn.commit()
 
     def get_active_entry(self) -> Optional[TrackingEntry]:
         """
@@ -68,28 +108,22 @@ class TrackingRepository:
         Returns:
             TrackingEntry object or None if no active tracking
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT entryId, projectName, startTime, stopTime, timeElapsed
-            FROM timeTracking
-            WHERE stopTime IS NULL
-            LIMIT 1
-            """
-        )
-
-        row = cursor.fetchone()
-        if row:
-            return TrackingEntry(
-                entry_id=row['entryId'],
-                project_name=row['projectName'],
-                start_time=row['startTime'],
-                stop_time=row['stopTime'],
-                time_elapsed=row['timeElapsed']
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = TrackingEntry.from_row
+
+            cursor.execute(
+                """
+                SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+                FROM timeTracking t
+                JOIN projects p ON p.projectId = t.projectId
+                WHERE t.stopTime IS NULL
+                LIMIT 1
+                """
             )
-        return None
+
+            entry = cursor.fetchone()
+        return entry
 
     def get_entry_by_id(self, entry_id: int) -> Optional[TrackingEntry]:
         """
@@ -101,28 +135,22 @@ class TrackingRepository:
         Returns:
             TrackingEntry object or None if not found
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT entryId, projectName, startTime, stopTime, timeElapsed
-            FROM timeTracking
-            WHERE entryId = ?
-            """,
-            (entry_id,)
-        )
-
-        row = cursor.fetchone()
-        if row:
-            return TrackingEntry(
-                entry_id=row['entryId'],
-                project_name=row['projectName'],
-                start_time=row['startTime'],
-                stop_time=row['stopTime'],
-                time_elapsed=row['timeElapsed']
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = TrackingEntry.from_row
+
+            cursor.execute(
+                """
+                SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+                FROM timeTracking t
+                JOIN projects p ON p.projectId = t.projectId
+                WHERE t.entryId = ?
+                """,
+                (entry_id,)
             )
-        return None
+
+            entry = cursor.fetchone()
+        return entry
 
     def get_entries_by_project(self, project_name: str) -> List[TrackingEntry]:
         """
@@ -134,31 +162,39 @@ class TrackingRepository:
         Returns:
             List of TrackingEntry objects
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_entries_by_project(project_name))
+
+    def iter_entries_by_project(
+        self,
+        project_name: str,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[TrackingEntry]:
+        """
+        Stream tracking entries for a specific project, newest first.
 
-        cursor.execute(
+        Rows are fetched in batches and converted lazily, so memory use
+        does not grow with the size of the history.
+
+        Args:
+            project_name: Name of the project
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            TrackingEntry objects
+        """
+        yield from db_manager.stream_query(
             """
-            SELECT entryId, projectName, startTime, stopTime, timeElapsed
-            FROM timeTracking
-            WHERE projectName = ?
-            ORDER BY startTime DESC
+            SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+            FROM timeTracking t
+            JOIN projects p ON p.projectId = t.projectId
+            WHERE t.projectId = (SELECT projectId FROM projects WHERE name = ?)
+            ORDER BY t.startTime DESC
             """,
-            (project_name,)
+            (project_name,),
+            batch_size,
+            TrackingEntry.from_row
         )
 
-        rows = cursor.fetchall()
-        return [
-            TrackingEntry(
-                entry_id=row['entryId'],
-                project_name=row['projectName'],
-                start_time=row['startTime'],
-                stop_time=row['stopTime'],
-                time_elapsed=row['timeElapsed']
-            )
-            for row in rows
-        ]
-
     def get_all_entries(self, completed_only: bool = False) -> List[TrackingEntry]:
         """
         Get all tracking entries.
@@ -169,59 +205,298 @@ class TrackingRepository:
         Returns:
             List of TrackingEntry objects
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_all_entries(completed_only))
+
+    def iter_all_entries(
+        self,
+        completed_only: bool = False,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[TrackingEntry]:
+        """
+        Stream all tracking entries, newest first.
+
+        Rows are fetched in batches and converted lazily, so memory use
+        does not grow with the size of the history.
 
+        Args:
+            completed_only: If True, only yield completed entries
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            TrackingEntry objects
+        """
         if completed_only:
             query = """
-                SELECT entryId, projectName, startTime, stopTime, timeElapsed
-                FROM timeTracking
-                WHERE stopTime IS NOT NULL
-                ORDER BY startTime DESC
+                SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+                FROM timeTracking t
+                JOIN projects p ON p.projectId = t.projectId
+                WHERE t.stopTime IS NOT NULL
+                ORDER BY t.startTime DESC
             """
         else:
             query = """
-                SELECT entryId, projectName, startTime, stopTime, timeElapsed
-                FROM timeTracking
-                ORDER BY startTime DESC
+                SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+                FROM timeTracking t
+                JOIN projects p ON p.projectId = t.projectId
+                ORDER BY t.startTime DESC
             """
 
-        cursor.execute(query)
-        rows = cursor.fetchall()
+        yield from db_manager.stream_query(query, (), batch_size, TrackingEntry.from_row)
+
+    def iter_entries_after(
+        self,
+        entry_id: int,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Tuple[int, str, int, Optional[int], Optional[int]]]:
+        """
+        Stream raw rows with an entry ID greater than the given one.
 
-        return [
-            TrackingEntry(
-                entry_id=row['entryId'],
-                project_name=row['projectName'],
-                start_time=row['startTime'],
-                stop_time=row['stopTime'],
-                time_elapsed=row['timeElapsed']
+        Yields plain tuples rather than TrackingEntry objects for bulk
+        consumers such as the columnar session store.
+
+        Args:
+            entry_id: Exclusive lower bound on entryId
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            (entryId, project name, startTime, stopTime, timeElapsed) tuples
+            in entryId order
+        """
+        yield from db_manager.stream_query(
+            """
+            SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+            FROM timeTracking t
+            JOIN projects p ON p.projectId = t.projectId
+            WHERE t.entryId > ?
+            ORDER BY t.entryId
+            """,
+            (entry_id,),
+            batch_size,
+            None
+        )
+
+    def get_entries_by_ids(self, entry_ids: List[int]) -> List[TrackingEntry]:
+        """
+        Get the tracking entries with the given IDs.
+
+        Args:
+            entry_ids: Entry IDs to retrieve
+
+        Returns:
+            List of TrackingEntry objects for the IDs that exist
+        """
+        if not entry_ids:
+            return []
+
+        placeholders = ', '.join('?' for _ in entry_ids)
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = TrackingEntry.from_row
+
+            cursor.execute(
+                f"""
+                SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+                FROM timeTracking t
+                JOIN projects p ON p.projectId = t.projectId
+                WHERE t.entryId IN ({placeholders})
+                """,
+                entry_ids
             )
-            for row in rows
-        ]
 
-    def get_project_totals(self) -> Dict[str, int]:
+            entries = cursor.fetchall()
+        return entries
+
+    def get_entries_page(
+        self,
+        project_name: Optional[str] = None,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 100,
+        since: Optional[int] = None,
+        until: Optional[int] = None
+    ) -> List[TrackingEntry]:
         """
-        Get total time spent on each project.
+        Get one page of tracking entries, newest first, using keyset pagination.
+
+        Seeks directly to the page through the covering startTime indexes,
+        so the cost of a page does not grow with the amount of history.
+
+        Args:
+            project_name: Optional project name to filter by
+            after: (start_time, entry_id) of the last entry of the previous
+                page, or None for the first page
+            limit: Maximum number of entries to return
+            since: Optional Unix timestamp; only sessions starting at or
+                after it are returned
+            until: Optional Unix timestamp; only sessions starting before
+                it are returned
 
         Returns:
-            Dictionary mapping project name to total seconds
+            List of TrackingEntry objects
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
+        conditions, params = _range_conditions(project_name, since, until)
+
+        if after is not None:
+            last_start, last_id = after
+            conditions.append("t.startTime <= ? AND (t.startTime < ? OR t.entryId < ?)")
+            params.extend([last_start, last_start, last_id])
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = TrackingEntry.from_row
+
+            cursor.execute(
+                f"""
+                SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+                FROM timeTracking t
+                JOIN projects p ON p.projectId = t.projectId
+                {where}
+                ORDER BY t.startTime DESC, t.entryId DESC
+                LIMIT ?
+                """,
+                params
+            )
 
-        cursor.execute(
-            """
-            SELECT projectName, SUM(timeElapsed) as total
-            FROM timeTracking
-            WHERE stopTime IS NOT NULL
-            GROUP BY projectName
-            """
+            entries = cursor.fetchall()
+        return entries
+
+    def iter_entries_in_range(
+        self,
+        project_name: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[TrackingEntry]:
+        """
+        Stream tracking entries filtered by project and start-time range.
+
+        Both filters are applied in SQL against the covering indexes.
+
+        Args:
+            project_name: Optional project name to filter by
+            since: Optional Unix timestamp; only sessions starting at or
+                after it are yielded
+            until: Optional Unix timestamp; only sessions starting before
+                it are yielded
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            TrackingEntry objects, newest first
+        """
+        conditions, params = _range_conditions(project_name, since, until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        yield from db_manager.stream_query(
+            f"""
+            SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+            FROM timeTracking t
+            JOIN projects p ON p.projectId = t.projectId
+            {where}
+            ORDER BY t.startTime DESC, t.entryId DESC
+            """,
+            params,
+            batch_size,
+            TrackingEntry.from_row
         )
 
-        rows = cursor.fetchall()
+    def iter_rows_in_range(
+        self,
+        project_name: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        completed_only: bool = False,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Tuple[int, str, int, Optional[int], Optional[int]]]:
+        """
+        Stream raw rows filtered by project and start-time range, oldest first.
+
+        The bulk counterpart of iter_entries_in_range for exports: plain
+        tuples in chronological order, read through the same covering
+        indexes.
+
+        Args:
+            project_name: Optional project name to filter by
+            since: Optional Unix timestamp; only sessions starting at or
+                after it are yielded
+            until: Optional Unix timestamp; only sessions starting before
+                it are yielded
+            completed_only: Skip the active session
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            (entryId, project name, startTime, stopTime, timeElapsed) tuples
+        """
+        conditions, params = _range_conditions(project_name, since, until)
+        if completed_only:
+            conditions.append("t.stopTime IS NOT NULL")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        yield from db_manager.stream_query(
+            f"""
+            SELECT t.entryId, p.name, t.startTime, t.stopTime, t.timeElapsed
+            FROM timeTracking t
+            JOIN projects p ON p.projectId = t.projectId
+            {where}
+            ORDER BY t.startTime, t.entryId
+            """,
+            params,
+            batch_size,
+            None
+        )
+
+    def get_project_totals(self) -> Dict[str, int]:
+        """
+        Get total time spent on each project by scanning timeTracking.
+
+        This is the authoritative aggregate used to rebuild and verify the
+        project_totals rollup; reports should read rollup_repo instead.
+
+        Returns:
+            Dictionary mapping project name to total seconds
+        """
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                SELECT p.name AS projectName, totals.total
+                FROM (
+                    SELECT projectId, SUM(timeElapsed) AS total
+                    FROM timeTracking
+                    WHERE stopTime IS NOT NULL
+                    GROUP BY projectId
+                ) AS totals
+                JOIN projects p ON p.projectId = totals.projectId
+                """
+            )
+
+            rows = cursor.fetchall()
         return {row['projectName']: row['total'] or 0 for row in rows}
 
 
+def _range_conditions(
+    project_name: Optional[str],
+    since: Optional[int],
+    until: Optional[int]
+) -> Tuple[List[str], List[Any]]:
+    """Build WHERE conditions and parameters for project/start-time filters."""
+    conditions: List[str] = []
+    params: List[Any] = []
+
+    if project_name is not None:
+        conditions.append("t.projectId = (SELECT projectId FROM projects WHERE name = ?)")
+        params.append(project_name)
+    if since is not None:
+        conditions.append("t.startTime >= ?")
+        params.append(since)
+    if until is not None:
+        conditions.append("t.startTime < ?")
+        params.append(until)
+
+    return conditions, params
+
+
 # Global repository instance
 tracking_repo = TrackingRepository()
@@ -1,9 +1,11 @@
 """Repository for transaction table operations."""
 
-from typing import List, Literal, Optional
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 from ..models.transaction import Transaction
+from ..utils.constants import STREAM_BATCH_SIZE
 from .db_manager import db_manager
+from .project_repo import project_repo
 
 
 class TransactionRepository:
@@ -18,6 +20,8 @@ class TransactionRepository:
         """
         Insert a new transaction record.
 
+        Registers the project first if it is new.
+
         Args:
             action: 'Start' or 'Stop'
             timestamp: Unix timestamp
@@ -26,20 +30,34 @@ class TransactionRepository:
         Returns:
             Transaction ID of the inserted record
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO transactions (action, timeStamp, projectName)
-            VALUES (?, ?, ?)
-            """,
-            (action, timestamp, project_name)
-        )
-        conn.commit()
+        with db_manager.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO transactions (action, timeStamp, projectId)
+                VALUES (?, ?, ?)
+                """,
+                (action, timestamp, project_repo.get_or_create_id(project_name))
+            )
 
         return cursor.lastrowid
 
+    def insert_transactions(self, transactions: Iterable[Tuple[str, int, int]]) -> None:
+        """
+        Insert transaction records with a single executemany.
+
+        Args:
+            transactions: (action, timestamp, project_id) tuples; see
+                project_repo.get_or_create_ids()
+        """
+        with db_manager.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO transactions (action, timeStamp, projectId)
+                VALUES (?, ?, ?)
+                """,
+                transactions
+            )
+
     def get_transactions_by_project(self, project_name: str) -> List[Transaction]:
         """
         Get all transactions for a specific project.
@@ -50,30 +68,39 @@ class TransactionRepository:
         Returns:
             List of Transaction objects
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_transactions_by_project(project_name))
+
+    def iter_transactions_by_project(
+        self,
+        project_name: str,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Transaction]:
+        """
+        Stream transactions for a specific project, newest first.
+
+        Rows are fetched in batches and converted lazily, so memory use
+        does not grow with the size of the history.
 
-        cursor.execute(
+        Args:
+            project_name: Name of the project
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Transaction objects
+        """
+        yield from db_manager.stream_query(
             """
-            SELECT transactionId, action, timeStamp, projectName
-            FROM transactions
-            WHERE projectName = ?
-            ORDER BY timeStamp DESC
+            SELECT t.transactionId, t.action, t.timeStamp, p.name
+            FROM transactions t
+            JOIN projects p ON p.projectId = t.projectId
+            WHERE t.projectId = (SELECT projectId FROM projects WHERE name = ?)
+            ORDER BY t.timeStamp DESC
             """,
-            (project_name,)
+            (project_name,),
+            batch_size,
+            Transaction.from_row
         )
 
-        rows = cursor.fetchall()
-        return [
-            Transaction(
-                transaction_id=row['transactionId'],
-                action=row['action'],
-                timestamp=row['timeStamp'],
-                project_name=row['projectName']
-            )
-            for row in rows
-        ]
-
     def get_recent_transactions(self, limit: int = 50) -> List[Transaction]:
         """
         Get recent transactions across all projects.
@@ -84,29 +111,83 @@ class TransactionRepository:
         Returns:
             List of Transaction objects
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = Transaction.from_row
+
+            cursor.execute(
+                """
+                SELECT t.transactionId, t.action, t.timeStamp, p.name
+                FROM transactions t
+                JOIN projects p ON p.projectId = t.projectId
+                ORDER BY t.timeStamp DESC
+                LIMIT ?
+                """,
+                (limit,)
+            )
 
-        cursor.execute(
-            """
-            SELECT transactionId, action, timeStamp, projectName
-            FROM transactions
-            ORDER BY timeStamp DESC
-            LIMIT ?
-            """,
-            (limit,)
-        )
+            transactions = cursor.fetchall()
+        return transactions
+
+    def get_recent_projects(self, limit: int, scan_rows: int) -> List[str]:
+        """
+        Get the most recently used projects, most recent first.
 
-        rows = cursor.fetchall()
-        return [
-            Transaction(
-                transaction_id=row['transactionId'],
-                action=row['action'],
-                timestamp=row['timeStamp'],
-                project_name=row['projectName']
+        Walks idx_transactions_timestamp backwards and stops as soon as
+        `limit` distinct projects were seen, so the cost depends on recent
+        history only, never on the number of projects.
+
+        Args:
+            limit: Maximum number of projects to return
+            scan_rows: Maximum number of transactions to read
+
+        Returns:
+            Project names, possibly fewer than limit
+        """
+        names: Dict[str, None] = {}
+        with db_manager.read_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT p.name
+                FROM transactions t
+                JOIN projects p ON p.projectId = t.projectId
+                ORDER BY t.timeStamp DESC, t.transactionId DESC
+                LIMIT ?
+                """,
+                (scan_rows,)
             )
-            for row in rows
-        ]
+            for (name,) in cursor:
+                names[name] = None
+                if len(names) == limit:
+                    break
+            # Reset the statement so it does not hold the read snapshot open
+            cursor.close()
+        return list(names)
+
+    def get_last_used(self) -> Dict[str, int]:
+        """
+        Get when each project was last started or stopped.
+
+        Runs one MAX() per project, each answered by a single seek into
+        idx_transactions_project, so the cost grows with the number of
+        projects rather than the length of the history.
+
+        Returns:
+            Dictionary mapping project name to the Unix timestamp of its
+            latest transaction; projects never tracked are left out
+        """
+        with db_manager.read_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT p.name, (
+                    SELECT MAX(t.timeStamp)
+                    FROM transactions t
+                    WHERE t.projectId = p.projectId
+                )
+                FROM projects p
+                """
+            ).fetchall()
+        return {name: last_used for name, last_used in rows if last_used is not None}
 
     def get_last_transaction_for_project(
         self,
@@ -121,29 +202,24 @@ class TransactionRepository:
         Returns:
             Transaction object or None if no transactions exist
         """
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT transactionId, action, timeStamp, projectName
-            FROM transactions
-            WHERE projectName = ?
-            ORDER BY timeStamp DESC
-            LIMIT 1
-            """,
-            (project_name,)
-        )
-
-        row = cursor.fetchone()
-        if row:
-            return Transaction(
-                transaction_id=row['transactionId'],
-                action=row['action'],
-                timestamp=row['timeStamp'],
-                project_name=row['projectName']
+        with db_manager.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = Transaction.from_row
+
+            cursor.execute(
+                """
+                SELECT t.transactionId, t.action, t.timeStamp, p.name
+                FROM transactions t
+                JOIN projects p ON p.projectId = t.projectId
+                WHERE t.projectId = (SELECT projectId FROM projects WHERE name = ?)
+                ORDER BY t.timeStamp DESC
+                LIMIT 1
+                """,
+                (project_name,)
             )
-        return None
+
+            transaction = cursor.fetchone()
+        return transaction
 
 
 # Global repository instance
@@ -1,10 +1,21 @@
 """Entry point for the time tracker application."""
 
-from .app import TimeTrackerApp
+import sys
 
 
 def main():
-    """Run the time tracker application."""
+    """
+    Run the time tracker.
+
+    With no arguments the Textual TUI starts. With arguments (e.g.
+    "start <project>", "stop", "status", "summary") the headless CLI runs
+    instead, without importing Textual or any screen module.
+    """
+    if len(sys.argv) > 1:
+        from .cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    from .app import TimeTrackerApp
     app = TimeTrackerApp()
     app.run()
 
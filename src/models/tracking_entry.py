@@ -1,14 +1,23 @@
 """Tracking entry model for time tracking sessions."""
 
+import sqlite3
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from sys import intern
 from typing import Optional
 
 
 @dataclass
 class TrackingEntry:
-    """Represents a time tracking session."""
+    """
+    Represents a time tracking session.
+
+    Uses __slots__ instead of a per-instance __dict__ because reports and
+    exports can hold hundreds of thousands of entries at once.
+    """
+
+    __slots__ = ('entry_id', 'project_name', 'start_time', 'stop_time', 'time_elapsed')
 
     entry_id: Optional[int]
     project_name: str
@@ -16,6 +25,17 @@ class TrackingEntry:
     stop_time: Optional[int]  # None if currently running
     time_elapsed: Optional[int]  # Seconds, None if currently running
 
+    @classmethod
+    def from_row(cls, cursor: sqlite3.Cursor, row: tuple) -> 'TrackingEntry':
+        """
+        Build an entry positionally; usable as a cursor row_factory.
+
+        The query must select entryId, projectName, startTime, stopTime,
+        timeElapsed in that order. Project names are interned so entries
+        for the same project share one string.
+        """
+        return cls(row[0], intern(row[1]), row[2], row[3], row[4])
+
     @property
     def is_active(self) -> bool:
         """Check if this tracking session is currently active."""
@@ -1,19 +1,37 @@
 """Transaction model for tracking start/stop events."""
 
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
+from sys import intern
 from typing import Literal, Optional
 
 
 @dataclass
 class Transaction:
-    """Represents a single start or stop transaction."""
+    """
+    Represents a single start or stop transaction.
+
+    Slotted like TrackingEntry to keep large result sets compact.
+    """
+
+    __slots__ = ('transaction_id', 'action', 'timestamp', 'project_name')
 
     transaction_id: Optional[int]
     action: Literal['Start', 'Stop']
     timestamp: int  # Unix timestamp (seconds since epoch)
     project_name: str
 
+    @classmethod
+    def from_row(cls, cursor: sqlite3.Cursor, row: tuple) -> 'Transaction':
+        """
+        Build a transaction positionally; usable as a cursor row_factory.
+
+        The query must select transactionId, action, timeStamp, projectName
+        in that order. Action and project strings are interned.
+        """
+        return cls(row[0], intern(row[1]), row[2], intern(row[3]))
+
     @property
     def datetime(self) -> datetime:
         """Convert Unix timestamp to datetime object."""
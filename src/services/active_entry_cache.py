@@ -0,0 +1,20 @@
+"""In-process cache of the active tracking entry."""
+
+from typing import Optional
+
+from ..database.tracking_repo import tracking_repo
+from ..models.tracking_entry import TrackingEntry
+from .data_version_cache import DataVersionCache
+
+
+class ActiveEntryCache(DataVersionCache[Optional[TrackingEntry]]):
+    """
+    Cache the active tracking entry between database writes.
+
+    Writes made through TrackingService update the cache directly; most
+    status reads cost no query against timeTracking.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        super().__init__(tracking_repo.get_active_entry)
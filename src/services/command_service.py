@@ -0,0 +1,147 @@
+"""Tracking commands as JSON-serializable requests and replies."""
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from ..models.tracking_entry import TrackingEntry
+from .project_service import ProjectService, project_service
+from .tracking_service import TrackingService, tracking_service
+
+Reply = Dict[str, Any]
+
+
+def _entry_to_dict(entry: Optional[TrackingEntry]) -> Optional[Dict[str, Any]]:
+    """Convert a tracking entry to a plain dictionary for a reply."""
+    if entry is None:
+        return None
+    return {
+        'entry_id': entry.entry_id,
+        'project_name': entry.project_name,
+        'start_time': entry.start_time,
+        'stop_time': entry.stop_time,
+        'time_elapsed': entry.time_elapsed,
+    }
+
+
+def _error(error: str, message: str) -> Reply:
+    """Build a failed reply."""
+    return {'ok': False, 'error': error, 'message': message}
+
+
+class CommandService:
+    """
+    Execute start/stop/status/summary/rename requests.
+
+    A request is a dictionary with a 'command' key plus its arguments, and
+    every reply is a dictionary with an 'ok' key, so the same handler
+    serves the CLI directly and the daemon over its socket.
+    """
+
+    COMMANDS = ('start', 'stop', 'status', 'summary', 'rename')
+
+    def __init__(
+        self,
+        tracking: TrackingService = tracking_service,
+        projects: ProjectService = project_service
+    ):
+        """
+        Initialize the command service.
+
+        Args:
+            tracking: Tracking service to run commands against
+            projects: Project service used to validate project names
+        """
+        self.tracking = tracking
+        self.projects = projects
+
+    def get_projects(self) -> List[str]:
+        """
+        Get the project list from the project service's cached catalog.
+
+        New names are registered in the projects table as they are read.
+
+        Returns:
+            List of project names
+        """
+        return self.projects.sync_projects()
+
+    def handle(self, request: Dict[str, Any]) -> Reply:
+        """
+        Execute one request.
+
+        Args:
+            request: Dictionary with 'command' and the command's arguments
+
+        Returns:
+            Reply dictionary; 'ok' is False with 'error' and 'message' set
+            when the request failed
+        """
+        command = request.get('command') if isinstance(request, dict) else None
+        if command not in self.COMMANDS:
+            return _error('bad_request', f"Unknown command {command!r}")
+
+        try:
+            return getattr(self, f'_do_{command}')(request)
+        except (KeyError, TypeError, ValueError) as error:
+            return _error('bad_request', f"Invalid {command} request: {error}")
+
+    def _do_start(self, request: Dict[str, Any]) -> Reply:
+        """Start tracking request['project']."""
+        project_name = str(request['project']).strip()
+        if not self.projects.is_valid_project(project_name):
+            return _error(
+                'unknown_project',
+                f"Unknown project '{project_name}'. Add it to projects.txt first."
+            )
+
+        success, message, entry = self.tracking.start_tracking(project_name)
+        if not success:
+            return _error('already_tracking', message)
+        return {'ok': True, 'message': message, 'entry': _entry_to_dict(entry)}
+
+    def _do_stop(self, request: Dict[str, Any]) -> Reply:
+        """Stop the active session."""
+        success, message, entry = self.tracking.stop_tracking()
+        if not success:
+            return _error('not_tracking', message)
+        return {'ok': True, 'message': message, 'entry': _entry_to_dict(entry)}
+
+    def _do_status(self, request: Dict[str, Any]) -> Reply:
+        """Report the active session, if any."""
+        return {'ok': True, 'entry': _entry_to_dict(self.tracking.get_current_status())}
+
+    def _do_summary(self, request: Dict[str, Any]) -> Reply:
+        """
+        Report totals per project, or per project and period.
+
+        Optional arguments are 'by' ('day', 'week' or 'month') and 'since'
+        and 'until' as YYYY-MM-DD strings.
+        """
+        bucket = request.get('by')
+        if bucket is None:
+            return {'ok': True, 'totals': self.tracking.get_summary_report()}
+
+        if bucket not in ('day', 'week', 'month'):
+            return _error('bad_request', f"Unknown bucket {bucket!r}")
+        since = request.get('since')
+        until = request.get('until')
+        rows = self.tracking.get_bucketed_report(
+            bucket,
+            date.fromisoformat(since) if since else None,
+            date.fromisoformat(until) if until else None
+        )
+        return {'ok': True, 'rows': [list(row) for row in rows]}
+
+    def _do_rename(self, request: Dict[str, Any]) -> Reply:
+        """Rename project request['old'] to request['new']."""
+        old_name = str(request['old']).strip()
+        new_name = str(request['new']).strip()
+        try:
+            self.projects.rename_project(old_name, new_name)
+        except KeyError:
+            return _error('unknown_project', f"Unknown project '{old_name}'")
+        return {'ok': True, 'message': f"Renamed '{old_name}' to '{new_name}'"}
+
+
+# Global service instance
+command_service = CommandService()
@@ -0,0 +1,89 @@
+"""Base class for in-process caches invalidated by PRAGMA data_version."""
+
+import sqlite3
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+from ..database.db_manager import db_manager
+
+T = TypeVar('T')
+
+
+class DataVersionCache(Generic[T]):
+    """
+    Cache a value read from the database between database writes.
+
+    Writes made in this process update the cache directly with set().
+    Changes committed by other connections or processes are detected with
+    PRAGMA data_version, which is answered without touching the tables, so
+    most reads cost no query. A new writer connection (the database was
+    reopened) also forces a reload, since its data_version starts over.
+    The cache may be used from several threads.
+    """
+
+    def __init__(self, load: Callable[[], T]):
+        """
+        Initialize an empty cache.
+
+        Args:
+            load: Function reading the value from the database
+        """
+        self._load = load
+        self._value: Optional[T] = None
+        self._data_version: Optional[int] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """
+        Get the value, reloading it only if the data changed.
+
+        Returns:
+            Cached value; do not modify it
+        """
+        with self._lock:
+            connection = db_manager.get_connection()
+            version = db_manager.get_data_version()
+            if (self._data_version is None
+                    or version != self._data_version
+                    or connection is not self._connection):
+                # Record the version before reading so a concurrent commit is
+                # noticed on the next call rather than missed
+                self._value = self._load()
+                self._data_version = version
+                self._connection = connection
+            return self._value
+
+    def set(self, value: T) -> None:
+        """
+        Record the value after this process changed it in the database.
+
+        Call inside the write transaction so no outside commit can land
+        between the write and the recorded data_version.
+
+        Args:
+            value: New value
+        """
+        with self._lock:
+            self._value = value
+            self._data_version = db_manager.get_data_version()
+            self._connection = db_manager.get_connection()
+
+    def update(self, change: Callable[[T], T]) -> None:
+        """
+        Edit the cached value in place of a reload, keeping its version.
+
+        For changes this process knows about but that need no write
+        transaction; does nothing if no value is loaded.
+
+        Args:
+            change: Function returning the new value from the current one
+        """
+        with self._lock:
+            if self._data_version is not None:
+                self._value = change(self._value)
+
+    def invalidate(self) -> None:
+        """Force the next get() to reload from the database."""
+        with self._lock:
+            self._data_version = None
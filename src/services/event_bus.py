@@ -0,0 +1,158 @@
+"""In-process publish/subscribe bus for tracking events."""
+
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar
+
+from ..models.tracking_entry import TrackingEntry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TrackingEvent:
+    """Base class of all events; subscribe to it to receive every event."""
+
+
+@dataclass(frozen=True)
+class TrackingStarted(TrackingEvent):
+    """A session was started, and committed or journaled."""
+
+    entry: TrackingEntry
+
+
+@dataclass(frozen=True)
+class TrackingStopped(TrackingEvent):
+    """A session was stopped, and committed (rollups included) or journaled."""
+
+    entry: TrackingEntry
+
+
+@dataclass(frozen=True)
+class SessionsImported(TrackingEvent):
+    """Completed sessions were bulk imported and committed."""
+
+    count: int
+    project_names: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class TotalsRebuilt(TrackingEvent):
+    """A rollup table was rebuilt from session history."""
+
+    rollup: str  # 'project_totals' or 'daily_rollup'
+
+
+@dataclass(frozen=True)
+class ProjectRenamed(TrackingEvent):
+    """A project was renamed; its history now reports under the new name."""
+
+    old_name: str
+    new_name: str
+
+
+@dataclass(frozen=True)
+class JournalFlushed(TrackingEvent):
+    """Journaled starts and stops were committed, from the flusher thread."""
+
+    applied: int
+    skipped: int  # records that conflicted with the database's state
+
+
+@dataclass(frozen=True)
+class ActiveEntryReloaded(TrackingEvent):
+    """Another process started or stopped a session, seen by the journal's flusher."""
+
+    entry: Optional[TrackingEntry]
+
+
+E = TypeVar('E', bound=TrackingEvent)
+Handler = Callable[[Any], Any]
+
+
+class EventBus:
+    """
+    Deliver events to the subscribers of their type.
+
+    Events are published once the write they describe is durable. That
+    is normally after it has committed, so subscribers can read the
+    database safely. Starts and stops taken through the tracking service's
+    journal are published once journaled, ahead of the database; the
+    tracking service's status and reports include them meanwhile, and
+    JournalFlushed follows when they are committed. A subscriber to a base
+    class receives its subclasses too. Plain functions run synchronously
+    in publish(); coroutine functions are scheduled on the running event
+    loop (the TUI's or the daemon's), or run to completion when published
+    outside one. A failing subscriber is logged and does not stop the
+    others, since the write has already happened.
+    """
+
+    def __init__(self):
+        """Initialize a bus with no subscribers."""
+        self._handlers: Dict[Type[TrackingEvent], List[Handler]] = {}
+        self._tasks: Set['asyncio.Task'] = set()
+
+    def subscribe(self, event_type: Type[E], handler: Callable[[E], Any]) -> Callable[[], None]:
+        """
+        Subscribe a handler to an event type and its subclasses.
+
+        Args:
+            event_type: Event class to receive
+            handler: Function or coroutine function taking the event
+
+        Returns:
+            Function that removes the subscription
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+        def unsubscribe() -> None:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+        return unsubscribe
+
+    def publish(self, event: TrackingEvent) -> None:
+        """
+        Deliver an event to every matching subscriber.
+
+        Args:
+            event: Event to deliver
+        """
+        for event_type in type(event).__mro__:
+            for handler in list(self._handlers.get(event_type, ())):
+                try:
+                    if inspect.iscoroutinefunction(handler):
+                        self._schedule(handler, event)
+                    else:
+                        handler(event)
+                except Exception:
+                    logger.exception("Subscriber %r failed on %r", handler, event)
+
+    def _schedule(self, handler: Handler, event: TrackingEvent) -> None:
+        """Run an async subscriber on the current loop, or to completion."""
+        # Imported here: asyncio is slow to import and the command line
+        # never has async subscribers
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(handler(event))
+            return
+
+        task = loop.create_task(handler(event))
+        # Keep a reference until done so the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: 'asyncio.Task') -> None:
+        """Forget a finished async subscriber, logging any failure."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Async subscriber failed", exc_info=task.exception())
+
+
+# Global bus instance
+event_bus = EventBus()
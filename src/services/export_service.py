@@ -0,0 +1,344 @@
+"""Service for streaming tracking sessions out to files."""
+
+import csv
+import json
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from ..database.tracking_repo import tracking_repo
+from ..utils.constants import EXPORT_CHUNK_ROWS
+from ..utils.time_utils import local_midnight
+
+Row = Tuple[int, str, int, Optional[int], Optional[int]]
+
+FIELDS = ('entry_id', 'project', 'start', 'stop', 'elapsed')
+
+# Columnar file layout (all integers little-endian):
+#   MAGIC
+#   chunks: uint32 row count (0 ends the file), uint32 payload length,
+#           zlib-compressed payload
+#   payload: uint32 count of new project names, then each name as uint32
+#            length + UTF-8 bytes (ids continue from earlier chunks);
+#            then the columns entry_id, start_time, stop_time,
+#            time_elapsed as int64[rows] (NULL_INT64 for NULL) and
+#            project_id as int32[rows]
+# Version 01 files, still readable, stored name lengths as uint16.
+COLUMNAR_MAGIC = b"TTCOLS02"
+NULL_INT64 = -(2 ** 63)
+_CHUNK_HEADER = struct.Struct('<II')
+# Name length field by file version
+_NAME_LENGTHS = {
+    COLUMNAR_MAGIC: struct.Struct('<I'),
+    b"TTCOLS01": struct.Struct('<H'),
+}
+
+_SUFFIX_FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.ttc': 'columnar',
+    '.parquet': 'parquet',
+}
+
+
+@lru_cache(maxsize=None)
+def _pyarrow():
+    """Import pyarrow on first use; Parquet export is optional."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _iso(timestamp: Optional[int]) -> Optional[str]:
+    """Format a Unix timestamp as local ISO 8601 with its UTC offset."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).astimezone().isoformat()
+
+
+def _little_endian(column: array) -> bytes:
+    """Return an array's bytes in little-endian order."""
+    if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _chunks(rows: Iterator[Row]) -> Iterator[List[Row]]:
+    """Group rows into lists of up to EXPORT_CHUNK_ROWS."""
+    while True:
+        chunk = list(islice(rows, EXPORT_CHUNK_ROWS))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _decode_chunk(
+    payload: bytes,
+    count: int,
+    projects: List[str],
+    name_length: struct.Struct
+) -> Dict[str, list]:
+    """
+    Decode one decompressed chunk of a columnar export.
+
+    Args:
+        payload: Decompressed chunk payload
+        count: Number of rows in the chunk
+        projects: Project names of earlier chunks; extended in place
+        name_length: Format of the project name lengths
+
+    Returns:
+        Dictionary of column name to list of values
+
+    Raises:
+        struct.error, IndexError, ValueError: If the payload is malformed
+    """
+    (new_names,) = struct.unpack_from('<I', payload)
+    offset = 4
+    for _ in range(new_names):
+        (size,) = name_length.unpack_from(payload, offset)
+        offset += name_length.size
+        projects.append(payload[offset:offset + size].decode('utf-8'))
+        offset += size
+
+    columns = {}
+    for name, typecode in (('entry_id', 'q'), ('start_time', 'q'),
+                           ('stop_time', 'q'), ('time_elapsed', 'q'),
+                           ('project_id', 'i')):
+        column = array(typecode)
+        end = offset + count * column.itemsize
+        if end > len(payload):
+            raise ValueError("column runs past the end of the chunk")
+        column.frombytes(payload[offset:end])
+        if sys.byteorder == 'big':
+            column.byteswap()
+        columns[name] = column
+        offset = end
+
+    return {
+        'entry_id': list(columns['entry_id']),
+        'project': [projects[i] for i in columns['project_id']],
+        'start_time': list(columns['start_time']),
+        'stop_time': [None if v == NULL_INT64 else v for v in columns['stop_time']],
+        'time_elapsed': [None if v == NULL_INT64 else v for v in columns['time_elapsed']],
+    }
+
+
+def read_columnar(path: Path) -> Iterator[Dict[str, list]]:
+    """
+    Read a columnar export chunk by chunk.
+
+    Args:
+        path: File written with the 'columnar' format
+
+    Yields:
+        Dictionaries of column name to list of values, one per chunk:
+        'entry_id', 'project', and Unix-time 'start_time', 'stop_time'
+        and 'time_elapsed' (None for NULL)
+
+    Raises:
+        ValueError: If the file is not a columnar export, or is truncated
+            or corrupt
+    """
+    projects: List[str] = []
+    with path.open('rb') as source:
+        name_length = _NAME_LENGTHS.get(source.read(len(COLUMNAR_MAGIC)))
+        if name_length is None:
+            raise ValueError(f"{path.name} is not a columnar time tracker export")
+
+        while True:
+            header = source.read(_CHUNK_HEADER.size)
+            if len(header) != _CHUNK_HEADER.size:
+                raise ValueError(f"{path.name} is truncated or corrupt")
+            count, length = _CHUNK_HEADER.unpack(header)
+            if count == 0:
+                return
+            compressed = source.read(length)
+            if len(compressed) != length:
+                raise ValueError(f"{path.name} is truncated or corrupt")
+
+            try:
+                chunk = _decode_chunk(zlib.decompress(compressed), count, projects, name_length)
+            except (struct.error, zlib.error, IndexError, ValueError) as exc:
+                raise ValueError(f"{path.name} is truncated or corrupt") from exc
+            yield chunk
+
+
+class ExportService:
+    """
+    Stream sessions from the database to CSV, JSON Lines, a compact
+    columnar binary file or (with pyarrow installed) Parquet.
+
+    Rows are read in chunks through the covering indexes and written as
+    they arrive, so memory use does not grow with the size of the export.
+    """
+
+    FORMATS = ('csv', 'jsonl', 'columnar', 'parquet')
+
+    def export(
+        self,
+        target: Path,
+        file_format: Optional[str] = None,
+        project_name: Optional[str] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        completed_only: bool = False
+    ) -> int:
+        """
+        Export sessions, oldest first.
+
+        Args:
+            target: Output file, or '-' for standard output (text formats)
+            file_format: 'csv', 'jsonl', 'columnar' or 'parquet'; guessed
+                from the suffix when None
+            project_name: Optional project name to filter by
+            since: Optional first local date to include
+            until: Optional local date to stop before (exclusive)
+            completed_only: Leave out the active session
+
+        Returns:
+            Number of sessions exported
+
+        Raises:
+            ValueError: If the format is unknown or unusable for the target
+            RuntimeError: If Parquet is requested without pyarrow installed
+        """
+        to_stdout = str(target) == '-'
+        if file_format is None:
+            file_format = 'csv' if to_stdout else _SUFFIX_FORMATS.get(target.suffix.lower())
+        if file_format not in self.FORMATS:
+            raise ValueError(
+                f"Unknown export format for {target}; use {', '.join(self.FORMATS)}"
+            )
+        if to_stdout and file_format not in ('csv', 'jsonl'):
+            raise ValueError(f"The {file_format} format cannot be written to standard output")
+        if file_format == 'parquet' and _pyarrow() is None:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+
+        rows = tracking_repo.iter_rows_in_range(
+            project_name,
+            local_midnight(since) if since is not None else None,
+            local_midnight(until) if until is not None else None,
+            completed_only,
+            EXPORT_CHUNK_ROWS
+        )
+
+        if file_format == 'parquet':
+            return self._write_parquet(target, rows)
+        if file_format == 'columnar':
+            with target.open('wb') as stream:
+                return self._write_columnar(stream, rows)
+
+        write = self._write_csv if file_format == 'csv' else self._write_jsonl
+        if to_stdout:
+            return write(sys.stdout, rows)
+        with target.open('w', newline='', encoding='utf-8') as stream:
+            return write(stream, rows)
+
+    @staticmethod
+    def _write_csv(stream: IO[str], rows: Iterator[Row]) -> int:
+        """Write rows as CSV with a header; times as local ISO 8601."""
+        writer = csv.writer(stream)
+        writer.writerow(FIELDS)
+        count = 0
+        for chunk in _chunks(rows):
+            writer.writerows(
+                (entry_id, project, _iso(start), _iso(stop) or '', '' if elapsed is None else elapsed)
+                for entry_id, project, start, stop, elapsed in chunk
+            )
+            count += len(chunk)
+        return count
+
+    @staticmethod
+    def _write_jsonl(stream: IO[str], rows: Iterator[Row]) -> int:
+        """Write rows as one JSON object per line; times as local ISO 8601."""
+        count = 0
+        for chunk in _chunks(rows):
+            stream.writelines(
+                json.dumps(dict(zip(FIELDS, (entry_id, project, _iso(start), _iso(stop), elapsed))))
+                + "\n"
+                for entry_id, project, start, stop, elapsed in chunk
+            )
+            count += len(chunk)
+        return count
+
+    @staticmethod
+    def _write_columnar(stream: IO[bytes], rows: Iterator[Row]) -> int:
+        """Write rows in the compressed columnar layout described above."""
+        project_ids: Dict[str, int] = {}
+        count = 0
+        stream.write(COLUMNAR_MAGIC)
+
+        for chunk in _chunks(rows):
+            new_names = bytearray()
+            new_count = 0
+            entry_ids = array('q')
+            starts = array('q')
+            stops = array('q')
+            elapsed = array('q')
+            projects = array('i')
+            for entry_id, project, start, stop, seconds in chunk:
+                project_id = project_ids.get(project)
+                if project_id is None:
+                    project_id = project_ids[project] = len(project_ids)
+                    encoded = project.encode('utf-8')
+                    new_names += struct.pack('<I', len(encoded)) + encoded
+                    new_count += 1
+                entry_ids.append(entry_id)
+                starts.append(start)
+                stops.append(NULL_INT64 if stop is None else stop)
+                elapsed.append(NULL_INT64 if seconds is None else seconds)
+                projects.append(project_id)
+
+            payload = zlib.compress(
+                struct.pack('<I', new_count) + bytes(new_names)
+                + b"".join(_little_endian(column) for column in (entry_ids, starts, stops, elapsed))
+                + _little_endian(projects),
+                1
+            )
+            stream.write(_CHUNK_HEADER.pack(len(chunk), len(payload)))
+            stream.write(payload)
+            count += len(chunk)
+
+        stream.write(_CHUNK_HEADER.pack(0, 0))
+        return count
+
+    @staticmethod
+    def _write_parquet(target: Path, rows: Iterator[Row]) -> int:
+        """Write rows as Parquet, one row group per chunk."""
+        pa = _pyarrow()
+        schema = pa.schema([
+            ('entry_id', pa.int64()),
+            ('project', pa.string()),
+            ('start_time', pa.int64()),
+            ('stop_time', pa.int64()),
+            ('time_elapsed', pa.int64()),
+        ])
+        count = 0
+        writer = pa.parquet.ParquetWriter(str(target), schema)
+        try:
+            for chunk in _chunks(rows):
+                columns = list(zip(*chunk))
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                    schema=schema
+                ))
+                count += len(chunk)
+        finally:
+            writer.close()
+        return count
+
+
+# Global service instance
+export_service = ExportService()
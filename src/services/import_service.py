@@ -0,0 +1,433 @@
+"""Service for bulk importing historical sessions from other tools."""
+
+import csv
+import json
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..database.db_manager import db_manager
+from ..database.project_repo import project_repo
+from ..database.rollup_repo import rollup_repo
+from ..database.tracking_repo import tracking_repo
+from ..database.transaction_repo import transaction_repo
+from ..utils.constants import IMPORT_BATCH_SIZE, IMPORT_DEFER_INDEXES_ROWS
+from ..utils.time_utils import local_day_boundaries
+from .event_bus import SessionsImported, event_bus
+
+# Called with (done, total, phase); total is 0 while the input is read
+ImportProgress = Callable[[int, int, str], None]
+
+# Accepted column or key names (compared case-insensitively)
+_FIELD_NAMES = {
+    'project': ('project', 'projectname', 'project_name'),
+    'start': ('start', 'starttime', 'start_time'),
+    'stop': ('stop', 'stoptime', 'stop_time', 'end', 'end_time'),
+}
+
+# Stop time used for the active session when checking overlaps
+_OPEN_ENDED = 2 ** 62
+
+# Accepted times: 0001-01-01 to 9999-12-31 UTC, as datetime can represent
+_MIN_TIMESTAMP = -62_135_596_800
+_MAX_TIMESTAMP = 253_402_300_799
+
+Record = Tuple[int, Any, Any, Any]  # (line number, project, start, stop)
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import."""
+
+    imported: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def parse_timestamp(value: Any) -> int:
+    """
+    Parse a Unix timestamp or an ISO 8601 date and time.
+
+    Times without a UTC offset are taken as local time.
+
+    Args:
+        value: Integer, numeric string or ISO 8601 string
+
+    Returns:
+        Unix timestamp in seconds
+
+    Raises:
+        ValueError: If the value is missing, not a recognized time, or
+            outside the years 1 to 9999
+    """
+    try:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            timestamp = int(value)
+        else:
+            text = str(value or '').strip()
+            if not text:
+                raise ValueError("missing time")
+            if text.lstrip('-').isdigit():
+                timestamp = int(text)
+            else:
+                if text.endswith(('Z', 'z')):
+                    text = text[:-1] + '+00:00'
+                timestamp = int(datetime.fromisoformat(text).timestamp())
+    except OverflowError:
+        # Infinity, or a number too large for a float
+        timestamp = None
+    if timestamp is None or not _MIN_TIMESTAMP <= timestamp <= _MAX_TIMESTAMP:
+        raise ValueError(f"time out of range: {value!r}")
+    return timestamp
+
+
+def _find_field(names: Iterable[str], field_name: str) -> Optional[str]:
+    """Return which of the given names holds a field, if any."""
+    aliases = _FIELD_NAMES[field_name]
+    for name in names:
+        if name.strip().lower() in aliases:
+            return name
+    return None
+
+
+def _read_csv(path: Path) -> Iterator[Record]:
+    """Stream records from a CSV file with a header row."""
+    with path.open(newline='', encoding='utf-8-sig') as source:
+        reader = csv.reader(source)
+        header = next(reader, None) or []
+        columns = {}
+        for field_name in _FIELD_NAMES:
+            name = _find_field(header, field_name)
+            if name is None:
+                raise ValueError(f"{path.name}: no '{field_name}' column in the header")
+            columns[field_name] = header.index(name)
+
+        project_col, start_col, stop_col = columns['project'], columns['start'], columns['stop']
+        width = max(columns.values()) + 1
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + [''] * (width - len(row))
+            yield reader.line_num, row[project_col], row[start_col], row[stop_col]
+
+
+def _records_from_objects(objects: Iterable[Tuple[int, Any]]) -> Iterator[Record]:
+    """Convert (line number, JSON object) pairs to records."""
+    for line_no, obj in objects:
+        if not isinstance(obj, dict):
+            yield line_no, None, None, None
+            continue
+        keys = {key.strip().lower(): key for key in obj}
+        values = []
+        for field_name, aliases in _FIELD_NAMES.items():
+            key = next((keys[alias] for alias in aliases if alias in keys), None)
+            values.append(obj[key] if key is not None else None)
+        yield (line_no, *values)
+
+
+def _read_jsonl(path: Path) -> Iterator[Record]:
+    """Stream records from a JSON Lines file (one object per line)."""
+    def objects():
+        with path.open(encoding='utf-8-sig') as source:
+            for line_no, line in enumerate(source, 1):
+                if line.strip():
+                    try:
+                        yield line_no, json.loads(line)
+                    except ValueError:
+                        yield line_no, None
+
+    return _records_from_objects(objects())
+
+
+def _read_json(path: Path) -> Iterator[Record]:
+    """
+    Read records from a JSON array of objects.
+
+    The json module cannot stream, so the whole array is loaded; use JSON
+    Lines for very large exports. Item positions stand in for line numbers.
+    """
+    with path.open(encoding='utf-8-sig') as source:
+        items = json.load(source)
+    if not isinstance(items, list):
+        raise ValueError(f"{path.name}: expected a JSON array of objects")
+    return _records_from_objects(enumerate(items, 1))
+
+
+_READERS = {
+    'csv': _read_csv,
+    'jsonl': _read_jsonl,
+    'json': _read_json,
+}
+
+_SUFFIX_FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.json': 'json',
+}
+
+
+class ImportService:
+    """
+    Import completed sessions in bulk.
+
+    Rows are parsed and validated into compact columns first, then checked
+    for overlaps in start-time order and written with executemany inside
+    a single write transaction, with the Start/Stop transactions and both
+    rollups. Large imports drop the affected indexes for the insert and
+    rebuild each one once afterwards.
+    """
+
+    def import_file(
+        self,
+        path: Path,
+        file_format: Optional[str] = None,
+        skip_invalid: bool = False,
+        progress: Optional[ImportProgress] = None
+    ) -> ImportResult:
+        """
+        Import sessions from a CSV, JSON Lines or JSON file.
+
+        Each row needs a project, a start and a stop time (see
+        parse_timestamp for accepted formats).
+
+        Args:
+            path: File to import
+            file_format: 'csv', 'jsonl' or 'json'; guessed from the suffix
+                when None
+            skip_invalid: Import the valid rows even if some are invalid,
+                instead of importing nothing
+            progress: Optional progress callback
+
+        Returns:
+            ImportResult with the number of sessions imported and one
+            message per rejected row
+
+        Raises:
+            ValueError: If the format is unknown or the file has no usable
+                header
+        """
+        if file_format is None:
+            file_format = _SUFFIX_FORMATS.get(path.suffix.lower())
+        if file_format not in _READERS:
+            raise ValueError(f"Unknown import format for {path.name}; use csv, jsonl or json")
+
+        return self.import_records(_READERS[file_format](path), skip_invalid, progress)
+
+    def import_records(
+        self,
+        records: Iterable[Record],
+        skip_invalid: bool = False,
+        progress: Optional[ImportProgress] = None
+    ) -> ImportResult:
+        """
+        Validate and import (line number, project, start, stop) records.
+
+        Args:
+            records: Records to import, in any order
+            skip_invalid: Import the valid rows even if some are invalid
+            progress: Optional progress callback
+
+        Returns:
+            ImportResult
+        """
+        result = ImportResult()
+
+        # Parse into columns; project names are interned to small ids
+        lines = array('q')
+        starts = array('q')
+        stops = array('q')
+        project_ids = array('l')
+        project_index: Dict[str, int] = {}
+        project_names: List[str] = []
+
+        for count, (line_no, project, start, stop) in enumerate(records, 1):
+            if progress is not None and count % IMPORT_BATCH_SIZE == 0:
+                progress(count, 0, "Reading")
+
+            if project is None and start is None and stop is None:
+                result.errors.append(f"line {line_no}: not an object with project, start and stop")
+                continue
+            project_name = str(project).strip() if project is not None else ''
+            if not project_name:
+                result.errors.append(f"line {line_no}: missing project")
+                continue
+            try:
+                start_time = parse_timestamp(start)
+                stop_time = parse_timestamp(stop)
+            except ValueError as error:
+                result.errors.append(f"line {line_no}: {error}")
+                continue
+            if stop_time < start_time:
+                result.errors.append(f"line {line_no}: stop time is before start time")
+                continue
+
+            project_id = project_index.get(project_name)
+            if project_id is None:
+                project_id = project_index[project_name] = len(project_names)
+                project_names.append(project_name)
+            lines.append(line_no)
+            starts.append(start_time)
+            stops.append(stop_time)
+            project_ids.append(project_id)
+
+        if result.errors and not skip_invalid:
+            return result
+
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+
+        # Overlap checks read the existing sessions under the same write
+        # lock as the insert, so a concurrent start cannot slip in between
+        with db_manager.transaction(immediate=True):
+            accepted = self._without_overlaps(order, lines, starts, stops, result.errors)
+            if result.errors and not skip_invalid:
+                return result
+
+            total = len(accepted)
+            if not total:
+                return result
+
+            # Map the local project ids to registry IDs, registering new
+            # projects in the same transaction
+            registered = project_repo.get_or_create_ids(
+                {project_names[project_ids[i]] for i in accepted}
+            )
+            registry_ids = [registered.get(name, 0) for name in project_names]
+
+            defer = total >= IMPORT_DEFER_INDEXES_ROWS
+            with db_manager.deferred_indexes('timeTracking', 'transactions') if defer \
+                    else nullcontext():
+                for offset in range(0, total, IMPORT_BATCH_SIZE):
+                    batch = accepted[offset:offset + IMPORT_BATCH_SIZE]
+                    tracking_repo.insert_completed_entries(
+                        (registry_ids[project_ids[i]], starts[i], stops[i], stops[i] - starts[i])
+                        for i in batch
+                    )
+                    transaction_repo.insert_transactions(
+                        transaction
+                        for i in batch
+                        for transaction in (
+                            ('Start', starts[i], registry_ids[project_ids[i]]),
+                            ('Stop', stops[i], registry_ids[project_ids[i]]),
+                        )
+                    )
+                    if progress is not None:
+                        progress(min(offset + IMPORT_BATCH_SIZE, total), total, "Writing")
+                if defer and progress is not None:
+                    progress(total, total, "Rebuilding indexes")
+
+            if progress is not None:
+                progress(total, total, "Updating rollups")
+            self._add_to_rollups(accepted, starts, stops, project_ids, registry_ids)
+
+        result.imported = total
+        event_bus.publish(SessionsImported(
+            total,
+            tuple(sorted({project_names[project_ids[i]] for i in accepted}))
+        ))
+        return result
+
+    @staticmethod
+    def _add_to_rollups(
+        accepted: List[int],
+        starts: array,
+        stops: array,
+        project_ids: array,
+        registry_ids: List[int]
+    ) -> None:
+        """
+        Aggregate the imported sessions and add them to the rollups.
+
+        The sessions are in start order, so each is located among the
+        local day boundaries by advancing a single cursor, and sessions
+        that cross midnight are split there as in add_session().
+        registry_ids maps the local project ids to projectId.
+        """
+        totals = [[0, 0] for _ in registry_ids]
+        day_totals: Dict[Tuple[int, int], int] = defaultdict(int)
+        boundaries = local_day_boundaries(
+            starts[accepted[0]],
+            max(stops[i] for i in accepted)
+        )
+
+        day = 0
+        for i in accepted:
+            start, stop, project_id = starts[i], stops[i], project_ids[i]
+            totals[project_id][0] += stop - start
+            totals[project_id][1] += 1
+            while boundaries[day + 1] <= start:
+                day += 1
+            piece_day = day
+            while start < stop:
+                piece_end = min(stop, boundaries[piece_day + 1])
+                day_totals[(piece_day, project_id)] += piece_end - start
+                start = piece_end
+                piece_day += 1
+
+        days = [datetime.fromtimestamp(boundary).date().isoformat() for boundary in boundaries]
+        rollup_repo.add_totals(
+            (
+                (registry_ids[project_id], seconds, count)
+                for project_id, (seconds, count) in enumerate(totals)
+                if count
+            ),
+            (
+                (days[day], registry_ids[project_id], seconds)
+                for (day, project_id), seconds in day_totals.items()
+            )
+        )
+
+    @staticmethod
+    def _without_overlaps(
+        order: List[int],
+        lines: array,
+        starts: array,
+        stops: array,
+        errors: List[str]
+    ) -> List[int]:
+        """
+        Drop rows that overlap an existing session or an earlier row.
+
+        Args:
+            order: Row indexes sorted by start time
+            lines, starts, stops: Parsed columns
+            errors: List to append one message per dropped row to
+
+        Returns:
+            Row indexes of the accepted rows, in start-time order
+        """
+        # Existing sessions by start, with the latest stop seen so far, so
+        # one binary search finds whether any earlier session is still open
+        existing_starts = array('q')
+        latest_stops = array('q')
+        latest = -_OPEN_ENDED
+        for start, stop in tracking_repo.iter_intervals():
+            latest = max(latest, _OPEN_ENDED if stop is None else stop)
+            existing_starts.append(start)
+            latest_stops.append(latest)
+
+        accepted: List[int] = []
+        previous_stop = -_OPEN_ENDED
+        previous_line = 0
+        for i in order:
+            start, stop = starts[i], stops[i]
+            if start < previous_stop:
+                errors.append(f"line {lines[i]}: overlaps the session on line {previous_line}")
+                continue
+            position = bisect_right(existing_starts, start)
+            if (position > 0 and latest_stops[position - 1] > start) or \
+                    (position < len(existing_starts) and existing_starts[position] < stop):
+                errors.append(f"line {lines[i]}: overlaps an existing session")
+                continue
+            accepted.append(i)
+            previous_stop, previous_line = stop, lines[i]
+        return accepted
+
+
+# Global service instance
+import_service = ImportService()
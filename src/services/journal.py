@@ -0,0 +1,267 @@
+"""Append-only journal that makes starts and stops durable ahead of SQLite."""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional
+
+from ..utils.constants import JOURNAL_FLUSH_DELAY, JOURNAL_POLL_INTERVAL, JOURNAL_RETRY_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """One journaled start or stop."""
+
+    seq: int
+    action: str  # 'Start' or 'Stop'
+    timestamp: int
+    project_name: str
+    session_start: int  # start time of the session started or stopped
+
+
+# Applies records to the database in one transaction, recording the last
+# sequence number applied for the journal ID in the same commit
+ApplyCallback = Callable[[str, List[JournalRecord]], None]
+
+# Called on the flusher thread every JOURNAL_POLL_INTERVAL while nothing
+# is pending, e.g. to look for changes made by other processes
+IdleCallback = Callable[[], None]
+
+
+class TransactionJournal:
+    """
+    Durable local log of starts and stops waiting to reach the database.
+
+    The file holds a JSON header line ({"journal": id, "next": seq}) and
+    one JSON array per record: [seq, action, timestamp, project, session
+    start]. append()
+    writes and fsyncs the record before returning; on a local disk that
+    takes well under a millisecond, however slow the database is.
+
+    A background thread hands pending records to the apply callback in
+    batches and then compacts the file. Because the callback stores the
+    last applied sequence number in the same commit, a crash between the
+    commit and the compaction does not apply anything twice on replay. A
+    torn last line left by a crash mid-append is dropped when the journal
+    is loaded.
+    """
+
+    def __init__(self, path: Path, apply: ApplyCallback, idle: Optional[IdleCallback] = None):
+        """
+        Initialize a journal; call load() and start() to use it.
+
+        Args:
+            path: Journal file, created if missing
+            apply: Callback writing a batch of records to the database
+            idle: Optional callback run periodically while nothing is pending
+        """
+        self.path = path
+        self.apply = apply
+        self.idle = idle
+        self.journal_id = ""
+        self.pending: List[JournalRecord] = []
+        self._next_seq = 1
+        self._file: Optional[BinaryIO] = None
+        # Guards pending and the file; held only for local file writes
+        self._lock = threading.Lock()
+        # Serializes flushes between the flusher thread and callers
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def load(self) -> None:
+        """Read the records left by an earlier run and open the file for appending."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = self.path.read_bytes().split(b"\n") if self.path.exists() else []
+
+        try:
+            header = json.loads(lines[0])
+            self.journal_id = header["journal"]
+            self._next_seq = header["next"]
+        except (IndexError, ValueError, KeyError, TypeError):
+            if any(lines):
+                logger.warning("Journal %s has no valid header; starting a new one", self.path)
+            self.journal_id = uuid.uuid4().hex
+            self._next_seq = 1
+            lines = []
+
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                seq, action, timestamp, project_name, session_start = json.loads(line)
+            except (ValueError, TypeError):
+                logger.warning("Dropping a torn record at the end of journal %s", self.path)
+                break
+            self.pending.append(
+                JournalRecord(seq, action, timestamp, project_name, session_start)
+            )
+            self._next_seq = max(self._next_seq, seq + 1)
+
+        # Rewrite so appends never follow a torn line
+        with self._lock:
+            self._compact()
+
+    def start(self) -> None:
+        """Start the background flusher thread."""
+        self._thread = threading.Thread(target=self._run, name="journal-flusher", daemon=True)
+        self._thread.start()
+        if self.pending:
+            self._wake.set()
+
+    def append(
+        self,
+        action: str,
+        timestamp: int,
+        project_name: str,
+        session_start: int
+    ) -> JournalRecord:
+        """
+        Durably record a start or stop and schedule it for the database.
+
+        Args:
+            action: 'Start' or 'Stop'
+            timestamp: Unix timestamp of the toggle
+            project_name: Name of the project
+            session_start: Start time of the session; for a stop, this
+                identifies the session it closes
+
+        Returns:
+            The appended record
+        """
+        with self._lock:
+            record = JournalRecord(self._next_seq, action, timestamp, project_name, session_start)
+            self._file.write(self._encode(record))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._next_seq += 1
+            self.pending.append(record)
+        self._wake.set()
+        return record
+
+    def get_pending(self) -> List[JournalRecord]:
+        """
+        Get the records not yet applied to the database.
+
+        Returns:
+            Records in sequence order
+        """
+        with self._lock:
+            return list(self.pending)
+
+    def flush(self) -> int:
+        """
+        Apply all pending records to the database now.
+
+        Returns:
+            Number of records applied
+
+        Raises:
+            Exception: Whatever the apply callback raised; the records stay
+                pending
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self.pending)
+            if not batch:
+                return 0
+
+            self.apply(self.journal_id, batch)
+
+            with self._lock:
+                last = batch[-1].seq
+                self.pending = [record for record in self.pending if record.seq > last]
+                self._compact()
+        return len(batch)
+
+    def close(self) -> None:
+        """Stop the flusher thread, flushing what is left if the database allows."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Could not flush the journal; it will be replayed on the next start")
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _run(self) -> None:
+        """Flush pending records whenever some are appended, else run idle."""
+        while True:
+            if not self._wake.wait(JOURNAL_POLL_INTERVAL):
+                if self.idle is not None and not self._stopping.is_set():
+                    try:
+                        self.idle()
+                    except Exception:
+                        logger.exception("Journal idle callback failed")
+                continue
+            # Let a quick burst of toggles land in the same commit
+            if self._stopping.wait(JOURNAL_FLUSH_DELAY):
+                return
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Journal flush failed; retrying in %s s", JOURNAL_RETRY_INTERVAL)
+                if self._stopping.wait(JOURNAL_RETRY_INTERVAL):
+                    return
+                self._wake.set()
+
+    def _compact(self) -> None:
+        """Atomically rewrite the file with only the pending records."""
+        if self._file is not None:
+            self._file.close()
+
+        header = json.dumps({"journal": self.journal_id, "next": self._next_seq})
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, "wb") as temp:
+            temp.write(header.encode() + b"\n")
+            temp.writelines(self._encode(record) for record in self.pending)
+            temp.flush()
+            os.fsync(temp.fileno())
+        os.replace(temp_path, self.path)
+        self._sync_directory()
+
+        self._file = open(self.path, "ab")
+
+    def _sync_directory(self) -> None:
+        """Make the rename durable; not possible (or needed) on every platform."""
+        try:
+            fd = os.open(self.path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _encode(record: JournalRecord) -> bytes:
+        """Encode a record as one line."""
+        line = json.dumps(
+            [
+                record.seq,
+                record.action,
+                record.timestamp,
+                record.project_name,
+                record.session_start
+            ],
+            ensure_ascii=False
+        )
+        return line.encode() + b"\n"
@@ -0,0 +1,239 @@
+"""Indexed type-ahead search over project names."""
+
+import heapq
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from ..database.db_manager import db_manager
+from ..database.transaction_repo import transaction_repo
+from ..utils.constants import PROJECT_SEARCH_LIMIT
+from .project_service import ProjectCatalog, ProjectService, project_service
+from .recent_projects import RecentProjectsCache, recent_projects_cache
+from .tracking_service import TrackingService, tracking_service
+
+# Runs of letters and digits; a word starts where one begins
+_WORD = re.compile(r'[^\W_]+')
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the distinct three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ProjectIndex:
+    """
+    Prefix and trigram index over a list of project names.
+
+    Matching ignores case. Queries of one or two characters match the
+    start of any word in a name, found by bisecting a sorted list of word
+    suffixes. Longer queries match anywhere in a name, checked only
+    against the names in the query's rarest trigram posting list; when
+    too few names contain the query, names sharing at least half of its
+    trigrams are added, which tolerates a typo.
+
+    Matches are ranked by how they matched (start of the name, start of a
+    word, elsewhere, fuzzy), then by most recent use, then by position in
+    projects.txt.
+    """
+
+    __slots__ = ('names', 'keys', 'last_used', 'words', 'postings', '_last_query', '_last_hits')
+
+    def __init__(self, names: Sequence[str], last_used: Dict[str, int]):
+        """
+        Build the index.
+
+        Args:
+            names: Project names in projects.txt order
+            last_used: Project name to Unix timestamp of its last use
+        """
+        self.names = names
+        self.keys = [name.casefold() for name in names]
+
+        words: List[Tuple[str, int]] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, key in enumerate(self.keys):
+            words.extend((key[word.start():], position) for word in _WORD.finditer(key))
+            for trigram in _trigrams(key):
+                postings[trigram].append(position)
+        words.sort()
+        self.words = words
+        self.postings = dict(postings)
+
+        self.set_last_used(last_used)
+
+    def set_last_used(self, last_used: Dict[str, int]) -> None:
+        """
+        Replace the usage the ranking is based on.
+
+        Args:
+            last_used: Project name to Unix timestamp of its last use
+        """
+        self.last_used = [last_used.get(name, 0) for name in self.names]
+        # Substring hits of the last query, narrowed as it is extended
+        self._last_query = ""
+        self._last_hits: List[int] = []
+
+    def search(self, query: str, limit: int = PROJECT_SEARCH_LIMIT) -> Tuple[List[str], int]:
+        """
+        Find the best matches for a query.
+
+        Args:
+            query: Text typed so far, not empty
+            limit: Maximum number of names to return
+
+        Returns:
+            (best matching names, total number of matches)
+        """
+        query = query.strip().casefold()
+        if len(query) < 3:
+            hits = self._word_hits(query)
+        else:
+            hits = self._substring_hits(query)
+
+        best = heapq.nsmallest(
+            limit,
+            hits,
+            key=lambda position: (self._tier(query, position), -self.last_used[position], position)
+        )
+        total = len(hits)
+
+        if len(best) < limit and len(query) >= 3:
+            fuzzy = self._fuzzy_hits(query, set(hits))
+            best.extend(heapq.nsmallest(
+                limit - len(best),
+                fuzzy,
+                key=lambda position: (-fuzzy[position], -self.last_used[position], position)
+            ))
+            total += len(fuzzy)
+
+        return [self.names[position] for position in best], total
+
+    def _word_hits(self, query: str) -> List[int]:
+        """Return the positions of names with a word starting with query."""
+        hits = {}
+        i = bisect_left(self.words, (query,))
+        while i < len(self.words) and self.words[i][0].startswith(query):
+            hits[self.words[i][1]] = None
+            i += 1
+        return list(hits)
+
+    def _substring_hits(self, query: str) -> List[int]:
+        """Return the positions of names containing query (3+ characters)."""
+        if self._last_query and query.startswith(self._last_query):
+            # Typing on: only names matching the shorter query can match
+            candidates: Sequence[int] = self._last_hits
+        else:
+            postings = [self.postings.get(trigram, ()) for trigram in _trigrams(query)]
+            candidates = min(postings, key=len)
+
+        keys = self.keys
+        hits = [position for position in candidates if query in keys[position]]
+        self._last_query = query
+        self._last_hits = hits
+        return hits
+
+    def _fuzzy_hits(self, query: str, exclude: Set[int]) -> Dict[int, int]:
+        """Return position -> shared trigrams for names close to query."""
+        trigrams = _trigrams(query)
+        shared: Counter = Counter()
+        for trigram in trigrams:
+            shared.update(self.postings.get(trigram, ()))
+        needed = (len(trigrams) + 1) // 2
+        return {
+            position: count
+            for position, count in shared.items()
+            if count >= needed and position not in exclude
+        }
+
+    def _tier(self, query: str, position: int) -> int:
+        """Rank how query matched: name start 0, word start 1, elsewhere 2."""
+        key = self.keys[position]
+        if key.startswith(query):
+            return 0
+        start = key.find(query)
+        while start != -1:
+            if not _WORD.match(key, start - 1):
+                return 1
+            start = key.find(query, start + 1)
+        return 2
+
+
+class ProjectSearchService:
+    """
+    Keep a ProjectIndex in step with projects.txt and the database.
+
+    The index is built on the first search and rebuilt only when
+    projects.txt changes. Its ranking is refreshed from transactions when
+    the tracking change token moves, so keystrokes between writes cost a
+    stat() and a PRAGMA, not a query. An empty search is answered from
+    the recently used projects and does not build the index at all.
+    """
+
+    def __init__(
+        self,
+        projects: ProjectService = project_service,
+        tracking: TrackingService = tracking_service,
+        recent: RecentProjectsCache = recent_projects_cache
+    ):
+        """
+        Initialize the search service.
+
+        Args:
+            projects: Service supplying the project catalog
+            tracking: Service supplying the change token
+            recent: Cache of the recently used projects
+        """
+        self.projects = projects
+        self.tracking = tracking
+        self.recent = recent
+        self._catalog: Optional[ProjectCatalog] = None
+        self._index: Optional[ProjectIndex] = None
+        self._usage_key: Optional[Tuple[Tuple[int, int], Optional[Path]]] = None
+
+    def get_index(self) -> ProjectIndex:
+        """
+        Get the index, rebuilding or re-ranking it if anything changed.
+
+        Returns:
+            ProjectIndex over the current catalog
+        """
+        catalog = self.projects.get_catalog()
+        usage_key = (self.tracking.get_change_token(), db_manager.db_path)
+        if catalog is not self._catalog:
+            self._index = ProjectIndex(catalog.names, transaction_repo.get_last_used())
+            self._catalog = catalog
+        elif usage_key != self._usage_key:
+            self._index.set_last_used(transaction_repo.get_last_used())
+        self._usage_key = usage_key
+        return self._index
+
+    def search(self, query: str, limit: int = PROJECT_SEARCH_LIMIT) -> Tuple[List[str], int]:
+        """
+        Find the projects best matching the text typed so far.
+
+        Args:
+            query: Search text; empty lists the most recently used
+            limit: Maximum number of names to return
+
+        Returns:
+            (best matching names, total number of matches)
+        """
+        if query.strip():
+            return self.get_index().search(query, limit)
+
+        # Recently used projects still listed, topped up in file order
+        catalog = self.projects.get_catalog()
+        names = [name for name in self.recent.get() if name in catalog][:limit]
+        for name in catalog.names[:limit]:
+            if len(names) == limit:
+                break
+            if name not in names:
+                names.append(name)
+        return names, len(catalog)
+
+
+# Global service instance
+project_search_service = ProjectSearchService()
@@ -1,22 +1,119 @@
 """Service for managing projects."""
 
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from ..database.db_manager import db_manager
+from ..database.project_repo import project_repo
 from ..utils.constants import PROJECTS_FILE
+from .event_bus import EventBus, ProjectRenamed, event_bus
+
+DEFAULT_PROJECT = "Default Project"
+
+
+class ProjectCatalog:
+    """
+    Parsed contents of projects.txt.
+
+    Keeps the names in file order for display plus a dict index from name
+    to position, so validation and lookup are O(1) however many projects
+    the file lists.
+    """
+
+    __slots__ = ('names', 'index', 'stamp')
+
+    def __init__(self, names: List[str], stamp: Tuple[int, int]):
+        """
+        Initialize a catalog.
+
+        Args:
+            names: Project names in file order, without duplicates
+            stamp: (mtime_ns, size) of the file the names were read from
+        """
+        self.names = names
+        self.index: Dict[str, int] = {name: position for position, name in enumerate(names)}
+        self.stamp = stamp
+
+    def __contains__(self, project_name: object) -> bool:
+        """Check whether a project name is listed."""
+        return project_name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names in file order."""
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        """Return the number of projects."""
+        return len(self.names)
 
 
 class ProjectService:
-    """Handle project management operations."""
+    """
+    Handle project management operations.
 
-    def __init__(self, projects_file: Path = PROJECTS_FILE):
+    projects.txt is parsed once into a ProjectCatalog and re-read only when
+    its modification time or size changes, so repeated loads and
+    validations cost a single stat().
+    """
+
+    def __init__(self, projects_file: Path = PROJECTS_FILE, bus: EventBus = event_bus):
         """
         Initialize the project service.
 
         Args:
             projects_file: Path to the projects.txt file
+            bus: Event bus that renames are published on
         """
         self.projects_file = projects_file
+        self.bus = bus
+        self._catalog: Optional[ProjectCatalog] = None
+        self._synced: Optional[Tuple[Tuple[int, int], Optional[Path]]] = None
+
+    def _stamp(self) -> Optional[Tuple[int, int]]:
+        """Return the file's (mtime_ns, size), or None if it is missing."""
+        try:
+            stat = self.projects_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get_catalog(self) -> ProjectCatalog:
+        """
+        Get the parsed project list, re-reading projects.txt only if it changed.
+
+        Creates the file with a default project if it doesn't exist, and
+        lists at least one project.
+
+        Returns:
+            ProjectCatalog, shared between calls; do not modify it
+        """
+        stamp = self._stamp()
+        if self._catalog is not None and stamp == self._catalog.stamp:
+            return self._catalog
+
+        if stamp is None:
+            self.projects_file.parent.mkdir(parents=True, exist_ok=True)
+            self.projects_file.write_text(f"{DEFAULT_PROJECT}\n")
+            stamp = self._stamp()
+
+        # Read and parse projects, dropping blank lines and duplicates
+        content = self.projects_file.read_text()
+        names = list(dict.fromkeys(
+            line.strip()
+            for line in content.splitlines()
+            if line.strip()
+        ))
+
+        # Ensure at least one project exists
+        if not names:
+            names = [DEFAULT_PROJECT]
+            self.projects_file.write_text(f"{DEFAULT_PROJECT}\n")
+            stamp = self._stamp()
+
+        # Stamped before reading, so a change made meanwhile is picked up
+        # by the next call
+        self._catalog = ProjectCatalog(names, stamp)
+        return self._catalog
 
     def load_projects(self) -> List[str]:
         """
@@ -26,42 +123,77 @@ class ProjectService:
         Returns at least one project.
 
         Returns:
-            List of project names
+            List of project names; the same list is returned until the
+            file changes, so callers can compare by identity and must not
+            modify it
         """
-        # Ensure data directory exists
-        self.projects_file.parent.mkdir(parents=True, exist_ok=True)
+        return self.get_catalog().names
 
-        # Create file with default project if it doesn't exist
-        if not self.projects_file.exists():
-            self.projects_file.write_text("Default Project\n")
+    def sync_projects(self) -> List[str]:
+        """
+        Load projects.txt and register any new names in the database.
 
-        # Read and parse projects
-        content = self.projects_file.read_text()
-        projects = [
-            line.strip()
-            for line in content.splitlines()
-            if line.strip()  # Filter out empty lines
-        ]
+        projects.txt remains the list offered for tracking; the projects
+        table gives each name the ID that history refers to. Registering
+        happens once per version of the file and database.
 
-        # Ensure at least one project exists
-        if not projects:
-            projects = ["Default Project"]
-            self.projects_file.write_text("Default Project\n")
+        Returns:
+            List of project names from projects.txt, as load_projects()
+        """
+        catalog = self.get_catalog()
+        synced = (catalog.stamp, db_manager.db_path)
+        if synced != self._synced:
+            project_repo.get_or_create_ids(catalog.names)
+            self._synced = synced
+        return catalog.names
+
+    def rename_project(self, old_name: str, new_name: str) -> None:
+        """
+        Rename a project in the database and in projects.txt.
+
+        Sessions, transactions and rollups refer to the project by ID, so
+        only the projects row changes.
 
-        return projects
+        Args:
+            old_name: Current project name
+            new_name: New project name
 
-    def is_valid_project(self, project_name: str, projects: List[str]) -> bool:
+        Raises:
+            KeyError: If no project is called old_name
+            ValueError: If new_name is empty or already taken
+        """
+        new_name = new_name.strip()
+        if not new_name:
+            raise ValueError("Project names cannot be empty")
+        if new_name in self.get_catalog():
+            raise ValueError(f"A project called '{new_name}' already exists")
+        if not project_repo.rename(old_name, new_name):
+            raise KeyError(old_name)
+
+        lines = self.projects_file.read_text().splitlines()
+        self.projects_file.write_text(
+            "".join(
+                f"{new_name if line.strip() == old_name else line}\n"
+                for line in lines
+            )
+        )
+        self.bus.publish(ProjectRenamed(old_name, new_name))
+
+    def is_valid_project(self, project_name: str, projects: Optional[List[str]] = None) -> bool:
         """
         Check if a project name is valid.
 
         Args:
             project_name: Name to validate
-            projects: List of valid project names
+            projects: List of valid project names; defaults to the cached
+                projects.txt catalog, which answers in O(1)
 
         Returns:
             True if valid, False otherwise
         """
-        return project_name.strip() in projects
+        if projects is not None:
+            return project_name.strip() in projects
+        return project_name.strip() in self.get_catalog()
 
 
 # Global service instance
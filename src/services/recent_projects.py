@@ -0,0 +1,59 @@
+"""In-process cache of the most recently used projects."""
+
+from typing import List
+
+from ..database.transaction_repo import transaction_repo
+from ..utils.constants import RECENT_PROJECTS_LIMIT, RECENT_PROJECTS_SCAN_ROWS
+from .data_version_cache import DataVersionCache
+from .event_bus import EventBus, ProjectRenamed, SessionsImported, TrackingStarted, event_bus
+
+
+class RecentProjectsCache(DataVersionCache[List[str]]):
+    """
+    Cache the most recently used projects between database writes.
+
+    The list is read from transactions with one indexed query, most
+    recent first. Starts made in this process move the project to the
+    front without a query.
+    """
+
+    def __init__(self, bus: EventBus = event_bus, limit: int = RECENT_PROJECTS_LIMIT):
+        """
+        Initialize an empty cache.
+
+        Args:
+            bus: Event bus to follow starts, renames and imports on
+            limit: Number of projects to keep
+        """
+        super().__init__(self._load_names)
+        self.limit = limit
+
+        bus.subscribe(TrackingStarted, self._on_tracking_started)
+        bus.subscribe(ProjectRenamed, self._on_project_renamed)
+        bus.subscribe(SessionsImported, self._on_sessions_imported)
+
+    def _load_names(self) -> List[str]:
+        """Read the most recently used projects from transactions."""
+        return transaction_repo.get_recent_projects(self.limit, RECENT_PROJECTS_SCAN_ROWS)
+
+    def _on_tracking_started(self, event: TrackingStarted) -> None:
+        """Move the started project to the front."""
+        name = event.entry.project_name
+        self.update(
+            lambda names: [name] + [other for other in names if other != name][:self.limit - 1]
+        )
+
+    def _on_project_renamed(self, event: ProjectRenamed) -> None:
+        """Follow a project to its new name."""
+        self.update(lambda names: [
+            event.new_name if name == event.old_name else name
+            for name in names
+        ])
+
+    def _on_sessions_imported(self, event: SessionsImported) -> None:
+        """Reload after an import, which may add more recent history."""
+        self.invalidate()
+
+
+# Global cache instance
+recent_projects_cache = RecentProjectsCache()
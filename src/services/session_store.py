@@ -0,0 +1,246 @@
+"""Columnar in-memory snapshot of completed sessions for analytics."""
+
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..database.tracking_repo import tracking_repo
+from ..utils.time_utils import bucket_key, local_day_boundaries
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """
+    Import NumPy on first use.
+
+    NumPy is optional (pure-Python passes are used without it) and slow to
+    import, so it is not loaded by commands that never aggregate.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class SessionStore:
+    """
+    Columnar copy of the completed rows of timeTracking.
+
+    Start, stop and elapsed times live in array('q') columns alongside an
+    interned project-id column, so aggregations are tight passes over
+    machine integers (vectorized when NumPy is installed) instead of SQL
+    scans and per-row Python objects. The store loads once and then only
+    fetches rows past the highest entryId it has seen.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all loaded data; the next refresh reloads from scratch."""
+        self.start_times = array('q')
+        self.stop_times = array('q')
+        self.elapsed = array('q')
+        self.project_ids = array('q')
+        self.project_names: List[str] = []
+        self._project_index: Dict[str, int] = {}
+        self._max_entry_id = 0
+        self._open_ids: Set[int] = set()
+
+    def __len__(self) -> int:
+        """Return the number of completed sessions loaded."""
+        return len(self.start_times)
+
+    def _intern_project(self, project_name: str) -> int:
+        """Return the integer id for a project name, assigning one if new."""
+        project_id = self._project_index.get(project_name)
+        if project_id is None:
+            project_id = len(self.project_names)
+            self._project_index[project_name] = project_id
+            self.project_names.append(project_name)
+        return project_id
+
+    def _append(self, project_name: str, start: int, stop: int, elapsed: int) -> None:
+        """Append one completed session to the columns."""
+        self.start_times.append(start)
+        self.stop_times.append(stop)
+        self.elapsed.append(elapsed)
+        self.project_ids.append(self._intern_project(project_name))
+
+    def refresh(self) -> int:
+        """
+        Bring the store up to date with the database.
+
+        Fetches rows past the highest entryId seen, plus any previously
+        active sessions that have since been stopped.
+
+        Returns:
+            Number of sessions added
+        """
+        added = 0
+
+        # Sessions that were still running at the last refresh
+        if self._open_ids:
+            for entry in tracking_repo.get_entries_by_ids(sorted(self._open_ids)):
+                if entry.stop_time is not None:
+                    self._append(
+                        entry.project_name,
+                        entry.start_time,
+                        entry.stop_time,
+                        entry.time_elapsed or 0
+                    )
+                    self._open_ids.discard(entry.entry_id)
+                    added += 1
+
+        for entry_id, project_name, start, stop, elapsed in \
+                tracking_repo.iter_entries_after(self._max_entry_id):
+            self._max_entry_id = entry_id
+            if stop is None:
+                self._open_ids.add(entry_id)
+                continue
+            self._append(project_name, start, stop, elapsed or 0)
+            added += 1
+
+        return added
+
+    def project_totals(self) -> Dict[str, int]:
+        """
+        Sum elapsed time per project in one pass over the columns.
+
+        Returns:
+            Dictionary mapping project name to total seconds
+        """
+        np = _numpy()
+        if np is not None:
+            sums = np.bincount(
+                np.frombuffer(self.project_ids, dtype=np.int64),
+                weights=np.frombuffer(self.elapsed, dtype=np.int64),
+                minlength=len(self.project_names)
+            )
+            totals = [int(value) for value in sums]
+        else:
+            totals = [0] * len(self.project_names)
+            for project_id, elapsed in zip(self.project_ids, self.elapsed):
+                totals[project_id] += elapsed
+
+        return {
+            name: totals[project_id]
+            for project_id, name in enumerate(self.project_names)
+        }
+
+    def bucket_totals(
+        self,
+        bucket: str = 'day',
+        since: Optional[int] = None,
+        until: Optional[int] = None
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Total time per project per day, week or month in local time.
+
+        Sessions that cross midnight are split at each local midnight.
+        Each session is located among the day boundaries by binary search
+        (vectorized with NumPy), so no datetime objects are built per row.
+
+        Args:
+            bucket: 'day', 'week' or 'month'
+            since: Optional Unix timestamp; time before it is excluded
+            until: Optional Unix timestamp; time from it on is excluded
+
+        Returns:
+            List of (bucket_key, project_name, seconds) tuples sorted by
+            bucket then project
+        """
+        if not len(self):
+            return []
+
+        first = min(self.start_times) if since is None else since
+        last = max(self.stop_times) if until is None else until
+        if last < first:
+            return []
+        boundaries = local_day_boundaries(first, last)
+        day_totals: Dict[Tuple[int, int], int] = defaultdict(int)
+
+        np = _numpy()
+        if np is not None:
+            starts = np.frombuffer(self.start_times, dtype=np.int64)
+            stops = np.frombuffer(self.stop_times, dtype=np.int64)
+            projects = np.frombuffer(self.project_ids, dtype=np.int64)
+            if since is not None:
+                starts = np.maximum(starts, since)
+            if until is not None:
+                stops = np.minimum(stops, until)
+            keep = stops > starts
+            starts, stops, projects = starts[keep], stops[keep], projects[keep]
+
+            edges = np.asarray(boundaries, dtype=np.int64)
+            start_days = np.searchsorted(edges, starts, side='right') - 1
+            stop_days = np.searchsorted(edges, stops - 1, side='right') - 1
+
+            # Sessions within one local day: a single grouped sum
+            same = start_days == stop_days
+            if same.any():
+                width = len(self.project_names)
+                keys = start_days[same] * width + projects[same]
+                sums = np.bincount(keys, weights=stops[same] - starts[same])
+                for key in np.nonzero(sums)[0]:
+                    day_totals[divmod(int(key), width)] += int(sums[key])
+
+            # The few sessions that cross midnight are split individually
+            for index in np.nonzero(~same)[0]:
+                self._split_into(
+                    day_totals, boundaries, int(projects[index]),
+                    int(starts[index]), int(stops[index]), int(start_days[index])
+                )
+        else:
+            for project_id, start, stop in zip(
+                    self.project_ids, self.start_times, self.stop_times):
+                if since is not None and start < since:
+                    start = since
+                if until is not None and stop > until:
+                    stop = until
+                if stop <= start:
+                    continue
+                day = bisect_right(boundaries, start) - 1
+                if stop <= boundaries[day + 1]:
+                    day_totals[(day, project_id)] += stop - start
+                else:
+                    self._split_into(day_totals, boundaries, project_id, start, stop, day)
+
+        # Roll days up into the requested bucket
+        keys = [
+            bucket_key(datetime.fromtimestamp(boundary).date().isoformat(), bucket)
+            for boundary in boundaries
+        ]
+        totals: Dict[Tuple[str, str], int] = defaultdict(int)
+        for (day, project_id), seconds in day_totals.items():
+            totals[(keys[day], self.project_names[project_id])] += seconds
+
+        return sorted(
+            (key, project_name, seconds)
+            for (key, project_name), seconds in totals.items()
+        )
+
+    @staticmethod
+    def _split_into(
+        day_totals: Dict[Tuple[int, int], int],
+        boundaries: List[int],
+        project_id: int,
+        start: int,
+        stop: int,
+        day: int
+    ) -> None:
+        """Add a session spanning several days to day_totals, day by day."""
+        while start < stop:
+            day_end = min(stop, boundaries[day + 1])
+            day_totals[(day, project_id)] += day_end - start
+            start = day_end
+            day += 1
+
+
+# Global store instance
+session_store = SessionStore()
@@ -1,20 +1,112 @@
 """Service for tracking time on projects."""
 
+import logging
+import threading
 import time
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from ..database.db_manager import db_manager
+from ..database.journal_repo import journal_repo
+from ..database.rollup_repo import rollup_repo
 from ..database.tracking_repo import tracking_repo
 from ..database.transaction_repo import transaction_repo
 from ..models.tracking_entry import TrackingEntry
+from ..utils.constants import COLUMNAR_STORE_ENABLED, DETAIL_PAGE_SIZE
+from ..utils.time_utils import bucket_key, local_midnight, split_by_local_day
+from .active_entry_cache import ActiveEntryCache
+from .event_bus import (
+    ActiveEntryReloaded,
+    EventBus,
+    JournalFlushed,
+    ProjectRenamed,
+    TotalsRebuilt,
+    TrackingEvent,
+    TrackingStarted,
+    TrackingStopped,
+    event_bus,
+)
+from .journal import JournalRecord, TransactionJournal
+from .session_store import SessionStore, session_store
+
+logger = logging.getLogger(__name__)
 
 
 class TrackingService:
     """Handle business logic for time tracking operations."""
 
+    def __init__(self, store: Optional[SessionStore] = None, bus: EventBus = event_bus):
+        """
+        Initialize the tracking service.
+
+        Args:
+            store: Columnar session store to serve reports from, or None to
+                query the database directly
+            bus: Event bus that writes are published on
+        """
+        self.store = store
+        self.bus = bus
+        self.active_cache = ActiveEntryCache()
+        self.write_generation = 0
+        self._completed_totals: Dict[str, int] = {}
+        self._completed_totals_token: Optional[Tuple[Tuple[int, int], int]] = None
+        # Toggle journal, when enabled, and the active entry as of its
+        # latest record (ahead of the database until the flusher catches up)
+        self.journal: Optional[TransactionJournal] = None
+        self._journal_active: Optional[TrackingEntry] = None
+        self._journal_seq = 0
+        # Last journal record committed to the database
+        self._journal_applied_seq = 0
+        self._toggle_lock = threading.Lock()
+
+        # Any write published in this process (including imports made by
+        # other services) moves the change token
+        bus.subscribe(TrackingEvent, self._on_write)
+        bus.subscribe(ProjectRenamed, self._on_project_renamed)
+
+    def _on_write(self, event: TrackingEvent) -> None:
+        """Advance the write generation when a write is published."""
+        self.write_generation += 1
+
+    def _on_project_renamed(self, event: ProjectRenamed) -> None:
+        """Drop cached copies of the old project name."""
+        self.active_cache.invalidate()
+        with self._toggle_lock:
+            active_entry = self._journal_active
+            if active_entry is not None and active_entry.project_name == event.old_name:
+                self._journal_active = replace(active_entry, project_name=event.new_name)
+        if self.store is not None:
+            self.store.reset()
+
+    def _refreshed_store(self) -> Optional[SessionStore]:
+        """Return the session store brought up to date, if one is enabled."""
+        if self.store is None:
+            return None
+        self.store.refresh()
+        return self.store
+
+    def get_change_token(self) -> Tuple[int, int]:
+        """
+        Get a token that changes whenever tracking data is written.
+
+        Combines this service's write generation (bumped by every event
+        published on the bus) with SQLite's data_version (bumped by commits from other
+        connections and processes). Neither reads any table.
+
+        Returns:
+            Opaque token; compare with a previous one to detect writes
+        """
+        return (self.write_generation, db_manager.get_data_version())
+
     def start_tracking(self, project_name: str) -> Tuple[bool, str, Optional[TrackingEntry]]:
         """
         Start tracking time for a project.
 
+        With the journal enabled the start is made durable in the journal
+        and reaches the database shortly after, from the flusher thread.
+
         Args:
             project_name: Name of the project to track
 
@@ -24,8 +116,35 @@ class TrackingService:
             - message: Status or error message
             - tracking_entry: Created entry if successful, None otherwise
         """
-        # Check if there's already an active tracking session
-        active_entry = tracking_repo.get_active_entry()
+        current_time = int(time.time())
+
+        if self.journal is not None:
+            with self._toggle_lock:
+                active_entry = self._journal_active
+                if active_entry is None:
+                    self._journal_seq = self.journal.append(
+                        'Start', current_time, project_name, current_time
+                    ).seq
+                    entry = TrackingEntry(
+                        entry_id=None,
+                        project_name=project_name,
+                        start_time=current_time,
+                        stop_time=None,
+                        time_elapsed=None
+                    )
+                    self._journal_active = entry
+        else:
+            # Check, record the Start transaction and open the session under
+            # a single write lock and commit
+            try:
+                with db_manager.transaction(immediate=True):
+                    active_entry = self.active_cache.get()
+                    if active_entry is None:
+                        entry = self._record_start(project_name, current_time)
+                        self.active_cache.set(entry)
+            except Exception:
+                self.active_cache.invalidate()
+                raise
 
         if active_entry is not None:
             return (
@@ -34,18 +153,7 @@ class TrackingService:
                 None
             )
 
-        # Start tracking
-        current_time = int(time.time())
-
-        # Create transaction record
-        transaction_repo.insert_transaction('Start', current_time, project_name)
-
-        # Create tracking entry
-        entry_id = tracking_repo.insert_tracking_entry(project_name, current_time)
-
-        # Retrieve and return the created entry
-        entry = tracking_repo.get_entry_by_id(entry_id)
-
+        self.bus.publish(TrackingStarted(entry))
         return (
             True,
             f"Started tracking '{project_name}'",
@@ -56,14 +164,37 @@ class TrackingService:
         """
         Stop the currently active tracking session.
 
+        With the journal enabled the stop is made durable in the journal
+        and reaches the database shortly after, from the flusher thread.
+
         Returns:
             Tuple of (success, message, tracking_entry)
             - success: True if stopped successfully
             - message: Status or error message
             - tracking_entry: Updated entry if successful, None otherwise
         """
-        # Get active entry
-        active_entry = tracking_repo.get_active_entry()
+        current_time = int(time.time())
+
+        if self.journal is not None:
+            with self._toggle_lock:
+                active_entry = self._journal_active
+                if active_entry is not None:
+                    self._journal_seq = self.journal.append(
+                        'Stop', current_time, active_entry.project_name, active_entry.start_time
+                    ).seq
+                    self._journal_active = None
+        else:
+            # Check, record the Stop transaction, close the session and
+            # update the rollup under a single write lock and commit
+            try:
+                with db_manager.transaction(immediate=True):
+                    active_entry = self.active_cache.get()
+                    if active_entry is not None:
+                        self._record_stop(active_entry, current_time)
+                        self.active_cache.set(None)
+            except Exception:
+                self.active_cache.invalidate()
+                raise
 
         if active_entry is None:
             return (
@@ -72,22 +203,12 @@ class TrackingService:
                 None
             )
 
-        # Stop tracking
-        current_time = int(time.time())
-        elapsed = current_time - active_entry.start_time
-
-        # Create Stop transaction
-        transaction_repo.insert_transaction('Stop', current_time, active_entry.project_name)
-
-        # Update tracking entry
-        tracking_repo.update_tracking_entry(
-            active_entry.entry_id,
-            current_time,
-            elapsed
+        entry = replace(
+            active_entry,
+            stop_time=current_time,
+            time_elapsed=current_time - active_entry.start_time
         )
-
-        # Retrieve updated entry
-        entry = tracking_repo.get_entry_by_id(active_entry.entry_id)
+        self.bus.publish(TrackingStopped(entry))
 
         return (
             True,
@@ -95,14 +216,200 @@ class TrackingService:
             entry
         )
 
+    def _record_start(self, project_name: str, start_time: int) -> TrackingEntry:
+        """
+        Write a Start transaction and open a session.
+
+        Call inside a transaction.
+
+        Args:
+            project_name: Name of the project
+            start_time: Unix timestamp of the start
+
+        Returns:
+            The new active entry
+        """
+        transaction_repo.insert_transaction('Start', start_time, project_name)
+        entry_id = tracking_repo.insert_tracking_entry(project_name, start_time)
+        return TrackingEntry(
+            entry_id=entry_id,
+            project_name=project_name,
+            start_time=start_time,
+            stop_time=None,
+            time_elapsed=None
+        )
+
+    def _record_stop(self, active_entry: TrackingEntry, stop_time: int) -> None:
+        """
+        Write a Stop transaction, close a session and update the rollups.
+
+        Call inside a transaction.
+
+        Args:
+            active_entry: Session to close
+            stop_time: Unix timestamp of the stop
+        """
+        elapsed = stop_time - active_entry.start_time
+        transaction_repo.insert_transaction('Stop', stop_time, active_entry.project_name)
+        tracking_repo.update_tracking_entry(active_entry.entry_id, stop_time, elapsed)
+        rollup_repo.add_session(active_entry.project_name, active_entry.start_time, stop_time, elapsed)
+
+    def enable_journal(self, path: Path) -> None:
+        """
+        Record starts and stops in a journal instead of writing them directly.
+
+        Replays records left in the journal by an earlier run first, so
+        the database is current when this returns. From then on toggles
+        cost an fsync of a local file; the journal's flusher thread
+        writes them to the database in batches.
+
+        Args:
+            path: Journal file
+
+        Raises:
+            Exception: If the leftover records cannot be replayed
+        """
+        journal = TransactionJournal(path, self._apply_journal, self._poll_journal)
+        journal.load()
+        journal.flush()
+        with self._toggle_lock:
+            self._journal_active = self.active_cache.get()
+            self._journal_seq = 0
+            self._journal_applied_seq = 0
+            self.journal = journal
+        journal.start()
+
+    def disable_journal(self) -> None:
+        """Flush the journal if possible and write toggles directly again."""
+        if self.journal is None:
+            return
+        self.journal.close()
+        with self._toggle_lock:
+            self.journal = None
+            self._journal_active = None
+        self.active_cache.invalidate()
+
+    def _apply_journal(self, journal_id: str, records: List[JournalRecord]) -> None:
+        """
+        Write a batch of journal records to the database in one commit.
+
+        Records are replayed against the database's own state: a start
+        while a session is already active, or a stop of any session other
+        than the one it was journaled for, is skipped. Either happens when
+        another process toggled meanwhile.
+
+        Args:
+            journal_id: ID of the journal the records come from
+            records: Records in sequence order
+        """
+        applied = skipped = 0
+        with db_manager.transaction(immediate=True):
+            applied_seq = journal_repo.get_applied_seq(journal_id)
+            active_entry = tracking_repo.get_active_entry()
+            for record in records:
+                if record.seq <= applied_seq:
+                    continue
+                if record.action == 'Start' and active_entry is None:
+                    active_entry = self._record_start(record.project_name, record.timestamp)
+                elif (record.action == 'Stop'
+                        and active_entry is not None
+                        and active_entry.project_name == record.project_name
+                        and active_entry.start_time == record.session_start):
+                    self._record_stop(active_entry, record.timestamp)
+                    active_entry = None
+                else:
+                    logger.warning("Skipping journaled %s that conflicts with the database", record)
+                    skipped += 1
+                    continue
+                applied += 1
+            journal_repo.set_applied_seq(journal_id, records[-1].seq)
+            self.active_cache.set(active_entry)
+        self._journal_applied_seq = records[-1].seq
+
+        with self._toggle_lock:
+            # Adopt the database's view unless newer toggles are pending
+            if self.journal is not None and self._journal_seq <= records[-1].seq:
+                self._journal_active = active_entry
+        if applied or skipped:
+            self.bus.publish(JournalFlushed(applied, skipped))
+
     def get_current_status(self) -> Optional[TrackingEntry]:
         """
         Get the current tracking status.
 
+        With the journal enabled this is answered from memory; toggles by
+        other processes are picked up by the flusher thread within
+        JOURNAL_POLL_INTERVAL and published as ActiveEntryReloaded.
+
         Returns:
             Active TrackingEntry if tracking, None otherwise
         """
-        return tracking_repo.get_active_entry()
+        if self.journal is not None:
+            return self._journal_active
+        return self.active_cache.get()
+
+    def _poll_journal(self) -> None:
+        """
+        Adopt starts and stops made by other processes while journaling.
+
+        Runs on the flusher thread while no toggles are pending, so status
+        reads and toggles never query the database themselves. Costs a
+        PRAGMA when nothing changed.
+        """
+        entry = self.active_cache.get()
+        with self._toggle_lock:
+            shown = self._journal_active
+            if self.journal is None or self.journal.get_pending():
+                # Toggled meanwhile; the next flush reconciles instead
+                return
+            if (entry and (entry.project_name, entry.start_time)) == \
+                    (shown and (shown.project_name, shown.start_time)):
+                return
+            self._journal_active = entry
+        self.bus.publish(ActiveEntryReloaded(entry))
+
+    def _journaled_sessions(self) -> List[Tuple[str, int, int]]:
+        """
+        Get the sessions stopped in the journal but not yet in the database.
+
+        Returns:
+            List of (project_name, start_time, stop_time) tuples
+        """
+        journal = self.journal
+        if journal is None:
+            return []
+        applied_seq = self._journal_applied_seq
+        return [
+            (record.project_name, record.session_start, record.timestamp)
+            for record in journal.get_pending()
+            if record.action == 'Stop' and record.seq > applied_seq
+        ]
+
+    def get_completed_totals(self) -> Dict[str, int]:
+        """
+        Get total time per project over completed sessions only.
+
+        The result is cached until the change token moves, so callers that
+        add the active session's time themselves (such as a live summary)
+        can call this every tick without querying the database. Sessions
+        stopped in the journal count before the flusher writes them.
+
+        Returns:
+            Dictionary mapping project name to total seconds
+        """
+        token = (self.get_change_token(), self._journal_applied_seq)
+        if token != self._completed_totals_token:
+            store = self._refreshed_store()
+            if store is not None:
+                self._completed_totals = store.project_totals()
+            else:
+                self._completed_totals = rollup_repo.get_project_totals()
+            self._completed_totals_token = token
+
+        totals = dict(self._completed_totals)
+        for project_name, start_time, stop_time in self._journaled_sessions():
+            totals[project_name] = totals.get(project_name, 0) + stop_time - start_time
+        return totals
 
     def get_summary_report(self) -> Dict[str, int]:
         """
@@ -111,10 +418,10 @@ class TrackingService:
         Returns:
             Dictionary mapping project name to total seconds
         """
-        totals = tracking_repo.get_project_totals()
+        totals = self.get_completed_totals()
 
         # Also include time from active session if any
-        active_entry = tracking_repo.get_active_entry()
+        active_entry = self.get_current_status()
         if active_entry:
             current_elapsed = active_entry.calculate_current_elapsed()
             project = active_entry.project_name
@@ -126,21 +433,155 @@ class TrackingService:
 
         return totals
 
-    def get_detail_report(self, project_name: Optional[str] = None) -> List[TrackingEntry]:
+    def get_bucketed_report(
+        self,
+        bucket: str = 'day',
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Get total time per project per day, week or month (local time).
+
+        Sessions that cross midnight are split between the days they span,
+        sessions stopped in the journal count before the flusher writes
+        them, and the active session counts up to now. For example, the last 12
+        months by week is get_bucketed_report('week', since=a_year_ago).
+
+        Args:
+            bucket: 'day', 'week' or 'month'
+            since: Optional first local date to include
+            until: Optional local date to stop before (exclusive)
+
+        Returns:
+            List of (bucket_key, project_name, seconds) tuples sorted by
+            bucket then project
+        """
+        store = self._refreshed_store()
+        if store is not None:
+            rows = store.bucket_totals(
+                bucket,
+                local_midnight(since) if since is not None else None,
+                local_midnight(until) if until is not None else None
+            )
+        else:
+            rows = rollup_repo.get_bucket_totals(
+                bucket,
+                since.isoformat() if since is not None else None,
+                until.isoformat() if until is not None else None
+            )
+
+        # Also include journaled sessions and the active session, if any
+        sessions = self._journaled_sessions()
+        active_entry = self.get_current_status()
+        if active_entry is not None:
+            sessions.append((active_entry.project_name, active_entry.start_time, int(time.time())))
+        if not sessions:
+            return rows
+
+        totals = {(key, project_name): seconds for key, project_name, seconds in rows}
+        for project_name, start_time, stop_time in sessions:
+            for day, seconds in split_by_local_day(start_time, stop_time):
+                if since is not None and day < since.isoformat():
+                    continue
+                if until is not None and day >= until.isoformat():
+                    continue
+                key = (bucket_key(day, bucket), project_name)
+                totals[key] = totals.get(key, 0) + seconds
+
+        return sorted(
+            (key, project_name, seconds)
+            for (key, project_name), seconds in totals.items()
+        )
+
+    def rebuild_totals(self) -> int:
+        """
+        Rebuild the per-project totals rollup from session history.
+
+        Returns:
+            Number of projects in the rebuilt rollup
+        """
+        count = rollup_repo.rebuild_project_totals()
+        self.bus.publish(TotalsRebuilt('project_totals'))
+        return count
+
+    def rebuild_daily_rollup(self) -> int:
+        """
+        Rebuild the daily rollup from session history.
+
+        Returns:
+            Number of (day, project) rows in the rebuilt rollup
+        """
+        count = rollup_repo.rebuild_daily_rollup()
+        self.bus.publish(TotalsRebuilt('daily_rollup'))
+        return count
+
+    def verify_totals(self) -> List[Tuple[str, int, int]]:
+        """
+        Check the per-project totals rollup against session history.
+
+        Returns:
+            List of (project_name, rollup_seconds, actual_seconds) mismatches
+        """
+        return rollup_repo.verify_project_totals()
+
+    def get_detail_report(
+        self,
+        project_name: Optional[str] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> List[TrackingEntry]:
         """
         Get detailed report of tracking sessions.
 
         Args:
             project_name: Optional project name to filter by
+            since: Optional first local date to include
+            until: Optional local date to stop before (exclusive)
 
         Returns:
             List of TrackingEntry objects
         """
-        if project_name:
-            return tracking_repo.get_entries_by_project(project_name)
-        else:
+        if since is None and until is None:
+            if project_name:
+                return tracking_repo.get_entries_by_project(project_name)
             return tracking_repo.get_all_entries()
 
+        return list(tracking_repo.iter_entries_in_range(
+            project_name or None,
+            local_midnight(since) if since is not None else None,
+            local_midnight(until) if until is not None else None
+        ))
+
+    def get_detail_page(
+        self,
+        project_name: Optional[str] = None,
+        after: Optional[TrackingEntry] = None,
+        limit: int = DETAIL_PAGE_SIZE,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> List[TrackingEntry]:
+        """
+        Get one page of the detail report, newest sessions first.
+
+        Args:
+            project_name: Optional project name to filter by
+            after: Last entry of the previous page, or None for the first page
+            limit: Maximum number of entries to return
+            since: Optional first local date to include
+            until: Optional local date to stop before (exclusive)
+
+        Returns:
+            List of TrackingEntry objects
+        """
+        cursor = (after.start_time, after.entry_id) if after is not None else None
+        return tracking_repo.get_entries_page(
+            project_name,
+            cursor,
+            limit,
+            local_midnight(since) if since is not None else None,
+            local_midnight(until) if until is not None else None
+        )
+
 
 # Global service instance
-tracking_service = TrackingService()
+tracking_service = TrackingService(session_store if COLUMNAR_STORE_ENABLED else None)
@@ -1,28 +1,57 @@
 """Detail report screen showing session history."""
 
+from datetime import date, timedelta
+from typing import Callable, List, Optional
+
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Vertical
+from textual.containers import Container, Horizontal, Vertical
+from textual.message import Message
 from textual.screen import Screen
-from textual.widgets import Button, DataTable, Header, Label, Select, Static
+from textual.widgets import Button, DataTable, Header, Input, Label, Static
 
+from ...services.event_bus import ActiveEntryReloaded, JournalFlushed, TrackingEvent, event_bus
+from ...services.project_service import project_service
 from ...services.tracking_service import tracking_service
+from ...utils.constants import DETAIL_PAGE_SIZE, DETAIL_PREFETCH_ROWS
 from ...utils.time_utils import format_datetime_short, format_elapsed_time
+from ..widgets.project_picker import ProjectPicker
 
 
 class DetailScreen(Screen):
-    """Detail report showing individual tracking sessions."""
+    """
+    Detail report showing individual tracking sessions.
+
+    The screen is reused across visits: loaded pages and filters are kept,
+    and the report is re-queried on return only if the tracking service's
+    change token shows a write since it was loaded. While shown, it also
+    reloads when the journal's flusher commits sessions or notices another
+    process's toggles.
+    """
 
     BINDINGS = [
-        Binding("m", "pop_screen", "Main"),
+        Binding("m", "app.show_main", "Main"),
         Binding("s", "show_summary", "Summary"),
-        Binding("escape", "pop_screen", "Back"),
+        Binding("escape", "app.show_main", "Back"),
+        Binding("slash", "focus_search", "Search"),
     ]
 
+    # Start in the project list, where the letter bindings still work
+    AUTO_FOCUS = "#project-filter OptionList"
+
     def __init__(self):
         """Initialize the detail screen."""
         super().__init__()
         self.filter_project = None
+        self.filter_since = None
+        self.filter_until = None
+        self.last_entry = None
+        self.has_more = False
+        self.change_token = None
+        self._unsubscribe: List[Callable[[], None]] = []
+
+    class DataChanged(Message):
+        """The journal's flusher changed the data; posted from its thread."""
 
     def compose(self) -> ComposeResult:
         """Compose the detail screen layout."""
@@ -30,11 +59,12 @@ class DetailScreen(Screen):
         yield Container(
             Vertical(
                 Static("Session History", id="detail-title"),
-                Label("Filter:"),
-                Select(
-                    options=[("All Projects", None)],
-                    id="project-filter",
-                    value=None
+                Label("Filter: All Projects", id="filter-label"),
+                ProjectPicker(all_label="All Projects", id="project-filter"),
+                Horizontal(
+                    Input(placeholder="From YYYY-MM-DD", id="since-filter"),
+                    Input(placeholder="To YYYY-MM-DD", id="until-filter"),
+                    id="date-filter"
                 ),
                 DataTable(id="detail-table"),
                 Container(
@@ -48,35 +78,121 @@ class DetailScreen(Screen):
 
     def on_mount(self) -> None:
         """Handle screen mount."""
-        # Set up project filter
-        app = self.app
-        filter_options = [("All Projects", None)]
-        filter_options.extend([(proj, proj) for proj in app.projects])
-
-        filter_select = self.query_one("#project-filter", Select)
-        filter_select.set_options(filter_options)
+        self.project_picker = self.query_one("#project-filter", ProjectPicker)
 
         # Set up the data table
-        table = self.query_one("#detail-table", DataTable)
+        table = self.table = self.query_one("#detail-table", DataTable)
         table.add_columns("Start", "Stop", "Duration", "Project")
         table.cursor_type = "row"
 
+        # Load more rows as the table scrolls towards the end
+        self.watch(table, "scroll_y", self.on_table_scrolled, init=False)
+
+        # Hear about writes made off the UI thread
+        self._unsubscribe = [
+            event_bus.subscribe(JournalFlushed, self._on_flusher_event),
+            event_bus.subscribe(ActiveEntryReloaded, self._on_flusher_event),
+        ]
+
         # Load detail data
         self.load_detail_data()
 
-    def on_select_changed(self, event: Select.Changed) -> None:
-        """Handle filter selection change."""
-        if event.select.id == "project-filter":
-            self.filter_project = event.value if event.value != Select.BLANK else None
+    def on_unmount(self) -> None:
+        """Stop following the flusher."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+
+    def _on_flusher_event(self, event: TrackingEvent) -> None:
+        """Hand a flusher event to the UI thread; post_message is thread-safe."""
+        self.post_message(self.DataChanged())
+
+    def on_detail_screen_data_changed(self, message: DataChanged) -> None:
+        """Reload if shown and the data changed since it was loaded."""
+        if self.is_current and tracking_service.get_change_token() != self.change_token:
             self.load_detail_data()
 
-    def load_detail_data(self) -> None:
-        """Load and display detail data."""
-        table = self.query_one("#detail-table", DataTable)
-        table.clear()
+    def on_screen_resume(self) -> None:
+        """Catch up on project list edits and sessions written meanwhile."""
+        self.app.refresh_projects()
+        self.project_picker.refresh_matches()
+        if self.filter_project is not None and self.filter_project not in project_service.get_catalog():
+            # The filtered project is gone from projects.txt
+            self.set_filter_project(None)
+        elif tracking_service.get_change_token() != self.change_token:
+            self.load_detail_data()
+
+    def on_project_picker_selected(self, event: ProjectPicker.Selected) -> None:
+        """Handle filter selection change."""
+        self.set_filter_project(event.value)
+
+    def set_filter_project(self, project_name: Optional[str]) -> None:
+        """
+        Show the sessions of one project, or of all projects.
+
+        Args:
+            project_name: Project to show, or None for all projects
+        """
+        self.filter_project = project_name
+        self.query_one("#filter-label", Label).update(
+            f"Filter: {project_name or 'All Projects'}"
+        )
+        self.load_detail_data()
 
-        # Get detail report
-        entries = tracking_service.get_detail_report(self.filter_project)
+    def action_focus_search(self) -> None:
+        """Focus the project search box."""
+        self.project_picker.search_input.focus()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Handle date range filter changes."""
+        if event.input.id not in ("since-filter", "until-filter"):
+            return
+
+        text = event.value.strip()
+        if text:
+            try:
+                day = date.fromisoformat(text)
+            except ValueError:
+                # Wait until a complete, valid date has been typed
+                event.input.add_class("invalid")
+                return
+        else:
+            day = None
+        event.input.remove_class("invalid")
+
+        if event.input.id == "since-filter":
+            self.filter_since = day
+        else:
+            # The "To" date is inclusive; the query bound is exclusive
+            self.filter_until = day + timedelta(days=1) if day else None
+        self.load_detail_data()
+
+    def load_detail_data(self) -> None:
+        """Reset the table and load the first page of detail data."""
+        self.change_token = tracking_service.get_change_token()
+        self.table.clear()
+
+        self.last_entry = None
+        self.has_more = True
+        self.load_next_page()
+
+    def load_next_page(self) -> None:
+        """Append the next page of sessions to the table."""
+        if not self.has_more:
+            return
+
+        table = self.table
+
+        # Get the next page of the detail report
+        entries = tracking_service.get_detail_page(
+            self.filter_project,
+            after=self.last_entry,
+            since=self.filter_since,
+            until=self.filter_until
+        )
+        self.has_more = len(entries) == DETAIL_PAGE_SIZE
+        if entries:
+            self.last_entry = entries[-1]
 
         # Add rows
         for entry in entries:
@@ -91,14 +207,23 @@ class DetailScreen(Screen):
 
             table.add_row(start, stop, duration, entry.project_name)
 
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Load the next page when the cursor nears the last loaded row."""
+        if event.cursor_row >= event.data_table.row_count - DETAIL_PREFETCH_ROWS:
+            self.load_next_page()
+
+    def on_table_scrolled(self, scroll_y: float) -> None:
+        """Load the next page when the table is scrolled near the bottom."""
+        if scroll_y >= self.table.max_scroll_y - DETAIL_PREFETCH_ROWS:
+            self.load_next_page()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "main-btn":
-            self.app.pop_screen()
+            self.app.show_screen("main")
         elif event.button.id == "summary-btn":
             self.action_show_summary()
 
     def action_show_summary(self) -> None:
         """Show the summary screen."""
-        from .summary_screen import SummaryScreen
-        self.app.push_screen(SummaryScreen())
+        self.app.show_screen("summary")
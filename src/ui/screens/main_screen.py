@@ -4,21 +4,34 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.screen import Screen
-from textual.widgets import Button, Header, Select, Static, Label
+from textual.widgets import Button, Header, Static, Label
 from textual.reactive import reactive
 
 from ...services.tracking_service import tracking_service
 from ...utils.time_utils import format_elapsed_time
+from ..widgets.project_picker import ProjectPicker
 
 
 class MainScreen(Screen):
-    """Main time tracking interface."""
+    """
+    Main time tracking interface.
+
+    The screen runs no timer: it watches the app's active_entry and
+    elapsed_seconds, which the app's single clock advances.
+
+    Projects are picked by type-ahead search; the list starts on the
+    most recently used projects and never renders more than a few.
+    """
 
     BINDINGS = [
         Binding("r", "show_reports", "Reports"),
         Binding("s", "toggle_tracking", "Start/Stop"),
+        Binding("slash", "focus_search", "Search"),
     ]
 
+    # Start in the match list, where the letter bindings still work
+    AUTO_FOCUS = "#project-picker OptionList"
+
     # Reactive attributes
     elapsed_seconds = reactive(0)
     is_tracking = reactive(False)
@@ -28,7 +41,6 @@ class MainScreen(Screen):
         """Initialize the main screen."""
         super().__init__()
         self.selected_project = None
-        self.update_timer = None
 
     def compose(self) -> ComposeResult:
         """Compose the main screen layout."""
@@ -40,11 +52,7 @@ class MainScreen(Screen):
                 Static("", id="project-display"),
                 Static("00:00:00", id="elapsed-display"),
                 Label("Select Project:"),
-                Select(
-                    options=[("Loading...", "loading")],
-                    id="project-select",
-                    allow_blank=False
-                ),
+                ProjectPicker(id="project-picker"),
                 Container(
                     Button("Start", id="start-stop-btn", variant="primary"),
                     Button("Reports", id="reports-btn"),
@@ -57,36 +65,55 @@ class MainScreen(Screen):
 
     def on_mount(self) -> None:
         """Handle screen mount."""
-        # Load projects into select widget
+        # Cache widget references used on every update
+        self.status_label = self.query_one("#status-display", Static)
+        self.project_label = self.query_one("#project-display", Static)
+        self.elapsed_label = self.query_one("#elapsed-display", Static)
+        self.toggle_button = self.query_one("#start-stop-btn", Button)
+        self.project_picker = self.query_one("#project-picker", ProjectPicker)
+
+        # Follow the app's session state and clock
         app = self.app
-        project_options = [(proj, proj) for proj in app.projects]
-        select_widget = self.query_one("#project-select", Select)
-        select_widget.set_options(project_options)
+        self.watch(app, "active_entry", self.on_active_entry_changed)
+        self.watch(app, "elapsed_seconds", self.on_elapsed_changed)
+
+    def on_screen_resume(self) -> None:
+        """Catch up on ticks and project list edits made meanwhile."""
+        self.app.refresh_projects()
+        self.project_picker.refresh_matches()
+        self.on_elapsed_changed(self.app.elapsed_seconds)
 
-        # Check for active tracking
-        active_entry = app.active_entry
+    def on_active_entry_changed(self, active_entry) -> None:
+        """Show a session starting or stopping."""
         if active_entry:
             self.is_tracking = True
             self.current_project = active_entry.project_name
             self.selected_project = active_entry.project_name
-            select_widget.value = active_entry.project_name
-
-            # Start live updates
-            self.start_live_updates()
+            self.project_picker.select(active_entry.project_name)
         else:
             self.is_tracking = False
-            # Set first project as default selection
-            if app.projects:
-                self.selected_project = app.projects[0]
-                select_widget.value = app.projects[0]
-
-        # Update display
+            self.current_project = ""
         self.update_display()
 
-    def on_select_changed(self, event: Select.Changed) -> None:
+    def on_elapsed_changed(self, elapsed_seconds: int) -> None:
+        """Update the elapsed time display from the app clock."""
+        self.elapsed_seconds = elapsed_seconds
+        # Screens below the current one catch up when resumed
+        if self.is_current:
+            self.elapsed_label.update(format_elapsed_time(elapsed_seconds))
+
+    def on_project_picker_highlighted(self, event: ProjectPicker.Highlighted) -> None:
         """Handle project selection change."""
-        if event.value != Select.BLANK:
-            self.selected_project = str(event.value)
+        self.selected_project = event.value
+
+    def on_project_picker_selected(self, event: ProjectPicker.Selected) -> None:
+        """Move to the Start button once a project is chosen."""
+        self.selected_project = event.value
+        self.toggle_button.focus()
+
+    def action_focus_search(self) -> None:
+        """Focus the project search box."""
+        self.project_picker.search_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -98,16 +125,11 @@ class MainScreen(Screen):
             self.app.exit()
 
     def action_toggle_tracking(self) -> None:
-        """Toggle tracking on/off."""
+        """Toggle tracking on/off; the app follows the resulting event."""
         if self.is_tracking:
             # Stop tracking
             success, message, entry = tracking_service.stop_tracking()
             if success:
-                self.is_tracking = False
-                self.current_project = ""
-                self.elapsed_seconds = 0
-                self.stop_live_updates()
-                self.app.active_entry = None
                 self.notify(message)
         else:
             # Start tracking
@@ -117,59 +139,26 @@ class MainScreen(Screen):
 
             success, message, entry = tracking_service.start_tracking(self.selected_project)
             if success:
-                self.is_tracking = True
-                self.current_project = self.selected_project
-                self.app.active_entry = entry
-                self.start_live_updates()
                 self.notify(message)
             else:
                 # Show warning about existing tracking
                 self.notify(message, severity="warning", timeout=5)
 
-        self.update_display()
-
-    def start_live_updates(self) -> None:
-        """Start the live elapsed time updates."""
-        self.update_timer = self.set_interval(1.0, self.update_elapsed_time)
-
-    def stop_live_updates(self) -> None:
-        """Stop the live elapsed time updates."""
-        if self.update_timer:
-            self.update_timer.stop()
-            self.update_timer = None
-
-    def update_elapsed_time(self) -> None:
-        """Update the elapsed time display."""
-        if self.is_tracking and self.app.active_entry:
-            self.elapsed_seconds = self.app.active_entry.calculate_current_elapsed()
-            elapsed_label = self.query_one("#elapsed-display", Static)
-            elapsed_label.update(format_elapsed_time(self.elapsed_seconds))
-
     def update_display(self) -> None:
         """Update the display based on current state."""
-        status_label = self.query_one("#status-display", Static)
-        project_label = self.query_one("#project-display", Static)
-        elapsed_label = self.query_one("#elapsed-display", Static)
-        button = self.query_one("#start-stop-btn", Button)
-
         if self.is_tracking:
-            status_label.update("Status: [green]TRACKING[/green]")
-            project_label.update(f"Project: [bold]{self.current_project}[/bold]")
-
-            if self.app.active_entry:
-                self.elapsed_seconds = self.app.active_entry.calculate_current_elapsed()
-                elapsed_label.update(format_elapsed_time(self.elapsed_seconds))
-
-            button.label = "Stop"
-            button.variant = "error"
+            self.status_label.update("Status: [green]TRACKING[/green]")
+            self.project_label.update(f"Project: [bold]{self.current_project}[/bold]")
+            self.elapsed_label.update(format_elapsed_time(self.elapsed_seconds))
+            self.toggle_button.label = "Stop"
+            self.toggle_button.variant = "error"
         else:
-            status_label.update("Status: [dim]IDLE[/dim]")
-            project_label.update("Project: -")
-            elapsed_label.update("00:00:00")
-            button.label = "Start"
-            button.variant = "success"
+            self.status_label.update("Status: [dim]IDLE[/dim]")
+            self.project_label.update("Project: -")
+            self.elapsed_label.update("00:00:00")
+            self.toggle_button.label = "Start"
+            self.toggle_button.variant = "success"
 
     def action_show_reports(self) -> None:
         """Show the reports screen."""
-        from .summary_screen import SummaryScreen
-        self.app.push_screen(SummaryScreen())
+        self.app.show_screen("summary")
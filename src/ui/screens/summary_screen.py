@@ -1,24 +1,44 @@
 """Summary report screen."""
 
+from typing import Dict, Optional, Tuple
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Header, Static
 
+from ...models.tracking_entry import TrackingEntry
 from ...services.tracking_service import tracking_service
 from ...utils.time_utils import format_elapsed_time
 
+TOTAL_ROW = "__total__"
+
 
 class SummaryScreen(Screen):
-    """Summary report showing total time per project."""
+    """
+    Summary report showing total time per project.
+
+    Completed-session totals are loaded once and kept; while a session is
+    running, its project's row and the total are ticked in place from the
+    app clock. The totals are re-read only when the tracking service's
+    change token shows a write, checked on each tick, when a session
+    starts or stops and when the screen is shown again.
+    """
 
     BINDINGS = [
-        Binding("m", "pop_screen", "Main"),
+        Binding("m", "app.show_main", "Main"),
         Binding("d", "show_detail", "Detail"),
-        Binding("escape", "pop_screen", "Back"),
+        Binding("escape", "app.show_main", "Back"),
     ]
 
+    def __init__(self):
+        """Initialize the summary screen."""
+        super().__init__()
+        self.completed_totals: Dict[str, int] = {}
+        self.active_entry: Optional[TrackingEntry] = None
+        self.change_token: Optional[Tuple[int, int]] = None
+
     def compose(self) -> ComposeResult:
         """Compose the summary screen layout."""
         yield Header()
@@ -38,20 +58,34 @@ class SummaryScreen(Screen):
     def on_mount(self) -> None:
         """Handle screen mount."""
         # Set up the data table
-        table = self.query_one("#summary-table", DataTable)
-        table.add_columns("Project", "Total Time")
-        table.cursor_type = "row"
+        self.table = self.query_one("#summary-table", DataTable)
+        self.table.add_column("Project", key="project")
+        self.table.add_column("Total Time", key="total")
+        self.table.cursor_type = "row"
 
-        # Load summary data
+        # Load summary data, then keep it current from the app clock
         self.load_summary_data()
+        self.watch(self.app, "active_entry", self.refresh_live, init=False)
+        self.watch(self.app, "elapsed_seconds", self.refresh_live, init=False)
+
+    def on_screen_resume(self) -> None:
+        """Catch up on writes and ticks made while hidden."""
+        self.refresh_live()
 
     def load_summary_data(self) -> None:
         """Load and display summary data."""
-        table = self.query_one("#summary-table", DataTable)
+        self.change_token = tracking_service.get_change_token()
+        self.completed_totals = tracking_service.get_completed_totals()
+        self.active_entry = tracking_service.get_current_status()
+
+        table = self.table
         table.clear()
 
         # Get summary report
-        totals = tracking_service.get_summary_report()
+        totals = dict(self.completed_totals)
+        if self.active_entry is not None:
+            project = self.active_entry.project_name
+            totals[project] = totals.get(project, 0) + self.active_entry.calculate_current_elapsed()
 
         # Sort by total time (descending)
         sorted_projects = sorted(
@@ -60,25 +94,50 @@ class SummaryScreen(Screen):
             reverse=True
         )
 
-        # Add rows
+        # Add rows, keyed by project so live updates can find them
         grand_total = 0
         for project, total_seconds in sorted_projects:
-            table.add_row(project, format_elapsed_time(total_seconds))
+            table.add_row(project, format_elapsed_time(total_seconds), key=project)
             grand_total += total_seconds
 
         # Add separator and total
         if sorted_projects:
             table.add_row("─" * 20, "─" * 15)
-            table.add_row("[bold]TOTAL[/bold]", f"[bold]{format_elapsed_time(grand_total)}[/bold]")
+            table.add_row(
+                "[bold]TOTAL[/bold]",
+                f"[bold]{format_elapsed_time(grand_total)}[/bold]",
+                key=TOTAL_ROW
+            )
+
+    def refresh_live(self) -> None:
+        """Re-query after a write, otherwise tick the active session in place."""
+        if not self.is_current:
+            return
+        if tracking_service.get_change_token() != self.change_token:
+            self.load_summary_data()
+            return
+        if self.active_entry is None:
+            return
+
+        project = self.active_entry.project_name
+        elapsed = self.app.elapsed_seconds
+        project_total = self.completed_totals.get(project, 0) + elapsed
+        grand_total = sum(self.completed_totals.values()) + elapsed
+
+        self.table.update_cell(project, "total", format_elapsed_time(project_total))
+        self.table.update_cell(
+            TOTAL_ROW,
+            "total",
+            f"[bold]{format_elapsed_time(grand_total)}[/bold]"
+        )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "main-btn":
-            self.app.pop_screen()
+            self.app.show_screen("main")
         elif event.button.id == "detail-btn":
             self.action_show_detail()
 
     def action_show_detail(self) -> None:
         """Show the detail screen."""
-        from .detail_screen import DetailScreen
-        self.app.push_screen(DetailScreen())
+        self.app.show_screen("detail")
@@ -0,0 +1,155 @@
+"""Type-ahead project picker."""
+
+from typing import List, Optional
+
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.message import Message
+from textual.widgets import Input, OptionList
+from textual.widgets.option_list import Option
+
+from ...services.project_search import project_search_service
+from ...services.project_service import project_service
+
+
+class ProjectPicker(Vertical):
+    """
+    Search box above a short list of matching projects.
+
+    Only the best PROJECT_SEARCH_LIMIT matches are rendered, so building
+    and scrolling the list does not grow with the number of projects;
+    typing narrows the matches through the project search index. With an
+    empty search box the most recently used projects are listed.
+    """
+
+    BINDINGS = [
+        Binding("down", "focus_matches", "Matches", show=False),
+    ]
+
+    class Highlighted(Message):
+        """A project was highlighted, or None when nothing matches."""
+
+        def __init__(self, value: Optional[str]) -> None:
+            super().__init__()
+            self.value = value
+
+    class Selected(Message):
+        """A project was chosen with Enter or a click (None for all_label)."""
+
+        def __init__(self, value: Optional[str]) -> None:
+            super().__init__()
+            self.value = value
+
+    def __init__(
+        self,
+        all_label: Optional[str] = None,
+        placeholder: str = "Type to search projects",
+        id: Optional[str] = None
+    ):
+        """
+        Initialize the picker.
+
+        Args:
+            all_label: Label of an extra first option with the value None,
+                shown while the search box is empty
+            placeholder: Placeholder of the search box
+            id: Widget ID
+        """
+        super().__init__(id=id)
+        self.all_label = all_label
+        self.placeholder = placeholder
+        # Highlighted project, and the project of each rendered option
+        self.value: Optional[str] = None
+        self.values: List[Optional[str]] = []
+
+    def compose(self) -> ComposeResult:
+        """Compose the search box and the match list."""
+        yield Input(placeholder=self.placeholder)
+        yield OptionList()
+
+    def on_mount(self) -> None:
+        """Cache the child widgets and list the first matches."""
+        self.search_input = self.query_one(Input)
+        self.matches = self.query_one(OptionList)
+        self.refresh_matches()
+
+    def refresh_matches(self, keep_value: bool = True) -> None:
+        """
+        Re-run the search for the text typed so far.
+
+        Args:
+            keep_value: Keep the highlighted project while it is in
+                projects.txt, even if it is not among the matches;
+                otherwise the best match is highlighted
+        """
+        query = self.search_input.value
+        names, total = project_search_service.search(query)
+
+        values: List[Optional[str]] = []
+        if self.all_label is not None and not query.strip():
+            values.append(None)
+        values.extend(names)
+        options = [Option(Text(self.all_label if value is None else value)) for value in values]
+        if total > len(names):
+            options.append(Option(f"[dim]{total - len(names):,} more, keep typing[/dim]", disabled=True))
+
+        self.values = values
+        self.matches.clear_options()
+        self.matches.add_options(options)
+        if keep_value and self.value in values:
+            self.matches.highlighted = values.index(self.value)
+        elif keep_value and self.value in project_service.get_catalog():
+            # Still valid, just not among the best matches
+            pass
+        elif values:
+            self.matches.highlighted = 0
+        else:
+            self._set_value(None)
+
+    def select(self, project_name: str) -> None:
+        """
+        Highlight a project, listing it first if it is not shown.
+
+        Args:
+            project_name: Project to highlight
+        """
+        self._set_value(project_name)
+        if project_name in self.values:
+            self.matches.highlighted = self.values.index(project_name)
+        else:
+            with self.search_input.prevent(Input.Changed):
+                self.search_input.value = ""
+            self.refresh_matches()
+
+    def _set_value(self, value: Optional[str]) -> None:
+        """Record the highlighted project and report a change."""
+        if value != self.value:
+            self.value = value
+            self.post_message(self.Highlighted(value))
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Narrow the matches as the user types."""
+        event.stop()
+        self.refresh_matches(keep_value=False)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Choose the highlighted match."""
+        event.stop()
+        if self.values:
+            self.post_message(self.Selected(self.value))
+
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        """Follow the highlight in the match list."""
+        event.stop()
+        self._set_value(self.values[event.option_index])
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Choose the match selected in the list."""
+        event.stop()
+        self.post_message(self.Selected(self.values[event.option_index]))
+
+    def action_focus_matches(self) -> None:
+        """Move from the search box into the match list."""
+        self.matches.focus()
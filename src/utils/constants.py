@@ -12,3 +12,56 @@ PROJECTS_FILE = DATA_DIR / "projects.txt"
 
 # UI update intervals
 UPDATE_INTERVAL = 1.0  # seconds
+
+# Detail report paging
+DETAIL_PAGE_SIZE = 100  # rows fetched per page
+DETAIL_PREFETCH_ROWS = 20  # load the next page when this close to the end
+
+# Project search (src/services/project_search.py): matches rendered in
+# the type-ahead project lists
+PROJECT_SEARCH_LIMIT = 8
+
+# Recently used projects (src/services/recent_projects.py): how many are
+# cached, and how many of the latest transactions are read to find them
+RECENT_PROJECTS_LIMIT = 8
+RECENT_PROJECTS_SCAN_ROWS = 1000
+
+# Database storage profile (see src/database/storage_profile.py):
+# "wal" for local disks, "compat" for network filesystems without WAL support
+STORAGE_PROFILE = "wal"
+
+# Serve summary and bucketed reports from the in-memory columnar session
+# store (src/services/session_store.py) instead of querying SQLite
+COLUMNAR_STORE_ENABLED = False
+
+# Rows fetched per round trip by the streaming repository APIs
+STREAM_BATCH_SIZE = 1000
+
+# Seconds a read waits for a pooled reader connection before opening a
+# temporary one (streams that are not consumed hold their reader)
+READER_WAIT_TIMEOUT = 0.1
+
+# Toggle journal (src/services/journal.py): the TUI appends each start and
+# stop to this file, fsync'd, and a background thread batches them into
+# the database. Put it on a local disk when the database is on a network
+# share. Set JOURNAL_ENABLED = False to write toggles straight to SQLite.
+JOURNAL_ENABLED = True
+JOURNAL_PATH = DATA_DIR / "timetracker.journal"
+JOURNAL_FLUSH_DELAY = 0.25  # seconds to gather a burst of toggles into one commit
+JOURNAL_RETRY_INTERVAL = 5.0  # seconds between flushes while the database fails
+JOURNAL_POLL_INTERVAL = 2.0  # seconds between checks for other processes' toggles
+
+# Optional background daemon (src/daemon.py): Unix socket it listens on,
+# and how long the CLI waits for a reply before giving up
+SOCKET_PATH = DATA_DIR / "timetracker.sock"
+DAEMON_TIMEOUT = 2.0  # seconds
+
+# Bulk import (src/services/import_service.py): rows written per
+# executemany batch, and the import size from which indexes are dropped
+# during the insert and rebuilt once afterwards
+IMPORT_BATCH_SIZE = 50_000
+IMPORT_DEFER_INDEXES_ROWS = 10_000
+
+# Export (src/services/export_service.py): rows per columnar chunk or
+# Parquet row group, also used as the database fetch size
+EXPORT_CHUNK_ROWS = 10_000
@@ -1,5 +1,10 @@
 """Time calculation and formatting utilities."""
 
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from datetime import date
+
 
 def format_elapsed_time(seconds: int) -> str:
     """
@@ -67,3 +72,80 @@ def format_datetime_full(timestamp: int) -> str:
     from datetime import datetime
     dt = datetime.fromtimestamp(timestamp)
     return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def local_midnight(day: 'date') -> int:
+    """Return the Unix timestamp of local midnight at the start of a date."""
+    from datetime import datetime
+    return int(datetime(day.year, day.month, day.day).timestamp())
+
+
+def local_day_boundaries(first: int, last: int) -> List[int]:
+    """
+    List the local midnights covering a time range.
+
+    Days are not assumed to be 86400 seconds long, so the boundaries stay
+    correct across DST changes.
+
+    Args:
+        first: Unix timestamp at the start of the range
+        last: Unix timestamp at the end of the range
+
+    Returns:
+        Ascending local-midnight timestamps, from the midnight starting
+        first's day through the midnight after last's day
+    """
+    from datetime import datetime, timedelta
+    day = datetime.fromtimestamp(first).date()
+    end = datetime.fromtimestamp(last).date() + timedelta(days=1)
+
+    boundaries = []
+    while day <= end:
+        boundaries.append(int(datetime(day.year, day.month, day.day).timestamp()))
+        day += timedelta(days=1)
+    return boundaries
+
+
+def split_by_local_day(start: int, stop: int) -> List[Tuple[str, int]]:
+    """
+    Split a time range at local midnights.
+
+    Args:
+        start: Unix timestamp at the start of the range
+        stop: Unix timestamp at the end of the range
+
+    Returns:
+        List of (ISO date, seconds) pairs for each local day the range
+        covers, in order; empty when stop <= start
+    """
+    from datetime import datetime
+    pieces = []
+    boundaries = local_day_boundaries(start, stop)
+    for day_start, day_end in zip(boundaries, boundaries[1:]):
+        seconds = min(stop, day_end) - max(start, day_start)
+        if seconds > 0:
+            day = datetime.fromtimestamp(day_start).date().isoformat()
+            pieces.append((day, seconds))
+    return pieces
+
+
+def bucket_key(day: str, bucket: str) -> str:
+    """
+    Map an ISO date to the key of the report bucket containing it.
+
+    Args:
+        day: ISO date string (YYYY-MM-DD)
+        bucket: 'day', 'week' (weeks start on Monday) or 'month'
+
+    Returns:
+        The day itself, the ISO date of the week's Monday, or YYYY-MM
+    """
+    from datetime import date, timedelta
+    if bucket == 'day':
+        return day
+    if bucket == 'week':
+        d = date.fromisoformat(day)
+        return (d - timedelta(days=d.weekday())).isoformat()
+    if bucket == 'month':
+        return day[:7]
+    raise ValueError(f"Unknown bucket: {bucket}")